@@ -1,15 +1,59 @@
 import sys
 import os
-import csv
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-sys.path.insert(
-    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils"))
-)
-from config_helper import load_config
+# Gestion intelligente des imports pour tous contextes d'exécution
+# (mêmes modules que la GUI : un seul cache partagé par singleton)
+try:
+    from scripts.utils.config_helper import load_config
+    from scripts.utils.package_walker import list_aircraft_cfgs
+    from scripts.utils.log_helper import get_logger, configure_logging
+    from scripts.utils.scan_cache import ScanCache, file_fingerprint
+    from scripts.utils.airline_registry import AIRLINE_CALLSIGN_CSV_PATH, load_airline_registry
+    from scripts.utils.filter_rules import scan_filters
+    from scripts.utils.registration import registration_normalizer
+    from scripts.utils.aircraft_types import aircraft_type_classifier
+    from scripts.utils.thumbnail_cache import THUMBNAILS_DIR, ThumbnailCache
+except ImportError:
+    sys.path.insert(
+        0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils"))
+    )
+    from config_helper import load_config
+    from package_walker import list_aircraft_cfgs
+    from log_helper import get_logger, configure_logging
+    from scan_cache import ScanCache, file_fingerprint
+    from airline_registry import AIRLINE_CALLSIGN_CSV_PATH, load_airline_registry
+    from filter_rules import scan_filters
+    from registration import registration_normalizer
+    from aircraft_types import aircraft_type_classifier
+    from thumbnail_cache import THUMBNAILS_DIR, ThumbnailCache
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 RESULTS_DIR = os.path.join(BASE_DIR, "results")
+# Cache incrémental : résultat du parsing par aircraft.cfg, invalidé par mtime/taille
+AIRCRAFT_SCAN_CACHE_PATH = os.path.join(RESULTS_DIR, "aircraft_scan_cache.json")
+AIRCRAFT_SCAN_CACHE_VERSION = 3
+# Threads de parsing des aircraft.cfg : configurable via "scan_workers" dans config/paths.json
+DEFAULT_SCAN_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+# Clés lues dans chaque section [FLTSIM.N] d'un aircraft.cfg
+FLTSIM_KEYS = (
+    "atc_id",
+    "atc_airline",
+    "icao_airline",
+    "title",
+    "atc_flight_number",
+    "texture",
+    "ui_type",
+    "ui_variation",
+)
+FLTSIM_SECTION_RE = re.compile(r"^\[\s*fltsim\.(\d+)\s*\]", re.IGNORECASE)
+# Clés de type lues dans la section [GENERAL], communes à toutes les livrées du cfg
+GENERAL_KEYS = ("icao_type_designator", "icao_model")
+GENERAL_SECTION_RE = re.compile(r"^\[\s*general\s*\]", re.IGNORECASE)
+
+logger = get_logger("aircraft_scanner")
 
 
 def guess_engine_type(folder_name):
@@ -22,206 +66,363 @@ def guess_engine_type(folder_name):
         return "UNKNOWN"
 
 
-def parse_aircraft_cfg(cfg_path):
-    registration = ""
-    company = ""
-    icao = ""
-    model = ""
-    callsign = ""
+def _cfg_value(raw):
+    """Valeur d'une ligne cfg : entre guillemets si présents, sinon avant un commentaire ';'."""
+    raw = raw.strip()
+    if raw.startswith('"'):
+        closing = raw.find('"', 1)
+        return raw[1:closing] if closing > 0 else raw[1:]
+    return raw.split(";", 1)[0].strip().strip('"')
+
+
+def iter_fltsim_sections(cfg_path, general=None):
+    """
+    Lit un aircraft.cfg ligne à ligne et génère un dict par section [FLTSIM.N]
+    ({"fltsim": N, atc_id, atc_airline, ...} pour les clés de FLTSIM_KEYS présentes).
+    Si general (dict) est fourni, il reçoit les GENERAL_KEYS de la section [GENERAL].
+    La lecture s'arrête à la première section, hors [GENERAL], qui suit le dernier
+    bloc FLTSIM : la suite du fichier (moteurs, modèle de vol...) n'est jamais lue.
+    """
+    record = None
+    in_general = False
+    seen_fltsim = False
     with open(cfg_path, "r", encoding="utf-8", errors="ignore") as f:
-        lines = f.readlines()
-    in_flight_sim = False
-    for line in lines:
-        if line.strip().lower().startswith("[fltsim.0]"):
-            in_flight_sim = True
-        elif in_flight_sim:
-            if "=" not in line:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("["):
+                if record is not None:
+                    yield record
+                    record = None
+                match = FLTSIM_SECTION_RE.match(stripped)
+                in_general = bool(GENERAL_SECTION_RE.match(stripped))
+                if match:
+                    record = {"fltsim": int(match.group(1))}
+                    seen_fltsim = True
+                elif seen_fltsim and not (in_general and general is not None):
+                    return
+                continue
+            if "=" not in stripped or stripped.startswith(";"):
                 continue
-            key, value = line.split("=", 1)
+            if record is None and not (in_general and general is not None):
+                continue
+            key, value = stripped.split("=", 1)
             key = key.strip().lower()
-            value = value.strip().strip('"')
-            if key == "atc_id":
-                registration = value
-            elif key == "atc_airline":
-                company = value
-            elif key == "icao_airline":
-                icao = value
-            elif key == "title":
-                if "A319" in value.upper():
-                    model = "A319"
-                elif "A320" in value.upper():
-                    model = "A320"
-                elif "A321" in value.upper():
-                    model = "A321"
-            elif key == "atc_flight_number":
-                callsign = value
-    return registration, company, icao, model, callsign
-
-
-def load_callsign_dict(csv_path):
-    callsign_dict = {}
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Stocke par ICAO (toujours en majuscule)
-            icao = row.get("ICAO", "").upper()
-            if icao:
-                callsign_dict[icao] = {
-                    "callsign": row.get("Callsign", "").title(),
-                    "company": row.get("Companyname", ""),
-                    "iata": row.get("IATA", ""),
-                }
-    return callsign_dict
-
-
-def normalize_registration(registration, company, icao_code):
-    # Correction spéciale Aegean "SXDDNH" => "SX-DNH"
-    if registration:
-        reg = registration.upper().replace("-", "")
-        if reg.startswith("SXD") and len(reg) == 6:
-            return "SX-" + reg[3:]
-        if reg.startswith("SX") and len(reg) == 5:
-            return "SX-" + reg[2:]
-    return registration
-
-
-def get_callsign_for_company(company, icao, airline_callsign_map):
-    company_clean = (company or "").strip().lower()
-    icao_clean = (icao or "").strip().upper()
-    for entry in airline_callsign_map:
-        if entry["ICAO"].upper() == icao_clean:
-            return entry["Callsign"]
-    for entry in airline_callsign_map:
-        if entry["Companyname"].lower() == company_clean:
-            return entry["Callsign"]
+            if record is not None and key in FLTSIM_KEYS:
+                record[key] = _cfg_value(value)
+            elif record is None and key in GENERAL_KEYS:
+                general[key] = _cfg_value(value)
+    if record is not None:
+        yield record
+
+
+def guess_model(title):
+    title = (title or "").upper()
+    for model in ("A319", "A320", "A321"):
+        if model in title:
+            return model
+    return ""
+
+
+def parse_aircraft_cfg(cfg_path):
+    """
+    Une livrée par section [FLTSIM.N] du cfg (liste de dicts, sérialisable en JSON).
+    Fichier illisible ou disparu : warning et None.
+    """
+    liveries = []
+    general = {}
+    try:
+        sections = list(iter_fltsim_sections(cfg_path, general=general))
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning("aircraft.cfg illisible, ignoré : %s (%s)", cfg_path, e)
+        return None
+    for section in sections:
+        liveries.append(
+            {
+                "fltsim": section["fltsim"],
+                "registration": section.get("atc_id", ""),
+                "company": section.get("atc_airline", ""),
+                "icao": section.get("icao_airline", ""),
+                "model": guess_model(section.get("title", "")),
+                "callsign": section.get("atc_flight_number", ""),
+                "title": section.get("title", ""),
+                "texture": section.get("texture", ""),
+                "ui_type": section.get("ui_type", ""),
+                "ui_variation": section.get("ui_variation", ""),
+            }
+        )
+    # [GENERAL] peut suivre les FLTSIM : complété une fois le fichier lu
+    for livery in liveries:
+        for key in GENERAL_KEYS:
+            livery[key] = general.get(key, "")
+    return liveries
+
+
+def get_callsign_for_company(company, icao, airlines):
+    """Callsign CSV de la compagnie : par ICAO, sinon par nom (registre indexé)."""
+    airline = airlines.by_icao(icao) or airlines.by_company(company)
+    if airline and airline["callsign"]:
+        return airline["callsign"]
     return None
 
 
 def is_fenix_stock_livery(entry):
     """
-    Renvoie True si cette entrée correspond à une livrée 'maison' Fenix à exclure.
-    On identifie :
-        - Company == "Fenix" ou "Unknown" ou "Default" ou "Asobo" ou "FBW"
-        - Registration dans la liste des stocks connus
-        - Le chemin contient fnx-aircraft-319-321 (ou variantes), sans -liveries
-    """
-    stock_registrations = {
-        "G-FBIG",
-        "G-FENX",
-        "G-SMOL",
-        "G-FENY",
-        "G-FENZ",
-        "G-FENW",
-        "OE-LWF",
-        # Ajoute d'autres si tu veux être exhaustif sur les registrations maison Phoenix
-    }
-    stock_companies = {"fenix", "asobo", "fbw", "unknown", "default"}
-    registration = (entry.get("registration") or "").upper()
-    company = (entry.get("company") or "").lower()
-    path = (entry.get("path") or "").replace("\\", "/").lower()
-    # Exclusion stricte sur le dossier
-    if "fnx-aircraft-319-321" in path and "-liveries" not in path:
-        return True
-    # Exclusion stricte sur company
-    if company in stock_companies:
-        return True
-    # Exclusion stricte sur registration
-    if registration in stock_registrations:
-        return True
-    # Exclusion si modèle mais pas de compagnie, registration ou path douteux
-    return False
-
-
-def scan_all_aircraft(community_path):
-    blacklist = [
-        "fsltl",
-        "aig-",
-        "ivao-",
-        "traffic",
-        "ai-",
-        "bgl",
-        "statics",
-        "simple aircraft",
-        "justflight-traffic",
-    ]
-    strict_blacklist = [
-        "fnx-aircraft-319",
-        "fnx-aircraft-320",
-        "fnx-aircraft-321",
-    ]
-    callsign_csv = os.path.join("data", "airline_callsign_full.csv")
-    callsign_dict = load_callsign_dict(callsign_csv)
+    Code raison si cette entrée est une livrée 'maison' à exclure (Fenix, Asobo, FBW...),
+    sinon None. Règles "livery" de data/scan_filters.json : chemin, compagnie, registration.
+    """
+    return scan_filters().match(
+        "livery",
+        path=entry.get("path"),
+        company=entry.get("company"),
+        registration=entry.get("registration"),
+    )
 
-    results = []
-    for item in os.listdir(community_path):
-        lower_item = item.lower()
-        if lower_item in strict_blacklist or any(kw in lower_item for kw in blacklist):
-            print(f"[EXCLU] {item} (blacklist)")
+
+def is_blacklisted_package(item):
+    """Code raison si le package est exclu du scan avions (trafic IA, base Fenix...), sinon None."""
+    return scan_filters().match("aircraft", folder=item)
+
+
+def list_root_aircraft_cfgs(root, use_layout=True):
+    """aircraft.cfg des packages d'un dossier racine, hors blacklist : (cfgs, nb exclus)."""
+    cfgs = []
+    excluded = 0
+    if not root or not os.path.isdir(root):
+        logger.warning("Dossier introuvable : %s", root)
+        return cfgs, excluded
+    for item in os.listdir(root):
+        reason = is_blacklisted_package(item)
+        if reason:
+            logger.debug("[EXCLU] %s (%s)", item, reason)
+            excluded += 1
             continue
-        addon_path = os.path.join(community_path, item)
+        addon_path = os.path.join(root, item)
         if not os.path.isdir(addon_path):
             continue
-        simobj_base = os.path.join(addon_path, "SimObjects", "Airplanes")
-        if not os.path.isdir(simobj_base):
+        # layout.json en priorité (un seul fichier lu), sinon listage SimObjects/Airplanes
+        cfgs.extend(list_aircraft_cfgs(addon_path, use_layout=use_layout))
+    return cfgs, excluded
+
+
+def parse_aircraft_cfgs(cfg_paths, cache=None, workers=1):
+    """
+    Livrées de chaque cfg (même ordre que cfg_paths).
+    Cache consulté d'abord ; seuls les cfg nouveaux/modifiés sont parsés (pool borné).
+    """
+    parsed = [None] * len(cfg_paths)
+    fingerprints = [None] * len(cfg_paths)
+    if cache is not None:
+        for i, cfg in enumerate(cfg_paths):
+            fingerprints[i] = file_fingerprint(cfg)
+            hit, cached = cache.get(cfg, fingerprints[i])
+            if hit:
+                parsed[i] = cached
+    to_parse = [i for i, liveries in enumerate(parsed) if liveries is None]
+    if workers and workers > 1 and len(to_parse) > 1:
+        # pool.map conserve l'ordre => sortie déterministe
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(parse_aircraft_cfg, [cfg_paths[i] for i in to_parse]))
+    else:
+        fresh = [parse_aircraft_cfg(cfg_paths[i]) for i in to_parse]
+    for i, liveries in zip(to_parse, fresh):
+        if liveries is None:
+            # Illisible : aucune livrée, et rien en cache (relu au prochain scan)
+            parsed[i] = []
             continue
-        for livery_folder in os.listdir(simobj_base):
-            livery_path = os.path.join(simobj_base, livery_folder)
-            if not os.path.isdir(livery_path):
-                continue
-            aircraft_cfg = os.path.join(livery_path, "aircraft.cfg")
-            if not os.path.isfile(aircraft_cfg):
-                continue
-            registration, company, icao, model, callsign = parse_aircraft_cfg(
-                aircraft_cfg
+        parsed[i] = liveries
+        if cache is not None:
+            cache.put(cfg_paths[i], fingerprints[i], liveries)
+    return parsed
+
+
+def build_livery_entries(aircraft_cfg, liveries, airlines, types=None):
+    """
+    Entrées de résultat d'un aircraft.cfg : une par section [FLTSIM.N], taguées
+    avec le code OACI du type (icao_type) ; model devient le nom du type s'il est connu.
+    """
+    if types is None:
+        types = aircraft_type_classifier()
+    livery_path = os.path.dirname(aircraft_cfg)
+    livery_folder = os.path.basename(livery_path)
+    engine_type = guess_engine_type(livery_folder)
+    entries = []
+    for livery in liveries:
+        icao = livery["icao"]
+        callsign = livery["callsign"]
+        livery_engine = engine_type
+        if livery_engine == "UNKNOWN":
+            livery_engine = guess_engine_type(
+                f"{livery['ui_variation']} {livery['texture']}"
             )
-            engine_type = guess_engine_type(livery_folder)
-            entry = {
-                "model": model,
-                "registration": registration,
-                "company": company if company else "UNKNOWN",
-                "icao": icao if icao else "UNKNOWN",
-                "engine_type": engine_type,
-                "path": livery_path,
-            }
-            # Ajoute callsign et remplit les infos compagnie depuis le CSV si possible
-            if icao and icao.upper() in callsign_dict:
-                cdata = callsign_dict[icao.upper()]
-                entry["company"] = cdata["company"]
-                entry["icao"] = icao.upper()
-                entry["iata"] = cdata["iata"]
-                entry["callsign"] = cdata["callsign"]
-            elif callsign:
-                entry["callsign"] = callsign
-            results.append(entry)
-    # -- Patch registration/callsign via CSV --
-    airline_callsign_path = "data/airline_callsign_full.csv"
-    airline_callsign_map = []
-    with open(airline_callsign_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        airline_callsign_map = sorted(
-            [row for row in reader], key=lambda x: x["Companyname"]
+        icao_type = types.classify(
+            icao_type_designator=livery.get("icao_type_designator"),
+            icao_model=livery.get("icao_model"),
+            ui_type=livery.get("ui_type"),
+            ui_variation=livery["ui_variation"],
+            title=livery["title"],
         )
+        entry = {
+            "model": types.model_name(icao_type) if icao_type else livery["model"],
+            "icao_type": icao_type or "",
+            "registration": livery["registration"],
+            "company": livery["company"] if livery["company"] else "UNKNOWN",
+            "icao": icao if icao else "UNKNOWN",
+            "engine_type": livery_engine,
+            "path": livery_path,
+            "fltsim": livery["fltsim"],
+            "title": livery["title"],
+            "texture": livery["texture"],
+        }
+        # Ajoute callsign et remplit les infos compagnie depuis le CSV si possible
+        airline = airlines.by_icao(icao) if icao else None
+        if airline:
+            entry["company"] = airline["company"]
+            entry["icao"] = icao.upper()
+            entry["iata"] = airline["iata"]
+            entry["callsign"] = airline["callsign"].title()
+        elif callsign:
+            entry["callsign"] = callsign
+        entries.append(entry)
+    return entries
+
+
+def package_relative_path(path, roots=()):
+    """
+    Chemin normalisé relatif au dossier racine qui contient path : le même package
+    trouvé sous deux racines (Community et OneStore...) donne le même chemin.
+    """
+    path = os.path.normcase(os.path.normpath(path or ""))
+    for root in roots:
+        root = os.path.normcase(os.path.normpath(root))
+        if path.startswith(root + os.sep):
+            return path[len(root) + 1 :]
+    return path
+
+
+def finalize_aircraft_results(results, airlines, excluded=0, roots=()):
+    """
+    Normalisation registration/callsign, puis exclusion des doublons et livrées de base.
+    Doublon = même registration, même chemin relatif à la racine et même section
+    [FLTSIM.N] ; une livrée sans registration n'est jamais fusionnée.
+    """
+    # -- Patch registration/callsign via CSV --
+    registrations = registration_normalizer(refresh=True)
     for entry in results:
         reg = entry.get("registration")
         company = entry.get("company")
         icao = entry.get("icao")
-        # Patch registration (ex: SX-DNH pour Aegean, etc.)
-        entry["registration"] = normalize_registration(reg, company, icao)
+        # Patch registration par marque de nationalité (FGKXS -> F-GKXS, SXDNH -> SX-DNH)
+        entry["registration"] = registrations.normalize(reg)
         # Patch callsign (CSV prioritaire)
-        callsign_csv = get_callsign_for_company(company, icao, airline_callsign_map)
-        if callsign_csv:
-            entry["callsign"] = callsign_csv
+        airline_callsign = get_callsign_for_company(company, icao, airlines)
+        if airline_callsign:
+            entry["callsign"] = airline_callsign
 
-    # -- Exclusion des livrées Fenix de base --
+    # -- Exclusion des livrées Fenix de base et des doublons entre racines --
     results_clean = []
+    stock = 0
+    seen = set()
     for entry in results:
-        if is_fenix_stock_livery(entry):
-            print(f"[EXCLU][STOCK] {entry.get('registration')} / {entry.get('path')}")
+        registration = (entry.get("registration") or "").upper()
+        if registration:
+            key = (
+                registration,
+                package_relative_path(entry.get("path"), roots),
+                entry.get("fltsim"),
+            )
+            if key in seen:
+                logger.debug(
+                    "[DOUBLON] %s / %s", entry.get("registration"), entry.get("path")
+                )
+                continue
+            seen.add(key)
+        reason = is_fenix_stock_livery(entry)
+        if reason:
+            logger.debug(
+                "[EXCLU][%s] %s / %s",
+                reason,
+                entry.get("registration"),
+                entry.get("path"),
+            )
+            stock += 1
             continue
         results_clean.append(entry)
+    logger.info(
+        "%d livrée(s) retenue(s), %d dossier(s) exclu(s) (blacklist), %d livrée(s) de base exclue(s)",
+        len(results_clean),
+        excluded,
+        stock,
+    )
     return results_clean
 
 
+def log_aircraft_cache(cache, seen_cfgs):
+    removed = cache.prune(seen_cfgs)
+    cache.save()
+    logger.info(
+        "Cache : %d aircraft.cfg inchangé(s), %d analysé(s), %d retiré(s)",
+        cache.hits,
+        cache.misses,
+        removed,
+    )
+
+
+def scan_all_aircraft(
+    roots,
+    use_layout=True,
+    cache_path=AIRCRAFT_SCAN_CACHE_PATH,
+    callsign_csv=AIRLINE_CALLSIGN_CSV_PATH,
+    workers=DEFAULT_SCAN_WORKERS,
+    thumbnails_dir=None,
+):
+    """
+    Scanne les livrées de un ou plusieurs dossiers racine (Community, OneStore,
+    StreamedPackages) ; un package présent sous deux racines n'est gardé qu'une fois.
+    Les miniatures carte de vol sont mises à jour dans thumbnails_dir si fourni
+    (la GUI les gère ; en CLI, "scan_thumbnails": true dans config/paths.json).
+    """
+    # Registre compagnies partagé (chargé une fois, index ICAO/IATA/callsign/nom)
+    airlines = load_airline_registry(callsign_csv)
+    types = aircraft_type_classifier(refresh=True)
+    # Règles d'exclusion relues si data/scan_filters.json a changé
+    scan_filters(refresh=True)
+
+    cache = None
+    if cache_path:
+        cache = ScanCache(
+            cache_path, context={"version": AIRCRAFT_SCAN_CACHE_VERSION}
+        )
+
+    # 1. Un thread par dossier racine (Community, OneStore, Streamed) pour lister les cfg
+    if isinstance(roots, str):
+        roots = [roots]
+    roots = [root for root in roots if root]
+    with ThreadPoolExecutor(max_workers=max(1, len(roots))) as pool:
+        listed = list(
+            pool.map(
+                lambda root: list_root_aircraft_cfgs(root, use_layout=use_layout),
+                roots,
+            )
+        )
+    cfg_paths = [cfg for cfgs, _ in listed for cfg in cfgs]
+    excluded = sum(count for _, count in listed)
+
+    # 2. Parsing (cache + pool borné), puis une entrée par livrée
+    parsed = parse_aircraft_cfgs(cfg_paths, cache=cache, workers=workers)
+    results = []
+    for aircraft_cfg, liveries in zip(cfg_paths, parsed):
+        results.extend(build_livery_entries(aircraft_cfg, liveries, airlines, types))
+    if cache is not None:
+        log_aircraft_cache(cache, cfg_paths)
+
+    aircraft = finalize_aircraft_results(
+        results, airlines, excluded=excluded, roots=roots
+    )
+    if thumbnails_dir:
+        ThumbnailCache(thumbnails_dir).update(aircraft)
+    return aircraft
+
+
 def save_results(results, filename):
     os.makedirs(RESULTS_DIR, exist_ok=True)
     with open(os.path.join(RESULTS_DIR, filename), "w", encoding="utf-8") as f:
@@ -230,12 +431,27 @@ def save_results(results, filename):
 
 if __name__ == "__main__":
     config = load_config()
-    community_path = config.get("community_dir", "")
-    if not community_path or not os.path.isdir(community_path):
-        print("[ERREUR] Chemin Community non défini ou invalide dans la config !")
+    configure_logging(config.get("log_level"))
+    roots = [
+        config.get("community_dir", ""),
+        config.get("official_onestore_dir", ""),
+        config.get("streamedpackages_dir", ""),
+    ]
+    roots = [p for p in roots if p and os.path.isdir(p)]
+    if not roots:
+        logger.error("Aucun dossier Community/OneStore/Streamed valide dans la config !")
         sys.exit(1)
-    results = scan_all_aircraft(community_path)
+    results = scan_all_aircraft(
+        roots,
+        use_layout=bool(config.get("scan_use_layout", True)),
+        workers=int(config.get("scan_workers", DEFAULT_SCAN_WORKERS)),
+        thumbnails_dir=THUMBNAILS_DIR if config.get("scan_thumbnails") else None,
+    )
     save_results(results, "aircraft_scanresults.json")
-    print("[Scanner] Fichier JSON généré avec succès : aircraft_scanresults.json")
-    print()
-    print("[INFO] Avions scannés dans tous les dossiers Community (A319/A320/A321)")
+    logger.info("Fichier JSON généré avec succès : aircraft_scanresults.json")
+    logger.info(
+        "%d avion(s) de %d type(s) scanné(s) dans %d dossier(s) racine",
+        len(results),
+        len({a["icao_type"] for a in results if a.get("icao_type")}),
+        len(roots),
+    )
@@ -2,19 +2,48 @@ import sys
 import os
 import json
 import re
-import csv
+from concurrent.futures import ThreadPoolExecutor
 
 # Gestion intelligente des imports pour tous contextes d'exécution
 try:
     from scripts.utils.config_helper import load_config
+    from scripts.utils.scan_cache import ScanCache, file_fingerprint, package_fingerprint
+    from scripts.utils.icao_matcher import IcaoMatcher, as_icao_matcher
+    from scripts.utils.bgl_reader import read_bgl_airport_idents
+    from scripts.utils.package_walker import scan_package, build_package_inventory
+    from scripts.utils.scan_stats import ScanStats
+    from scripts.utils.log_helper import get_logger, configure_logging
+    from scripts.utils.custom_mapping import CustomMappingFile, as_custom_mapping
+    from scripts.utils.airport_db import load_airport_db
+    from scripts.utils.filter_rules import scan_filters
 except ImportError:
     sys.path.insert(
         0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils"))
     )
     try:
         from config_helper import load_config
+        from scan_cache import ScanCache, file_fingerprint, package_fingerprint
+        from icao_matcher import IcaoMatcher, as_icao_matcher
+        from bgl_reader import read_bgl_airport_idents
+        from package_walker import scan_package, build_package_inventory
+        from scan_stats import ScanStats
+        from log_helper import get_logger, configure_logging
+        from custom_mapping import CustomMappingFile, as_custom_mapping
+        from airport_db import load_airport_db
+        from filter_rules import scan_filters
     except ImportError:
         from ..utils.config_helper import load_config
+        from ..utils.scan_cache import ScanCache, file_fingerprint, package_fingerprint
+        from ..utils.icao_matcher import IcaoMatcher, as_icao_matcher
+        from ..utils.bgl_reader import read_bgl_airport_idents
+        from ..utils.package_walker import scan_package, build_package_inventory
+        from ..utils.scan_stats import ScanStats
+        from ..utils.log_helper import get_logger, configure_logging
+        from ..utils.custom_mapping import CustomMappingFile, as_custom_mapping
+        from ..utils.airport_db import load_airport_db
+        from ..utils.filter_rules import scan_filters
+
+logger = get_logger("airport_scanner")
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 RESULTS_DIR = os.path.join(BASE_DIR, "results")
@@ -23,12 +52,13 @@ CSV_PATH = os.path.abspath(os.path.join(BASE_DIR, "data", "airports.csv"))
 CUSTOM_AIRPORT_MAP_PATH = os.path.abspath(
     os.path.join(BASE_DIR, "data", "custom_airport_mapping.json")
 )
-try:
-    with open(CUSTOM_AIRPORT_MAP_PATH, "r", encoding="utf-8") as f:
-        CUSTOM_AIRPORT_MAPPING = json.load(f)
-except Exception:
-    CUSTOM_AIRPORT_MAPPING = []
-    print(f"[WARN] Fichier de mapping custom non trouvé : {CUSTOM_AIRPORT_MAP_PATH}")
+# Cache incrémental : un résultat par dossier package, invalidé par empreinte
+AIRPORT_SCAN_CACHE_PATH = os.path.join(RESULTS_DIR, "airport_scan_cache.json")
+AIRPORT_SCAN_CACHE_VERSION = 2
+# Threads de résolution (I/O disque) : configurable via "scan_workers" dans config/paths.json
+DEFAULT_SCAN_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+# Compilé au chargement, recompilé par scan_airports si le fichier a changé
+CUSTOM_AIRPORT_MAPPING = CustomMappingFile(CUSTOM_AIRPORT_MAP_PATH)
 
 
 def extract_icao_from_folder_or_name(folder_name):
@@ -55,14 +85,14 @@ def extract_airport_info(manifest_path, icao_official):
     name = None
 
     if not os.path.exists(manifest_path):
-        print(f"[DEBUG] Manifest absent : {manifest_path}")
+        logger.debug("Manifest absent : %s", manifest_path)
         return None, None
 
     try:
         with open(manifest_path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception as e:
-        print(f"[DEBUG] Erreur lecture manifest {manifest_path}: {e}")
+        logger.debug("Erreur lecture manifest %s: %s", manifest_path, e)
         return None, None
 
     # 1. Recherche ICAO dans les champs classiques (standard)
@@ -70,24 +100,28 @@ def extract_airport_info(manifest_path, icao_official):
 
     # 2. Fallback: mapping custom (whitelist)
     if not found_icao:
-        print(f"[DEBUG] Tentative mapping custom pour manifest: {manifest_path}")
-        print(f"[DEBUG] Data manifest: {data}")
+        logger.debug("Tentative mapping custom pour manifest: %s", manifest_path)
+        logger.debug("Data manifest: %s", data)
         if "creator" in data and "title" in data:
-            print(
-                f"[DEBUG] mapping custom: call avec creator={data['creator']} / title={data['title']}"
+            logger.debug(
+                "mapping custom: call avec creator=%s / title=%s",
+                data["creator"],
+                data["title"],
             )
-            custom_icao = match_custom_mapping(data, CUSTOM_AIRPORT_MAPPING)
+            custom_icao = match_custom_mapping(data, CUSTOM_AIRPORT_MAPPING.mapping)
             if custom_icao:
-                print(f"[DEBUG] [CUSTOM MATCH] ICAO forcé par mapping: {custom_icao}")
+                logger.debug("[CUSTOM MATCH] ICAO forcé par mapping: %s", custom_icao)
                 found_icao = custom_icao
                 name = data.get("title", "")
             else:
-                print(
-                    f"[DEBUG] Aucun match mapping custom pour creator={data['creator']} / title={data['title']}"
+                logger.debug(
+                    "Aucun match mapping custom pour creator=%s / title=%s",
+                    data["creator"],
+                    data["title"],
                 )
         else:
-            print(
-                "[DEBUG] Champ 'creator' ou 'title' manquant dans le manifest, mapping custom ignoré."
+            logger.debug(
+                "Champ 'creator' ou 'title' manquant dans le manifest, mapping custom ignoré."
             )
 
     # 3. Fallback: Pattern ICAO dans le nom de fichier (ex: "airport-XXXX")
@@ -102,8 +136,9 @@ def extract_airport_info(manifest_path, icao_official):
         for candidate in matches:
             if candidate.upper() in icao_official:
                 found_icao = candidate.upper()
-                print(
-                    f"[DEBUG] ICAO extrait via pattern 'airport-XXXX' ou nom dossier : {found_icao}"
+                logger.debug(
+                    "ICAO extrait via pattern 'airport-XXXX' ou nom dossier : %s",
+                    found_icao,
                 )
                 name = data.get("title", "") or base_name
                 break
@@ -113,60 +148,34 @@ def extract_airport_info(manifest_path, icao_official):
         base_name = os.path.basename(os.path.dirname(manifest_path))
         if len(base_name) == 4 and base_name.upper() in icao_official:
             found_icao = base_name.upper()
-            print(f"[DEBUG] ICAO trouvé via nom de dossier simple : {found_icao}")
+            logger.debug("ICAO trouvé via nom de dossier simple : %s", found_icao)
             name = data.get("title", "") or base_name
 
     if found_icao:
-        print(f"[DEBUG] ICAO FINAL retenu : {found_icao} pour {manifest_path}")
+        logger.debug("ICAO FINAL retenu : %s pour %s", found_icao, manifest_path)
 
     return found_icao, name
 
 def load_icao_dict_from_csv(csv_path):
-    icao_dict = {}
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=",", quotechar='"')
-        for row in reader:
-            icao = row["icao"].strip().upper()
-            name = row["name"].strip()
-            city = row["city"].strip()
-            country = row["country"].strip()
-            lat = row["latitude"].strip()
-            lon = row["longitude"].strip()
-            # Sécurise la conversion float
-            try:
-                lat = float(lat)
-            except Exception:
-                lat = None
-            try:
-                lon = float(lon)
-            except Exception:
-                lon = None
-            icao_dict[icao] = {
-                "name": name,
-                "city": city,
-                "country": country,
-                "latitude": lat,
-                "longitude": lon,
-            }
-    return icao_dict
+    """
+    Base aéroports ICAO -> {name, city, country, latitude, longitude, ...}.
+    Lue depuis la base binaire compilée (recompilée si le CSV a changé) ;
+    s'utilise comme un dict en lecture.
+    """
+    return load_airport_db(csv_path)
 
 def match_custom_mapping(data, mapping_list):
-    creator = str(data.get("creator", "")).strip().lower()
-    title = str(data.get("title", "")).strip().lower()
-    print(f"[CUSTOM MATCH] manifest: creator='{creator}', title='{title}'")
-    for entry in mapping_list:
-        map_creator = entry.get("creator", "").strip().lower()
-        map_title = entry.get("title", "").strip().lower()
-        map_icao = entry.get("icao", "").strip().upper()
-        print(
-            f"[CUSTOM MATCH TEST] Est-ce que '{map_creator}' in '{creator}' AND '{map_title}' in '{title}' ?"
-        )
-        if map_creator in creator and map_title in title:
-            print(
-                f"[CUSTOM MATCH] -> Match trouvé pour ICAO {map_icao} ({map_creator}/{map_title})"
-            )
-            return map_icao
-    return None
+    """
+    ICAO forcé par le mapping custom pour un manifest (creator/title), ou None.
+    mapping_list : CustomAirportMapping compilé (ou liste brute, compilée à la volée).
+    """
+    creator = data.get("creator", "")
+    title = data.get("title", "")
+    logger.debug("[CUSTOM MATCH] manifest: creator='%s', title='%s'", creator, title)
+    map_icao = as_custom_mapping(mapping_list).match(creator, title)
+    if map_icao is not None:
+        logger.debug("[CUSTOM MATCH] -> Match trouvé pour ICAO %s", map_icao)
+    return map_icao
 
 def extract_airport_info(manifest_path, icao_official=None):
     try:
@@ -184,12 +193,10 @@ def extract_airport_info(manifest_path, icao_official=None):
             ]
             found_icao = None
             if icao_official:
+                # Un seul passage linéaire par champ via l'index ICAO
+                matcher = as_icao_matcher(icao_official)
                 for field in possible_fields:
-                    upper_field = str(field).upper()
-                    for known_icao in icao_official:
-                        if known_icao in upper_field:
-                            found_icao = known_icao
-                            break
+                    found_icao = matcher.find_first(field)
                     if found_icao:
                         break
             # PATCH anti-multicode
@@ -197,7 +204,7 @@ def extract_airport_info(manifest_path, icao_official=None):
                 for field in possible_fields:
                     codes = [c.strip() for c in str(field).upper().split("|")]
                     if len(codes) > 1:
-                        print(f"[DEBUG] Multicode détecté dans {manifest_path}: {codes}")
+                        logger.debug("Multicode détecté dans %s: %s", manifest_path, codes)
                     # Priorité 1 : ICAO présent dans la base officielle
                     valid_icaos = [c for c in codes if c in icao_official]
                     if valid_icaos:
@@ -213,7 +220,7 @@ def extract_airport_info(manifest_path, icao_official=None):
             if found_icao:
                 return found_icao, found_icao
             if not found_icao and "creator" in data and "title" in data:
-                custom_icao = match_custom_mapping(data, CUSTOM_AIRPORT_MAPPING)
+                custom_icao = match_custom_mapping(data, CUSTOM_AIRPORT_MAPPING.mapping)
                 if custom_icao:
                     found_icao = custom_icao
             if found_icao and name:
@@ -225,308 +232,225 @@ def extract_airport_info(manifest_path, icao_official=None):
         pass
     return None, None
 
-def find_icao_in_bgl(folder, icao_official, max_depth=3):
-    import os
-    import re
+def read_content_icao(json_path, icao_official):
+    """
+    Lit un ContentHistory.json / content-info.json et retourne l'ICAO officiel déclaré, ou None.
+    """
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # 1. MSFS2024 PAYWARE/Community: "items" list d’objets (type "airport")
+        if "items" in data and isinstance(data["items"], list):
+            for entry in data["items"]:
+                if entry.get("type", "").lower() == "airport" and "content" in entry:
+                    candidate_icao = entry["content"].strip().upper()
+                    if icao_official and candidate_icao in icao_official:
+                        return candidate_icao
+        # 2. Certains ContentInfo.json => champ direct "content"
+        elif "content" in data:
+            candidate_icao = str(data["content"]).strip().upper()
+            if icao_official and candidate_icao in icao_official:
+                return candidate_icao
+    except Exception as e:
+        logger.debug("Erreur lecture %s: %s", json_path, e)
+    return None
 
-    # RegEx pour détecter toute séquence de 4 lettres/numéros majuscules
-    icao_pattern = re.compile(rb"([A-Z0-9]{4})")
-
-    def scan_dir(current_folder, depth):
-        if depth < 0:
-            return None
-        for root, dirs, files in os.walk(current_folder):
-            for file in files:
-                if file.lower().endswith(".bgl"):
-                    bgl_path = os.path.join(root, file)
-                    try:
-                        with open(bgl_path, "rb") as f:
-                            data = f.read()
-                            for match in icao_pattern.finditer(data):
-                                possible_icao = match.group(1).decode(
-                                    "ascii", errors="ignore"
-                                )
-                                if possible_icao in icao_official:
-                                    print(
-                                        f"[BGL SCAN] ICAO détecté dans {bgl_path}: {possible_icao}"
-                                    )
-                                    return possible_icao
-                    except Exception as e:
-                        print(f"[BGL SCAN] Erreur lecture {bgl_path}: {e}")
-            # Ne pas descendre plus profond que max_depth
-            if depth > 0:
-                for subdir in dirs:
-                    subdir_path = os.path.join(root, subdir)
-                    found = scan_dir(subdir_path, depth - 1)
-                    if found:
-                        return found
-        return None
-
-    return scan_dir(folder, max_depth)
-
-def find_icao_in_content_info(directory, icao_official, max_depth=3):
-    candidates = ["ContentHistory.json", "content_info.json", "contenthistory.json"]
-    for root, dirs, files in os.walk(directory):
-        depth = root[len(directory) :].count(os.sep)
-        if depth > max_depth:
-            dirs[:] = []
-            continue
-        for fname in candidates:
-            if fname in files:
-                try:
-                    test_path = os.path.join(root, fname)
-                    with open(test_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        if "items" in data:
-                            for entry in data["items"]:
-                                if (
-                                    entry.get("type", "").lower() == "airport"
-                                    and "content" in entry
-                                ):
-                                    candidate_icao = entry["content"].strip().upper()
-                                    if (
-                                        icao_official
-                                        and candidate_icao in icao_official
-                                    ):
-                                        return candidate_icao
-                        elif "content" in data:
-                            candidate_icao = str(data["content"]).strip().upper()
-                            if icao_official and candidate_icao in icao_official:
-                                return candidate_icao
-                except Exception as e:
-                    print(f"[DEBUG] Erreur lecture {fname}: {e}")
+def find_icao_in_content_info(directory, icao_official, max_depth=3, inventory=None):
+    if inventory is None:
+        inventory = scan_package(directory, max_depth=max_depth)
+    for json_path in inventory.content_history_files:
+        candidate_icao = read_content_icao(json_path, icao_official)
+        if candidate_icao:
+            return candidate_icao
     return None
 
-def find_icao_in_bgl(directory, icao_official, max_depth=3):
+def find_icao_in_bgl(directory, icao_official, max_depth=3, inventory=None):
     """
-    Recherche récursive d'un ICAO connu dans le nom des fichiers BGL.
-    Prend toujours le plus long match pour éviter "IBI" dans "LEIB".
+    Recherche récursive d'un ICAO connu dans les fichiers BGL.
+    1. Lecture des records Airport via la table des sections (mmap, sans charger le fichier)
+    2. Sinon, nom du fichier : prend toujours le plus long match pour éviter "IBI" dans "LEIB".
     """
-    icao_list = sorted(list(icao_official), key=len, reverse=True)  # plus longs d'abord
-    for root, dirs, files in os.walk(directory):
-        depth = root[len(directory) :].count(os.sep)
-        if depth > max_depth:
-            dirs[:] = []
-            continue
-        for file in files:
-            if file.lower().endswith(".bgl"):
-                upper_file = file.upper()
-                for known_icao in icao_list:
-                    if upper_file.startswith(known_icao):
-                        return known_icao
+    matcher = as_icao_matcher(icao_official)
+    if inventory is None:
+        inventory = scan_package(directory, max_depth=max_depth)
+    for bgl_path in inventory.bgl_files:
+        file = os.path.basename(bgl_path)
+        for ident in read_bgl_airport_idents(bgl_path):
+            if ident in matcher:
+                logger.debug("[BGL SCAN] ICAO détecté dans %s: %s", file, ident)
+                return ident
+        known_icao = matcher.longest_prefix(file)
+        if known_icao:
+            return known_icao
     return None
 
-def scan_airports(directories, csv_path):
-    import os
-    import re
-    import json
+def resolve_airport_package(
+    item, item_path, icao_official, inventory=None, use_layout=True, stats=None
+):
+    """
+    Applique la chaîne de détection ICAO à un dossier package.
+    Le package n'est parcouru qu'une fois (ou pas du tout si layout.json est présent) :
+    l'inventaire est partagé par toutes les stratégies.
+    Chaque stratégie est chronométrée dans stats (appels, hits, temps cumulé).
+    Retourne (found_icao, display_name, manifest_paths).
+    """
+    if stats is None:
+        stats = ScanStats()
+    if inventory is None:
+        # hit = inventaire obtenu depuis layout.json (sans parcours disque)
+        with stats.measure("inventory") as probe:
+            inventory = build_package_inventory(
+                item_path, max_depth=3, use_layout=use_layout
+            )
+            probe.hit = inventory.from_layout
+    manifest_paths = inventory.manifests
 
-    icao_dict = load_icao_dict_from_csv(csv_path)
-    # On force les ICAO CSV en majuscule pour la recherche
-    icao_official = set(k.upper() for k in icao_dict.keys())
-    found_airports = []
-    ignored = []
+    found_icao, display_name = None, None
 
-    keywords_to_ignore = [
-        "landingchallenge",
-        "bushtrip",
-        "training",
-        "wasm",
-        "module",
-        "simobjects",
-        "lib",
-        "library",
-        "liveries",
-        "material",
-        "asset",
-        "model",
-        "texture",
-        "scenery",
-        "mesh",
-        "heliport",
-        "helipad",
-        "animals",
-        "vfx",
-        "aircraft",
-        "passiveaircraft",
-        "travelbook",
-        "base-coverage",
-        "character",
-        "procedural",
-        "materiallib",
-        "vehicle",
-        "passenger",
-        "rally",
-        "lepack",
-        "eventtriggers",
-        "simple scenery",
-        "fsuipc",
-        "gsx",
-        "coverage-map",
-        "lowalt",
-        "precisionlanding",
-        "palettelib",
-        "simattachmentlib",
-        "livingworld",
-        "winwing",
-        "tools-only",
-        "asobo-challenges",
-        "discovery",
-        "ships",
-        "fsltl",
-        "ground",
-        "city",
-    ]
-    icao_regex = re.compile(r"^[A-Z0-9]{4}$")
-    report_ignored = []  # Pour générer le rapport
+    # PATCH : PRIORITÉ ContentInfo/ContentHistory pour Community et AddonLinker
+    with stats.measure("contentinfo") as probe:
+        contentinfo_icao = None
+        for contentinfo_file in inventory.content_info_files:
+            contentinfo_icao = read_content_icao(contentinfo_file, icao_official)
+            if contentinfo_icao:
+                break
+        if contentinfo_icao:
+            found_icao = contentinfo_icao
+            display_name = item
+            probe.hit = True
 
-    for base_dir in directories:
-        print(f"[DEBUG] SCAN DIR: {base_dir}")
-        if not os.path.exists(base_dir):
-            print(f"[Scanner] Dossier introuvable : {base_dir}")
-            continue
-        for item in os.listdir(base_dir):
-            lower_item = item.lower()
-            if any(kw in lower_item for kw in keywords_to_ignore):
-                continue
-            item_path = os.path.join(base_dir, item)
-            if os.path.isdir(item_path):
-                manifest_paths = []
-                main_manifest = os.path.join(item_path, "manifest.json")
-                if os.path.exists(main_manifest):
-                    manifest_paths.append(main_manifest)
-                for subitem in os.listdir(item_path):
-                    subitem_path = os.path.join(item_path, subitem)
-                    if os.path.isdir(subitem_path):
-                        sub_manifest = os.path.join(subitem_path, "manifest.json")
-                        if os.path.exists(sub_manifest):
-                            manifest_paths.append(sub_manifest)
-
-                found_icao, display_name = None, None
-
-                # PATCH : PRIORITÉ ContentInfo/ContentHistory pour Community et AddonLinker
-                contentinfo_icao = None
-                contentinfo_path = os.path.join(item_path, "ContentInfo")
-                if os.path.isdir(contentinfo_path):
-                    for root, dirs, files in os.walk(contentinfo_path):
-                        for file in files:
-                            if file.lower() in [
-                                "contenthistory.json",
-                                "content-info.json",
-                            ]:
-                                contentinfo_file = os.path.join(root, file)
-                                try:
-                                    with open(contentinfo_file, encoding="utf-8") as f:
-                                        data = json.load(f)
-                                        # 1. MSFS2024 PAYWARE/Community: "items" list d’objets (type "airport")
-                                        if "items" in data and isinstance(
-                                            data["items"], list
-                                        ):
-                                            for entry in data["items"]:
-                                                if (
-                                                    entry.get("type", "").lower()
-                                                    == "airport"
-                                                    and "content" in entry
-                                                ):
-                                                    ci_icao = (
-                                                        entry["content"].strip().upper()
-                                                    )
-                                                    if (
-                                                        ci_icao
-                                                        and ci_icao in icao_official
-                                                    ):
-                                                        contentinfo_icao = ci_icao
-                                                        break
-                                        # 2. Certains ContentInfo.json => champ direct "content"
-                                        elif "content" in data:
-                                            ci_icao = (
-                                                str(data["content"]).strip().upper()
-                                            )
-                                            if ci_icao and ci_icao in icao_official:
-                                                contentinfo_icao = ci_icao
-                                except Exception as e:
-                                    print(
-                                        f"[DEBUG] Erreur lecture ContentInfo: {contentinfo_file}: {e}"
-                                    )
-                        if contentinfo_icao:
-                            break
-                if contentinfo_icao:
-                    found_icao = contentinfo_icao
-                    display_name = item
-
-                # Sinon, recherche ICAO dans manifest (fallback)
-                if not found_icao:
-                    for manifest_path in manifest_paths:
-                        icao, name = extract_airport_info(manifest_path, icao_official)
-                        if icao and icao.upper() in icao_official:
-                            found_icao = icao.upper()
-                            display_name = name
-                            break
-
-                # Fallback : pattern "airport-xxxx"
-                if not found_icao:
-                    found_icao = extract_icao_from_folder_or_name(item)
-                    if found_icao and found_icao.upper() in icao_official:
-                        print(
-                            f"[SCAN] ICAO extrait via pattern airport- : {found_icao}"
-                        )
-                        display_name = item
-
-                # Fallback ContentHistory/Info JSON récursif (pour Official/Streamed)
-                if not found_icao:
-                    ch_icao = find_icao_in_content_info(
-                        item_path, icao_official, max_depth=3
-                    )
-                    if ch_icao:
-                        found_icao = ch_icao.upper()
-                        display_name = item
-
-                # Fallback BGL récursif
-                if not found_icao:
-                    bgl_icao = find_icao_in_bgl(item_path, icao_official, max_depth=3)
-                    if bgl_icao:
-                        found_icao = bgl_icao.upper()
-                        display_name = item
-
-                # Final check et ajout à la liste si tout est bon
-                if (
-                    found_icao
-                    and found_icao.upper() in icao_official
-                    and icao_regex.match(found_icao.upper())
-                ):
-                    # Récupère le nom réel (sans ICAO doublonné) depuis le CSV si possible
-                    name_csv = icao_dict.get(found_icao.upper(), {}).get("name")
-                    if name_csv:
-                        cleaned_name = name_csv
-                        if cleaned_name.upper().startswith(found_icao.upper()):
-                            cleaned_name = cleaned_name[len(found_icao) :].lstrip(" -–")
-                        cleaned_name = cleaned_name.strip()
-                        label = cleaned_name if cleaned_name else name_csv
-                    else:
-                        cleaned_name = display_name
-                        if cleaned_name and cleaned_name.strip().upper().startswith(
-                            found_icao.upper()
-                        ):
-                            cleaned_name = cleaned_name[len(found_icao) :].lstrip(" -–")
-                        label = cleaned_name.strip() if cleaned_name else found_icao
-
-                    # Ajoute les coordonnées depuis le CSV si disponibles
-                    lat = icao_dict.get(found_icao.upper(), {}).get("latitude")
-                    lon = icao_dict.get(found_icao.upper(), {}).get("longitude")
-                    entry = {
-                        "icao": found_icao.upper(),
-                        "name": label,
-                        "path": item_path,
-                    }
-                    if lat is not None and lon is not None:
-                        entry["latitude"] = lat
-                        entry["longitude"] = lon
-                    found_airports.append(entry)
-                else:
-                    print(
-                        f"\n[DEBUG] AUCUN ICAO trouvé pour le dossier : {item} (manifest(s) = {manifest_paths})\n"
-                    )
-                    ignored.append(f"{found_icao if found_icao else item} ({item})")
+    # Sinon, recherche ICAO dans manifest (fallback)
+    if not found_icao:
+        with stats.measure("manifest") as probe:
+            for manifest_path in manifest_paths:
+                icao, name = extract_airport_info(manifest_path, icao_official)
+                if icao and icao.upper() in icao_official:
+                    found_icao = icao.upper()
+                    display_name = name
+                    probe.hit = True
+                    break
+
+    # Fallback : pattern "airport-xxxx"
+    if not found_icao:
+        with stats.measure("airport_pattern") as probe:
+            found_icao = extract_icao_from_folder_or_name(item)
+            if found_icao and found_icao.upper() in icao_official:
+                logger.debug("ICAO extrait via pattern airport- : %s", found_icao)
+                display_name = item
+                probe.hit = True
+
+    # Fallback ContentHistory/Info JSON récursif (pour Official/Streamed)
+    if not found_icao:
+        with stats.measure("content_history") as probe:
+            ch_icao = find_icao_in_content_info(
+                item_path, icao_official, max_depth=3, inventory=inventory
+            )
+            if ch_icao:
+                found_icao = ch_icao.upper()
+                display_name = item
+                probe.hit = True
+
+    # Fallback BGL récursif
+    if not found_icao:
+        with stats.measure("bgl") as probe:
+            bgl_icao = find_icao_in_bgl(
+                item_path, icao_official, max_depth=3, inventory=inventory
+            )
+            if bgl_icao:
+                found_icao = bgl_icao.upper()
+                display_name = item
+                probe.hit = True
+
+    return found_icao, display_name, manifest_paths
+
+def build_airport_entry(found_icao, display_name, item_path, icao_dict):
+    """
+    Construit l'entrée de résultat (ICAO, label, chemin, coordonnées) pour un ICAO validé.
+    """
+    # Récupère le nom réel (sans ICAO doublonné) depuis le CSV si possible
+    name_csv = icao_dict.get(found_icao.upper(), {}).get("name")
+    if name_csv:
+        cleaned_name = name_csv
+        if cleaned_name.upper().startswith(found_icao.upper()):
+            cleaned_name = cleaned_name[len(found_icao) :].lstrip(" -–")
+        cleaned_name = cleaned_name.strip()
+        label = cleaned_name if cleaned_name else name_csv
+    else:
+        cleaned_name = display_name
+        if cleaned_name and cleaned_name.strip().upper().startswith(
+            found_icao.upper()
+        ):
+            cleaned_name = cleaned_name[len(found_icao) :].lstrip(" -–")
+        label = cleaned_name.strip() if cleaned_name else found_icao
+
+    # Ajoute les coordonnées depuis le CSV si disponibles
+    lat = icao_dict.get(found_icao.upper(), {}).get("latitude")
+    lon = icao_dict.get(found_icao.upper(), {}).get("longitude")
+    entry = {
+        "icao": found_icao.upper(),
+        "name": label,
+        "path": item_path,
+    }
+    if lat is not None and lon is not None:
+        entry["latitude"] = lat
+        entry["longitude"] = lon
+    return entry
+
+def scan_airport_package(
+    item,
+    item_path,
+    icao_official,
+    icao_dict,
+    use_layout=True,
+    stats=None,
+    inventory=None,
+):
+    """
+    Résout un dossier package et retourne {"entry": ..., "ignored": ...}.
+    Sans autre état partagé que stats (thread-safe) : peut être appelé depuis plusieurs threads.
+    inventory : inventaire déjà construit (scan unifié), sinon construit ici.
+    """
+    found_icao, display_name, manifest_paths = resolve_airport_package(
+        item,
+        item_path,
+        icao_official,
+        inventory=inventory,
+        use_layout=use_layout,
+        stats=stats,
+    )
+
+    # Final check et ajout à la liste si tout est bon
+    if (
+        found_icao
+        and found_icao.upper() in icao_official
+        and re.match(r"^[A-Z0-9]{4}$", found_icao.upper())
+    ):
+        entry = build_airport_entry(found_icao, display_name, item_path, icao_dict)
+        return {"entry": entry, "ignored": None}
+    logger.debug(
+        "AUCUN ICAO trouvé pour le dossier : %s (manifest(s) = %s)", item, manifest_paths
+    )
+    return {"entry": None, "ignored": f"{found_icao if found_icao else item} ({item})"}
+
+def is_ignored_airport_folder(item):
+    """
+    Code raison si le dossier n'est jamais une scène d'aéroport, sinon None
+    (règles "airport" de data/scan_filters.json).
+    """
+    return scan_filters().match("airport", folder=item)
+
+def assemble_airport_results(results):
+    """
+    Résultats par package (dans l'ordre du scan) -> (aéroports, ignorés).
+    Un seul aéroport par ICAO (le premier rencontré), trié par ICAO.
+    """
+    found_airports = []
+    ignored = []
+    for item, result in results:
+        if result.get("entry"):
+            found_airports.append(result["entry"])
+        else:
+            ignored.append(result.get("ignored") or f"{item} ({item})")
 
     # PATCH ICAO UNIQUE – Garde un seul aéroport par ICAO
     unique_icao = {}
@@ -536,32 +460,178 @@ def scan_airports(directories, csv_path):
             unique_icao[icao_upper] = ap
     found_airports = sorted(list(unique_icao.values()), key=lambda x: x["icao"])
 
+    # Détail par dossier en DEBUG uniquement ; le résumé est donné en fin de scan
     for entry in ignored:
-        print(f"[Scanner] [IGNORÉ] icao non listé en base officielle : {entry}")
+        logger.debug("[IGNORÉ] icao non listé en base officielle : %s", entry)
+    return found_airports, ignored
 
+def write_airport_reports(directories, icao_official, stats, extra, reports_dir=None):
+    """
+    Rapport CSV des dossiers contenant un ICAO connu + rapport JSON des stratégies,
+    écrits dans reports_dir (results/ par défaut).
+    """
+    reports_dir = reports_dir or RESULTS_DIR
+    report_ignored = []  # Pour générer le rapport
     # -------- NOUVEAU : Rapport CSV des ignorés avec ICAO partiel dans le nom du dossier --------
     for base_dir in directories:
         if not os.path.exists(base_dir):
             continue
         for item in os.listdir(base_dir):
             upper_item = item.upper()
-            matched_icaos = [icao for icao in icao_official if icao in upper_item]
+            matched_icaos = icao_official.find_all(upper_item)
             if matched_icaos:
                 report_ignored.append({"folder": item, "icaos_in_name": matched_icaos})
 
-    os.makedirs(RESULTS_DIR, exist_ok=True)
+    os.makedirs(reports_dir, exist_ok=True)
     with open(
-        os.path.join(RESULTS_DIR, "scan_report_ignored.csv"), "w", encoding="utf-8"
+        os.path.join(reports_dir, "scan_report_ignored.csv"), "w", encoding="utf-8"
     ) as f:
         f.write("folder,icaos_in_name\n")
         for entry in report_ignored:
             f.write(f"{entry['folder']},{'|'.join(entry['icaos_in_name'])}\n")
 
-    print(
-        f"[Scanner] Scanné {len(found_airports)} aéroports valides. Résultats dans {os.path.abspath(os.path.join(RESULTS_DIR, 'airport_scanresults.json'))}"
+    # -------- Rapport machine des stratégies de détection (JSON) --------
+    stats.save(os.path.join(reports_dir, "scan_report_strategies.json"), extra=extra)
+    for line in stats.summary_lines():
+        logger.info("[STRATÉGIE] %s", line)
+
+    logger.info(
+        "Scanné %d aéroports valides sur %d package(s), %d ignoré(s) en %.2fs. Résultats dans %s",
+        extra.get("airports", 0),
+        extra.get("packages", 0),
+        extra.get("ignored", 0),
+        stats.to_dict()["duration_seconds"],
+        os.path.abspath(os.path.join(reports_dir, "airport_scanresults.json")),
     )
-    print(
-        f"[Scanner] Rapport ignorés généré : {os.path.abspath(os.path.join(RESULTS_DIR, 'scan_report_ignored.csv'))}"
+    logger.info(
+        "Rapport ignorés généré : %s",
+        os.path.abspath(os.path.join(reports_dir, "scan_report_ignored.csv")),
+    )
+    logger.info(
+        "Rapport stratégies généré : %s",
+        os.path.abspath(os.path.join(reports_dir, "scan_report_strategies.json")),
+    )
+
+def airport_scan_context(csv_path):
+    """
+    Contexte du cache : toute modification du CSV officiel ou du mapping custom
+    invalide les résultats mémorisés.
+    """
+    return {
+        "version": AIRPORT_SCAN_CACHE_VERSION,
+        "airports_csv": file_fingerprint(csv_path),
+        "custom_mapping": file_fingerprint(CUSTOM_AIRPORT_MAP_PATH),
+    }
+
+def scan_airports(
+    directories,
+    csv_path,
+    cache_path=AIRPORT_SCAN_CACHE_PATH,
+    workers=1,
+    use_layout=True,
+    reports_dir=None,
+):
+    import os
+    import re
+    import json
+
+    icao_dict = load_icao_dict_from_csv(csv_path)
+    CUSTOM_AIRPORT_MAPPING.reload_if_changed()
+    scan_filters(refresh=True)
+    # On force les ICAO CSV en majuscule pour la recherche
+    # (index construit une seule fois, partagé par toutes les stratégies)
+    icao_official = IcaoMatcher(icao_dict.keys())
+
+    stats = ScanStats()
+    cache = None
+    if cache_path:
+        cache = ScanCache(cache_path, context=airport_scan_context(csv_path))
+    seen_keys = []
+
+    # 1. Inventaire des dossiers candidats (ordre disque) + consultation du cache
+    packages = []  # [base_dir, item, item_path, fingerprint, résultat]
+    for base_dir in directories:
+        logger.debug("SCAN DIR: %s", base_dir)
+        if not os.path.exists(base_dir):
+            logger.warning("Dossier introuvable : %s", base_dir)
+            continue
+        for item in os.listdir(base_dir):
+            reason = is_ignored_airport_folder(item)
+            if reason:
+                logger.debug("[EXCLU] %s (%s)", item, reason)
+                continue
+            item_path = os.path.join(base_dir, item)
+            if not os.path.isdir(item_path):
+                continue
+
+            # Cache incrémental : package inchangé => résultat mémorisé
+            fingerprint, result = None, None
+            if cache is not None:
+                with stats.for_root(base_dir).measure("cache") as probe:
+                    fingerprint = package_fingerprint(item_path)
+                    seen_keys.append(item_path)
+                    hit, cached = cache.get(item_path, fingerprint)
+                    if hit:
+                        result = cached
+                        probe.hit = True
+            packages.append([base_dir, item, item_path, fingerprint, result])
+
+    # 2. Résolution des packages nouveaux/modifiés (séquentielle ou pool de threads)
+    to_resolve = [package for package in packages if package[4] is None]
+
+    def resolve(package):
+        base_dir, item, item_path = package[0], package[1], package[2]
+        return scan_airport_package(
+            item,
+            item_path,
+            icao_official,
+            icao_dict,
+            use_layout=use_layout,
+            stats=stats.for_root(base_dir),
+        )
+
+    if workers and workers > 1 and len(to_resolve) > 1:
+        logger.info(
+            "Résolution parallèle : %d package(s), %d threads", len(to_resolve), workers
+        )
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # pool.map conserve l'ordre d'entrée => sortie déterministe
+            resolved = list(pool.map(resolve, to_resolve))
+    else:
+        resolved = [resolve(package) for package in to_resolve]
+    for package, result in zip(to_resolve, resolved):
+        package[4] = result
+        if cache is not None:
+            cache.put(package[2], package[3], result)
+
+    # 3. Assemblage dans l'ordre d'origine (le dédoublonnage ICAO garde le premier)
+    found_airports, ignored = assemble_airport_results(
+        [(package[1], package[4]) for package in packages]
+    )
+
+    if cache is not None:
+        removed = cache.prune(seen_keys)
+        cache.save()
+        logger.info(
+            "Cache : %d package(s) inchangé(s), %d analysé(s), %d retiré(s)",
+            cache.hits,
+            cache.misses,
+            removed,
+        )
+
+    write_airport_reports(
+        directories,
+        icao_official,
+        stats,
+        extra={
+            "packages": len(packages),
+            "resolved": len(to_resolve),
+            "airports": len(found_airports),
+            "ignored": len(ignored),
+            "workers": workers,
+            "use_layout": use_layout,
+        },
+        reports_dir=reports_dir,
     )
     return found_airports
 
@@ -572,11 +642,16 @@ def save_results(results, filename):
 
 if __name__ == "__main__":
     config = load_config()
+    configure_logging(config.get("log_level"))
     paths_to_scan = [
         config.get("community_dir", ""),
         config.get("official_onestore_dir", ""),
         config.get("streamedpackages_dir", ""),
     ]
     paths_to_scan = [p for p in paths_to_scan if p]
-    airports = scan_airports(paths_to_scan, CSV_PATH)
+    workers = int(config.get("scan_workers", DEFAULT_SCAN_WORKERS))
+    use_layout = bool(config.get("scan_use_layout", True))
+    airports = scan_airports(
+        paths_to_scan, CSV_PATH, workers=workers, use_layout=use_layout
+    )
     save_results(airports, "airport_scanresults.json")
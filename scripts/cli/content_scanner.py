@@ -0,0 +1,390 @@
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Gestion intelligente des imports pour tous contextes d'exécution
+try:
+    from scripts.cli import airport_scanner, aircraft_scanner
+    from scripts.utils.config_helper import load_config
+    from scripts.utils.scan_cache import ScanCache, package_fingerprint
+    from scripts.utils.icao_matcher import IcaoMatcher
+    from scripts.utils.package_walker import build_package_inventory
+    from scripts.utils.scan_stats import ScanStats
+    from scripts.utils.log_helper import get_logger, configure_logging
+    from scripts.utils.airline_registry import load_airline_registry
+    from scripts.utils.filter_rules import scan_filters
+    from scripts.utils.aircraft_types import aircraft_type_classifier
+    from scripts.utils.thumbnail_cache import THUMBNAILS_DIR, ThumbnailCache
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(
+        0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils"))
+    )
+    import airport_scanner
+    import aircraft_scanner
+    from config_helper import load_config
+    from scan_cache import ScanCache, package_fingerprint
+    from icao_matcher import IcaoMatcher
+    from package_walker import build_package_inventory
+    from scan_stats import ScanStats
+    from log_helper import get_logger, configure_logging
+    from airline_registry import load_airline_registry
+    from filter_rules import scan_filters
+    from aircraft_types import aircraft_type_classifier
+    from thumbnail_cache import THUMBNAILS_DIR, ThumbnailCache
+
+logger = get_logger("content_scanner")
+
+
+class AirportDetector:
+    """
+    Détecteur d'aéroports : même chaîne de stratégies que airport_scanner.scan_airports,
+    appliquée à l'inventaire partagé. Écrit airport_scanresults.json et les rapports.
+    """
+
+    name = "airports"
+    output = "airport_scanresults.json"
+
+    def __init__(
+        self,
+        csv_path=airport_scanner.CSV_PATH,
+        cache_path=airport_scanner.AIRPORT_SCAN_CACHE_PATH,
+    ):
+        self.csv_path = csv_path
+        self.cache_path = cache_path
+
+    def begin(self, roots):
+        self.roots = roots
+        self.icao_dict = airport_scanner.load_icao_dict_from_csv(self.csv_path)
+        airport_scanner.CUSTOM_AIRPORT_MAPPING.reload_if_changed()
+        scan_filters(refresh=True)
+        self.icao_official = IcaoMatcher(self.icao_dict.keys())
+        self.stats = ScanStats()
+        self.cache = None
+        if self.cache_path:
+            self.cache = ScanCache(
+                self.cache_path,
+                context=airport_scanner.airport_scan_context(self.csv_path),
+            )
+        self.seen_keys = []
+        self.fingerprints = {}
+
+    def accepts(self, root, item):
+        reason = airport_scanner.is_ignored_airport_folder(item)
+        if reason:
+            logger.debug("[EXCLU] %s (%s)", item, reason)
+        return not reason
+
+    def lookup(self, root, item, item_path):
+        """Cache incrémental : package inchangé => résultat mémorisé."""
+        if self.cache is None:
+            return False, None
+        with self.stats.for_root(root).measure("cache") as probe:
+            fingerprint = package_fingerprint(item_path)
+            self.fingerprints[item_path] = fingerprint
+            self.seen_keys.append(item_path)
+            hit, cached = self.cache.get(item_path, fingerprint)
+            probe.hit = hit
+        return hit, cached
+
+    def detect(self, root, item, item_path, inventory):
+        result = airport_scanner.scan_airport_package(
+            item,
+            item_path,
+            self.icao_official,
+            self.icao_dict,
+            stats=self.stats.for_root(root),
+            inventory=inventory,
+        )
+        if self.cache is not None:
+            self.cache.put(item_path, self.fingerprints.get(item_path), result)
+        return result
+
+    def finish(self, results, resolved, scanner):
+        found_airports, ignored = airport_scanner.assemble_airport_results(
+            [(item, result) for _, item, _, result in results]
+        )
+        if self.cache is not None:
+            removed = self.cache.prune(self.seen_keys)
+            self.cache.save()
+            logger.info(
+                "Aéroports - cache : %d package(s) inchangé(s), %d analysé(s), %d retiré(s)",
+                self.cache.hits,
+                self.cache.misses,
+                removed,
+            )
+        airport_scanner.write_airport_reports(
+            self.roots,
+            self.icao_official,
+            self.stats,
+            extra={
+                "packages": len(results),
+                "resolved": resolved,
+                "airports": len(found_airports),
+                "ignored": len(ignored),
+                "workers": scanner.workers,
+                "use_layout": scanner.use_layout,
+            },
+        )
+        airport_scanner.save_results(found_airports, self.output)
+        return found_airports
+
+
+class AircraftDetector:
+    """
+    Détecteur de livrées : aircraft.cfg de l'inventaire (SimObjects/Airplanes/*),
+    cache par cfg (mtime + taille). Écrit aircraft_scanresults.json et met à jour
+    les miniatures carte de vol si thumbnails_dir est fourni (scan lancé par la GUI).
+    """
+
+    name = "aircraft"
+    output = "aircraft_scanresults.json"
+
+    def __init__(
+        self,
+        cache_path=aircraft_scanner.AIRCRAFT_SCAN_CACHE_PATH,
+        callsign_csv=aircraft_scanner.AIRLINE_CALLSIGN_CSV_PATH,
+        thumbnails_dir=None,
+    ):
+        self.cache_path = cache_path
+        self.callsign_csv = callsign_csv
+        self.thumbnails_dir = thumbnails_dir
+
+    def begin(self, roots):
+        self.roots = roots
+        self.airlines = load_airline_registry(self.callsign_csv)
+        self.types = aircraft_type_classifier(refresh=True)
+        scan_filters(refresh=True)
+        self.cache = None
+        if self.cache_path:
+            self.cache = ScanCache(
+                self.cache_path,
+                context={"version": aircraft_scanner.AIRCRAFT_SCAN_CACHE_VERSION},
+            )
+        self.excluded = 0
+
+    def accepts(self, root, item):
+        reason = aircraft_scanner.is_blacklisted_package(item)
+        if reason:
+            logger.debug("[EXCLU] %s (%s)", item, reason)
+            self.excluded += 1
+            return False
+        return True
+
+    def lookup(self, root, item, item_path):
+        # Sans SimObjects/Airplanes, pas besoin d'inventaire ; sinon cache par cfg dans detect
+        if not os.path.isdir(os.path.join(item_path, "SimObjects", "Airplanes")):
+            return True, {"cfgs": [], "entries": []}
+        return False, None
+
+    def detect(self, root, item, item_path, inventory):
+        cfgs = list(inventory.aircraft_cfgs)
+        entries = []
+        parsed = aircraft_scanner.parse_aircraft_cfgs(cfgs, cache=self.cache)
+        for aircraft_cfg, liveries in zip(cfgs, parsed):
+            entries.extend(
+                aircraft_scanner.build_livery_entries(
+                    aircraft_cfg, liveries, self.airlines, self.types
+                )
+            )
+        return {"cfgs": cfgs, "entries": entries}
+
+    def finish(self, results, resolved, scanner):
+        cfgs = [cfg for _, _, _, result in results for cfg in result["cfgs"]]
+        entries = [entry for _, _, _, result in results for entry in result["entries"]]
+        if self.cache is not None:
+            aircraft_scanner.log_aircraft_cache(self.cache, cfgs)
+        aircraft = aircraft_scanner.finalize_aircraft_results(
+            entries, self.airlines, excluded=self.excluded, roots=self.roots
+        )
+        if self.thumbnails_dir:
+            ThumbnailCache(self.thumbnails_dir).update(aircraft)
+        aircraft_scanner.save_results(aircraft, self.output)
+        return aircraft
+
+
+class ContentScanner:
+    """
+    Moteur de scan unifié : chaque dossier racine est listé une fois, chaque package
+    est inventorié une fois (layout.json ou parcours disque) et confié aux détecteurs.
+    Un détecteur fournit : name, begin(roots), accepts(root, item),
+    lookup(root, item, item_path) -> (hit, résultat), detect(root, item, item_path,
+    inventory) -> résultat (thread-safe) et finish(results, resolved, scanner).
+    progress(done, total, item, results), optionnel, est appelé une fois par package
+    terminé (cache ou analyse), depuis le thread qui l'a traité.
+    cancel (threading.Event, optionnel) : une fois levé, plus aucun package n'est
+    analysé, les analyses en file sont annulées et scan() retourne None sans finish().
+    """
+
+    def __init__(self, detectors, workers=1, use_layout=True, progress=None, cancel=None):
+        self.detectors = list(detectors)
+        self.workers = workers
+        self.use_layout = use_layout
+        self.progress = progress
+        self.cancel = cancel
+        self.stats = ScanStats()
+        self._done = 0
+        self._total = 0
+        self._progress_lock = threading.Lock()
+
+    def cancelled(self):
+        return self.cancel is not None and self.cancel.is_set()
+
+    def _package_done(self, item, results):
+        if self.progress is None:
+            return
+        with self._progress_lock:
+            self._done += 1
+            self.progress(self._done, self._total, item, dict(results))
+
+    def scan(self, roots):
+        roots = [root for root in roots if root]
+        for detector in self.detectors:
+            detector.begin(roots)
+
+        # 1. Un seul listage par racine ; cache de chaque détecteur consulté d'abord
+        packages = []  # (root, item, item_path, détecteurs concernés, à détecter, résultats)
+        for root in roots:
+            logger.debug("SCAN DIR: %s", root)
+            if not os.path.exists(root):
+                logger.warning("Dossier introuvable : %s", root)
+                continue
+            for item in os.listdir(root):
+                if self.cancelled():
+                    break
+                wanted = [d for d in self.detectors if d.accepts(root, item)]
+                if not wanted:
+                    continue
+                item_path = os.path.join(root, item)
+                if not os.path.isdir(item_path):
+                    continue
+                results = {}
+                pending = []
+                for detector in wanted:
+                    hit, value = detector.lookup(root, item, item_path)
+                    if hit:
+                        results[detector.name] = value
+                    else:
+                        pending.append(detector)
+                packages.append((root, item, item_path, wanted, pending, results))
+
+        # 2. Un inventaire par package à analyser, partagé par les détecteurs en attente
+        to_detect = [package for package in packages if package[4]]
+        self._done = 0
+        self._total = len(packages)
+        for _, item, _, _, pending, results in packages:
+            if not pending:
+                self._package_done(item, results)
+
+        def detect(package):
+            if self.cancelled():
+                return
+            root, item, item_path, _, pending, results = package
+            with self.stats.for_root(root).measure("inventory") as probe:
+                inventory = build_package_inventory(
+                    item_path, max_depth=3, use_layout=self.use_layout
+                )
+                probe.hit = inventory.from_layout
+            for detector in pending:
+                results[detector.name] = detector.detect(
+                    root, item, item_path, inventory
+                )
+            self._package_done(item, results)
+
+        if self.workers and self.workers > 1 and len(to_detect) > 1:
+            logger.info(
+                "Analyse parallèle : %d package(s), %d threads",
+                len(to_detect),
+                self.workers,
+            )
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+            try:
+                futures = [pool.submit(detect, package) for package in to_detect]
+                for future in as_completed(futures):
+                    if self.cancelled():
+                        break
+                    future.result()
+            finally:
+                # Annulation : les packages encore en file ne sont jamais analysés
+                pool.shutdown(wait=True, cancel_futures=self.cancelled())
+        else:
+            for package in to_detect:
+                if self.cancelled():
+                    break
+                detect(package)
+
+        if self.cancelled():
+            logger.info("Scan unifié interrompu : résultats précédents conservés")
+            return None
+
+        # 3. Chaque détecteur assemble ses résultats dans l'ordre du scan
+        outputs = {}
+        for detector in self.detectors:
+            results = [
+                (root, item, item_path, results[detector.name])
+                for root, item, item_path, wanted, _, results in packages
+                if detector in wanted
+            ]
+            resolved = sum(1 for package in to_detect if detector in package[4])
+            outputs[detector.name] = detector.finish(results, resolved, self)
+        logger.info(
+            "Scan unifié : %d package(s), %d inventorié(s) en %.2fs",
+            len(packages),
+            len(to_detect),
+            self.stats.to_dict()["duration_seconds"],
+        )
+        return outputs
+
+
+def default_detectors(thumbnails_dir=None):
+    return [AirportDetector(), AircraftDetector(thumbnails_dir=thumbnails_dir)]
+
+
+def run_content_scan(
+    roots, workers=1, use_layout=True, detectors=None, progress=None, cancel=None
+):
+    """
+    Scan unifié aéroports + avions ; retourne {nom du détecteur: résultats},
+    ou None si cancel a été levé pendant le scan.
+    """
+    scanner = ContentScanner(
+        detectors if detectors is not None else default_detectors(),
+        workers=workers,
+        use_layout=use_layout,
+        progress=progress,
+        cancel=cancel,
+    )
+    return scanner.scan(roots)
+
+
+def run_configured_scan(config=None, progress=None, cancel=None, thumbnails_dir=None):
+    """
+    Scan unifié des dossiers de config/paths.json (appelé par le CLI et par la GUI).
+    Miniatures générées dans thumbnails_dir (GUI), ou dans THUMBNAILS_DIR si
+    "scan_thumbnails" est activé dans la config.
+    """
+    config = config if config is not None else load_config()
+    if thumbnails_dir is None and config.get("scan_thumbnails"):
+        thumbnails_dir = THUMBNAILS_DIR
+    roots = [
+        config.get("community_dir", ""),
+        config.get("official_onestore_dir", ""),
+        config.get("streamedpackages_dir", ""),
+    ]
+    return run_content_scan(
+        [p for p in roots if p],
+        workers=int(
+            config.get("scan_workers", airport_scanner.DEFAULT_SCAN_WORKERS)
+        ),
+        use_layout=bool(config.get("scan_use_layout", True)),
+        detectors=default_detectors(thumbnails_dir),
+        progress=progress,
+        cancel=cancel,
+    )
+
+
+if __name__ == "__main__":
+    config = load_config()
+    configure_logging(config.get("log_level"))
+    run_configured_scan(config)
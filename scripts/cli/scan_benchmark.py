@@ -0,0 +1,194 @@
+import sys
+import os
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+# Gestion intelligente des imports pour tous contextes d'exécution
+try:
+    from scripts.cli import airport_scanner, aircraft_scanner
+    from scripts.cli.synthetic_packages import generate_tree
+    from scripts.utils.log_helper import configure_logging
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(
+        0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils"))
+    )
+    import airport_scanner
+    import aircraft_scanner
+    from synthetic_packages import generate_tree
+    from log_helper import configure_logging
+
+
+def timed(fn):
+    """(résultat, secondes)."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def peak_memory(fn):
+    """Pic d'allocation Python (octets) pendant fn, mesuré par tracemalloc."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _remove(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def benchmark_scanner(scan, cache_path, packages):
+    """
+    scan(cache_path) -> résultats. Mesure un passage à froid (cache absent) puis
+    à chaud (cache rempli par le passage précédent), et le pic mémoire à froid
+    dans un passage séparé (tracemalloc ralentit l'exécution).
+    """
+    report = {}
+    _remove(cache_path)
+    for run in ("cold", "warm"):
+        results, seconds = timed(lambda: scan(cache_path))
+        report[run] = {
+            "seconds": round(seconds, 4),
+            "packages_per_second": round(packages / seconds, 1) if seconds else None,
+            "results": len(results),
+        }
+    _remove(cache_path)
+    report["peak_memory_bytes"] = peak_memory(lambda: scan(cache_path))
+    return report
+
+
+def run_benchmark(
+    root=None,
+    airports=200,
+    aircraft=100,
+    liveries=4,
+    noise=20,
+    workers=airport_scanner.DEFAULT_SCAN_WORKERS,
+    use_layout=True,
+    seed=0,
+):
+    """
+    Génère une arborescence synthétique (dans root, ou un dossier temporaire supprimé
+    ensuite), puis chronomètre scan_airports et scan_all_aircraft à froid et à chaud.
+    Les caches et rapports sont écrits à côté de l'arborescence, jamais dans results/.
+    """
+    temporary = root is None
+    if temporary:
+        root = tempfile.mkdtemp(prefix="simroster-bench-")
+    try:
+        tree, generation = timed(
+            lambda: generate_tree(
+                os.path.join(root, "tree"),
+                airports=airports,
+                aircraft=aircraft,
+                liveries=liveries,
+                noise=noise,
+                layout=use_layout,
+                seed=seed,
+            )
+        )
+        roots = tree["roots"]
+        packages = sum(len(os.listdir(path)) for path in roots)
+        work_dir = os.path.join(root, "work")
+        os.makedirs(work_dir, exist_ok=True)
+
+        def scan_airports(cache_path):
+            return airport_scanner.scan_airports(
+                roots,
+                airport_scanner.CSV_PATH,
+                cache_path=cache_path,
+                workers=workers,
+                use_layout=use_layout,
+                reports_dir=work_dir,
+            )
+
+        def scan_aircraft(cache_path):
+            return aircraft_scanner.scan_all_aircraft(
+                roots,
+                use_layout=use_layout,
+                cache_path=cache_path,
+                workers=workers,
+                thumbnails_dir=None,
+            )
+
+        report = {
+            "packages": packages,
+            "expected": {"airports": len(tree["airports"]), "liveries": tree["liveries"]},
+            "config": {
+                "workers": workers,
+                "use_layout": use_layout,
+                "seed": seed,
+                "generation_seconds": round(generation, 4),
+            },
+            "airports": benchmark_scanner(
+                scan_airports, os.path.join(work_dir, "airport_scan_cache.json"), packages
+            ),
+            "aircraft": benchmark_scanner(
+                scan_aircraft, os.path.join(work_dir, "aircraft_scan_cache.json"), packages
+            ),
+        }
+        return report
+    finally:
+        if temporary:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def summary_lines(report):
+    lines = [
+        f"{report['packages']} package(s) générés "
+        f"({report['expected']['airports']} aéroport(s), "
+        f"{report['expected']['liveries']} livrée(s)), "
+        f"{report['config']['workers']} thread(s), layout={report['config']['use_layout']}"
+    ]
+    for name in ("airports", "aircraft"):
+        bench = report[name]
+        lines.append(
+            f"{name:<9} froid {bench['cold']['seconds']:.3f}s "
+            f"({bench['cold']['packages_per_second']} pkg/s) | "
+            f"chaud {bench['warm']['seconds']:.3f}s "
+            f"({bench['warm']['packages_per_second']} pkg/s) | "
+            f"pic mémoire {bench['peak_memory_bytes'] / 1048576:.1f} Mo | "
+            f"{bench['cold']['results']} résultat(s)"
+        )
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark des scanners sur une arborescence MSFS synthétique."
+    )
+    parser.add_argument("--airports", type=int, default=200)
+    parser.add_argument("--aircraft", type=int, default=100)
+    parser.add_argument("--liveries", type=int, default=4, help="livrées par aircraft.cfg")
+    parser.add_argument("--noise", type=int, default=20, help="packages à écarter")
+    parser.add_argument("--workers", type=int, default=airport_scanner.DEFAULT_SCAN_WORKERS)
+    parser.add_argument("--no-layout", action="store_true", help="sans layout.json")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--root", help="dossier de travail conservé (temporaire sinon)")
+    parser.add_argument("--output", help="rapport JSON")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+    report = run_benchmark(
+        root=args.root,
+        airports=args.airports,
+        aircraft=args.aircraft,
+        liveries=args.liveries,
+        noise=args.noise,
+        workers=args.workers,
+        use_layout=not args.no_layout,
+        seed=args.seed,
+    )
+    for line in summary_lines(report):
+        print(line)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,260 @@
+import sys
+import os
+import json
+import random
+import struct
+import argparse
+
+# Gestion intelligente des imports pour tous contextes d'exécution
+try:
+    from scripts.utils.bgl_reader import (
+        BGL_MAGIC,
+        BGL_HEADER_SIZE,
+        SECTION_TYPE_AIRPORT,
+        AIRPORT_IDENT_OFFSET,
+        encode_icao_ident,
+    )
+    from scripts.utils.airport_db import load_airport_db
+except ImportError:
+    sys.path.insert(
+        0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils"))
+    )
+    from bgl_reader import (
+        BGL_MAGIC,
+        BGL_HEADER_SIZE,
+        SECTION_TYPE_AIRPORT,
+        AIRPORT_IDENT_OFFSET,
+        encode_icao_ident,
+    )
+    from airport_db import load_airport_db
+
+# Arborescence MSFS générée : un dossier par racine scannée
+ROOT_NAMES = ("Community", "OneStore", "StreamedPackages")
+AIRPORT_RECORD_ID = 0x0056  # record Airport MSFS
+AIRPORT_RECORD_SIZE = 0x44
+CREATORS = ("flytampa", "orbx", "justsim", "aerosoft", "taxi2gate", "mkstudios")
+AIRLINES = (
+    ("AFR", "Air France", "F-G"),
+    ("DLH", "Lufthansa", "D-A"),
+    ("BAW", "British Airways", "G-E"),
+    ("EZY", "easyJet", "G-U"),
+    ("RYR", "Ryanair", "EI-D"),
+    ("KLM", "KLM", "PH-B"),
+    ("AEE", "Aegean Airlines", "SX-D"),
+)
+AIRCRAFT_TYPES = (
+    ("A320", "A320", "Fenix A320"),
+    ("A20N", "A320neo", "FBW A32NX"),
+    ("A21N", "A321neo", "iniBuilds A321LR"),
+    ("B738", "737-800", "PMDG 737-800"),
+)
+# Packages que les scanners doivent écarter (règles de data/scan_filters.json).
+# Les titres de manifest sont numériques : un mot de 4 lettres peut être un ICAO réel.
+NOISE_PACKAGES = (
+    "fs-base-library-{n}",
+    "asobo-simobjects-vehicles-{n}",
+    "fsltl-traffic-base-{n}",
+    "aig-aircraft-{n}",
+    "asobo-landingchallenge-{n}",
+)
+
+
+def build_bgl(icaos):
+    """BGL minimal : une section Airport, une sous-section, un record par ICAO."""
+    header = struct.pack("<IIQII", BGL_MAGIC, BGL_HEADER_SIZE, 0, 0, 2)
+    header += b"\0" * (BGL_HEADER_SIZE - len(header))
+    records = bytearray()
+    for icao in icaos:
+        record = bytearray(AIRPORT_RECORD_SIZE)
+        struct.pack_into("<HI", record, 0, AIRPORT_RECORD_ID, AIRPORT_RECORD_SIZE)
+        struct.pack_into("<I", record, AIRPORT_IDENT_OFFSET, encode_icao_ident(icao))
+        records += record
+    sub_offset = BGL_HEADER_SIZE + 2 * 20
+    record_offset = sub_offset + 16
+    sections = struct.pack("<IIIII", 0x0065, 0, 0, 0, 0)  # section quelconque (ignorée)
+    sections += struct.pack("<IIIII", SECTION_TYPE_AIRPORT, 0, 1, sub_offset, 16)
+    sub = struct.pack("<IIII", 0, len(icaos), record_offset, len(records))
+    return header + sections + sub + bytes(records)
+
+
+class PackageWriter:
+    """Écrit un package (fichiers + layout.json listant son contenu)."""
+
+    def __init__(self, package_path, layout=True):
+        self.package_path = package_path
+        self.layout = layout
+        self.files = []
+
+    def write(self, rel_path, data):
+        path = os.path.join(self.package_path, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if isinstance(data, (dict, list)):
+            data = json.dumps(data, indent=2)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(data)
+        if rel_path not in ("manifest.json", "layout.json"):
+            self.files.append((rel_path, len(data)))
+
+    def close(self):
+        if self.layout:
+            self.write(
+                "layout.json",
+                {
+                    "content": [
+                        {"path": rel_path, "size": size, "date": 133000000000000000}
+                        for rel_path, size in self.files
+                    ]
+                },
+            )
+
+
+def _aircraft_cfg(rng, type_code, model, title_prefix, liveries):
+    lines = ["[VERSION]", "major = 1", "minor = 0", ""]
+    for index in range(liveries):
+        icao, company, reg_prefix = rng.choice(AIRLINES)
+        suffix = "".join(
+            rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+            for _ in range(6 - len(reg_prefix.replace("-", "")))
+        )
+        # atc_id sans tiret, comme dans la plupart des livrées
+        registration = reg_prefix.replace("-", "") + suffix
+        lines += [
+            f"[FLTSIM.{index}]",
+            f'title = "{title_prefix} {company} {registration}" ; livrée générée',
+            f'atc_id = "{registration}"',
+            f'atc_airline = "{company}"',
+            f'icao_airline = "{icao}"',
+            f'atc_flight_number = "{rng.randint(100, 9999)}"',
+            f'ui_type = "{model}"',
+            f'ui_variation = "{company} CFM"',
+            f'texture = "{icao}{index}"',
+            "",
+        ]
+    lines += [
+        "[GENERAL]",
+        f'icao_type_designator = "{type_code}"',
+        f'icao_model = "{model}"',
+        "",
+        "[FLIGHT_MODEL]",
+    ]
+    # Suite du fichier jamais lue par le scanner (arrêt après les FLTSIM / [GENERAL])
+    lines += [f"reference_datum_{n} = 0.0, 0.0, 0.0" for n in range(200)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_tree(
+    root,
+    airports=200,
+    aircraft=100,
+    liveries=4,
+    noise=20,
+    layout=True,
+    seed=0,
+    icao_codes=None,
+):
+    """
+    Génère sous root une arborescence Community / OneStore / StreamedPackages :
+    - aéroports répartis entre les stratégies de détection (ContentInfo, manifest,
+      motif airport-xxxx, ContentHistory récursif, BGL) ;
+    - packages de livrées (aircraft.cfg à plusieurs [FLTSIM.N] + [GENERAL]) ;
+    - packages "bruit" écartés par les règles de filtrage.
+    Retourne {"roots": [...], "airports": [ICAO attendus], "liveries": nb}.
+    """
+    rng = random.Random(seed)
+    if icao_codes is None:
+        icao_codes = [
+            icao for icao in load_airport_db() if len(icao) == 4 and icao.isalpha()
+        ]
+    icaos = rng.sample(sorted(icao_codes), airports)
+    roots = {name: os.path.join(root, name) for name in ROOT_NAMES}
+    for path in roots.values():
+        os.makedirs(path, exist_ok=True)
+
+    for n, icao in enumerate(icaos):
+        kind = n % 5
+        creator = rng.choice(CREATORS)
+        if kind == 0:  # Community, ContentInfo/<package>/ContentHistory.json
+            name = f"{creator}-ap-ci-{n:05d}"
+            package = PackageWriter(os.path.join(roots["Community"], name), layout)
+            package.write("manifest.json", {"creator": creator, "title": f"{n:05d}"})
+            package.write(
+                f"ContentInfo/{name}/ContentHistory.json",
+                {"items": [{"type": "Airport", "content": icao}]},
+            )
+        elif kind == 1:  # Community, ICAO dans le titre du manifest
+            name = f"{creator}-ap-{n:05d}"
+            package = PackageWriter(os.path.join(roots["Community"], name), layout)
+            package.write("manifest.json", {"creator": creator, "title": f"{icao} Intl {n}"})
+        elif kind == 2:  # OneStore, motif airport-xxxx dans le nom du dossier
+            name = f"microsoft-airport-{icao.lower()}-{n:05d}"
+            package = PackageWriter(os.path.join(roots["OneStore"], name), layout)
+            package.write("manifest.json", {"creator": "Microsoft", "title": f"{n:05d}"})
+        elif kind == 3:  # Streamed, ContentHistory.json en profondeur
+            name = f"fs24-asobo-ch-{n:05d}"
+            package = PackageWriter(os.path.join(roots["StreamedPackages"], name), layout)
+            package.write("manifest.json", {"creator": "Asobo", "title": f"{n:05d}"})
+            package.write(
+                "data/info/ContentHistory.json",
+                {"items": [{"type": "airport", "content": icao}]},
+            )
+        else:  # Streamed, BGL seul
+            name = f"fs24-asobo-bgl-{n:05d}"
+            package = PackageWriter(os.path.join(roots["StreamedPackages"], name), layout)
+            package.write("manifest.json", {"creator": "Asobo", "title": f"{n:05d}"})
+        package.write(f"scenery/world/ap_{n:05d}.bgl", build_bgl([icao]))
+        package.close()
+
+    for n in range(aircraft):
+        type_code, model, title_prefix = AIRCRAFT_TYPES[n % len(AIRCRAFT_TYPES)]
+        creator = rng.choice(CREATORS)
+        root_name = "Community" if n % 4 else "OneStore"
+        name = f"{creator}-liveries-{type_code.lower()}-{n:05d}"
+        package = PackageWriter(os.path.join(roots[root_name], name), layout)
+        package.write("manifest.json", {"creator": creator, "title": f"{model} liveries"})
+        package.write(
+            f"SimObjects/Airplanes/{type_code}_{n:05d}/aircraft.cfg",
+            _aircraft_cfg(rng, type_code, model, title_prefix, liveries),
+        )
+        package.close()
+
+    for n in range(noise):
+        name = NOISE_PACKAGES[n % len(NOISE_PACKAGES)].format(n=n)
+        package = PackageWriter(os.path.join(roots["Community"], name), layout)
+        package.write("manifest.json", {"creator": "Asobo", "title": f"{n:05d}"})
+        package.write("SimObjects/Airplanes/X/aircraft.cfg", "[FLTSIM.0]\ntitle = AI\n")
+        package.close()
+
+    return {
+        "roots": [roots[name] for name in ROOT_NAMES],
+        "airports": sorted(icaos),
+        "liveries": aircraft * liveries,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Génère une arborescence MSFS synthétique (benchmarks des scanners)."
+    )
+    parser.add_argument("root", help="dossier de destination")
+    parser.add_argument("--airports", type=int, default=200)
+    parser.add_argument("--aircraft", type=int, default=100)
+    parser.add_argument("--liveries", type=int, default=4, help="livrées par aircraft.cfg")
+    parser.add_argument("--noise", type=int, default=20, help="packages à écarter")
+    parser.add_argument("--no-layout", action="store_true", help="sans layout.json")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    tree = generate_tree(
+        args.root,
+        airports=args.airports,
+        aircraft=args.aircraft,
+        liveries=args.liveries,
+        noise=args.noise,
+        layout=not args.no_layout,
+        seed=args.seed,
+    )
+    print(
+        f"{len(tree['airports'])} aéroport(s), {tree['liveries']} livrée(s) : "
+        + ", ".join(tree["roots"])
+    )
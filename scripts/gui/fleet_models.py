@@ -0,0 +1,170 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer
+from scripts.utils.registration import normalize_registration
+
+# Délai entre la dernière frappe et le filtrage des listes
+SEARCH_DEBOUNCE_MS = 150
+# Rôle de la clé primaire de chaque ligne (ICAO, registration + chemin + FLTSIM)
+KEY_ROLE = Qt.UserRole + 1
+
+
+def airport_key(airport):
+    return str(airport.get("icao", "")).strip().upper()
+
+
+def aircraft_key(aircraft):
+    """
+    Registration normalisée + dossier de la livrée + section [FLTSIM.N] : les livrées
+    d'un même aircraft.cfg partagent le dossier, et souvent une registration vide.
+    """
+    registration = normalize_registration(aircraft.get("registration", "")) or ""
+    return f"{registration}|{aircraft.get('path', '')}|{aircraft.get('fltsim', '')}"
+
+
+def move_records(source, target, keys, key):
+    """
+    Déplace de source vers target les enregistrements dont la clé est dans keys,
+    par opérations sur ensembles (O(n)) ; ordre conservé, pas de doublon dans target.
+    Retourne (nouvelle source, nouvelle cible).
+    """
+    keys = set(keys)
+    target_keys = {key(record) for record in target}
+    remaining = []
+    moved = []
+    for record in source:
+        k = key(record)
+        if k not in keys:
+            remaining.append(record)
+        elif k not in target_keys:
+            target_keys.add(k)
+            moved.append(record)
+    return remaining, list(target) + moved
+
+
+class FleetListModel(QAbstractListModel):
+    """
+    Liste cochable d'enregistrements (avions ou aéroports) pour un QListView.
+    Libellés, textes de recherche et clés sont calculés une fois par enregistrement ;
+    les cases cochées sont gardées dans le modèle, par clé (elles survivent au filtrage).
+    Le filtre est une seule passe sur les textes de recherche, restreinte aux lignes
+    déjà visibles quand la recherche s'allonge.
+    """
+
+    def __init__(self, label, search_text, key, parent=None):
+        super().__init__(parent)
+        self._label = label  # record -> libellé affiché
+        self._search_text = search_text  # record -> texte comparé à la recherche
+        self._key = key  # record -> clé primaire
+        self._records = []
+        self._labels = []
+        self._texts = []
+        self._keys = []
+        self._checked = set()  # clés cochées
+        self._visible = []  # lignes sources affichées
+        self._needle = ""
+
+    # --- Qt ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._visible[index.row()]
+        if role == Qt.DisplayRole:
+            return self._labels[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._keys[row] in self._checked else Qt.Unchecked
+        if role == Qt.UserRole:
+            return self._records[row]
+        if role == KEY_ROLE:
+            return self._keys[row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        row = self._visible[index.row()]
+        if value == Qt.Checked:
+            self._checked.add(self._keys[row])
+        else:
+            self._checked.discard(self._keys[row])
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    # --- Contenu ---
+
+    def set_records(self, records):
+        """Remplace tous les enregistrements (cases décochées, filtre courant conservé)."""
+        self.beginResetModel()
+        self._records = list(records)
+        self._labels = [self._label(r) for r in self._records]
+        self._texts = [self._search_text(r).lower() for r in self._records]
+        self._keys = [self._key(r) for r in self._records]
+        self._checked = set()
+        self._visible = self._matching(range(len(self._records)), self._needle)
+        self.endResetModel()
+
+    def append_record(self, record):
+        """Ajoute un enregistrement en fin de liste, sans toucher aux cases cochées."""
+        row = len(self._records)
+        self._records.append(record)
+        self._labels.append(self._label(record))
+        self._texts.append(self._search_text(record).lower())
+        self._keys.append(self._key(record))
+        if self._needle in self._texts[row]:
+            position = len(self._visible)
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._visible.append(row)
+            self.endInsertRows()
+
+    def records(self):
+        return list(self._records)
+
+    def checked_keys(self):
+        return set(self._checked)
+
+    def checked_records(self):
+        checked = self._checked
+        return [r for r, k in zip(self._records, self._keys) if k in checked]
+
+    # --- Filtre ---
+
+    def _matching(self, rows, needle):
+        if not needle:
+            return list(rows)
+        texts = self._texts
+        return [row for row in rows if needle in texts[row]]
+
+    def set_search(self, text):
+        needle = (text or "").strip().lower()
+        if needle == self._needle:
+            return
+        # Recherche prolongée : seules les lignes visibles peuvent encore correspondre
+        candidates = (
+            self._visible
+            if self._needle and self._needle in needle
+            else range(len(self._records))
+        )
+        self.beginResetModel()
+        self._visible = self._matching(candidates, needle)
+        self._needle = needle
+        self.endResetModel()
+
+
+def debounce_search(line_edit, callback, delay_ms=SEARCH_DEBOUNCE_MS):
+    """
+    Appelle callback(texte) quand la saisie de line_edit s'arrête depuis delay_ms :
+    une frappe rapide ne déclenche qu'un seul filtrage. Retourne le QTimer.
+    """
+    timer = QTimer(line_edit)
+    timer.setSingleShot(True)
+    timer.setInterval(delay_ms)
+    timer.timeout.connect(lambda: callback(line_edit.text()))
+    line_edit.textChanged.connect(lambda _text: timer.start())
+    return timer
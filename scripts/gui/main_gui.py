@@ -23,6 +23,7 @@ from PyQt5.QtWidgets import (
     QFrame,
     QLineEdit,
     QListWidgetItem,
+    QListView,
     QToolButton,
     QFileDialog,
     QSizePolicy,
@@ -34,7 +35,7 @@ from PyQt5.QtWidgets import (
     QComboBox,
 )
 from PyQt5.QtWidgets import QMessageBox
-from PyQt5.QtCore import Qt, QUrl, QObject, pyqtSlot, QMetaObject
+from PyQt5.QtCore import Qt, QUrl, QObject, pyqtSlot, pyqtSignal, QMetaObject, QThread
 from PyQt5.QtGui import QFont
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtWebChannel import QWebChannel
@@ -42,6 +43,19 @@ from PyQt5.QtGui import QPixmap
 from scripts.gui.flight_card import Ui_FlightCardDialog
 from datetime import datetime, timezone
 from scripts.gui.flight_planning_line import FlightPlanningLineWidget
+from scripts.gui.fleet_models import (
+    FleetListModel,
+    debounce_search,
+    airport_key,
+    aircraft_key,
+    move_records,
+)
+from scripts.utils.data_registry import IMAGES_DIR, data_registry
+from scripts.utils.registration import normalize_registration, registration_normalizer
+from scripts.utils.aircraft_types import aircraft_type_classifier
+from scripts.utils.scan_cache import file_fingerprint
+from scripts.utils.log_helper import get_logger
+from scripts.utils.thumbnail_cache import THUMBNAILS_DIR, ThumbnailCache
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QFrame
 
 
@@ -50,12 +64,9 @@ def tr(txt):  # Remplace par ta vraie fonction de traduction/multi-langue !
     return txt
 
 
-# À personnaliser selon ton arborescence locale
-aircraft_img_dir = r"C:\Users\Bertrand\Documents\SimRoster\images\aircraft"
-company_img_dir = r"C:\Users\Bertrand\Documents\SimRoster\images\company"
-callsign_csv_path = (r"C:\Users\Bertrand\Documents\SimRoster\data\airline_callsign_full.csv")
-airports_csv_path = r"C:\Users\Bertrand\Documents\SimRoster\data\airports.csv"
-gates_csv_path = r"C:\Users\Bertrand\Documents\SimRoster\data\airport_gates_db.csv"
+# Images de la carte de vol (relatives au projet)
+aircraft_img_dir = os.path.join(IMAGES_DIR, "aircraft")
+company_img_dir = os.path.join(IMAGES_DIR, "company")
 
 
 CONFIG_PATH = "data/settings_paths.json"
@@ -102,7 +113,7 @@ PANEL_STYLESHEET = """
         border-radius: 6px;
         font-size: 14px;
     }
-    QListWidget {
+    QListWidget, QListView {
         background: #343842;
         color: #fff;
         border: none;
@@ -129,9 +140,13 @@ PANEL_STYLESHEET = """
         min-width: 120px;
     }
 """
-CALLSIGN_MAP = {}  # ICAO compagnie → {company, callsign, iata}
-AIRPORTS_CSV = {}  # ICAO airport → dict row
-AIRPORT_GATES = {}  # (ICAO airport, ICAO compagnie) → list of gates
+# Données partagées, chargées au premier accès : DATA.airports (AirportRepository :
+# base airports.csv + aéroports du scan), DATA.airlines (AirlineRegistry),
+# DATA.gates ((ICAO airport, ICAO compagnie) → gates), plus "aircraft" (scan avions)
+# et "flights" (vols FR24 mock, indexés par registration)
+DATA = data_registry()
+logger = get_logger("main_gui")
+THUMBNAILS = ThumbnailCache()  # miniatures carte de vol générées par le scan avions
 STYLE_FLIGHTCARD = """
 QDialog {
     background: #23252b;
@@ -201,44 +216,6 @@ QPushButton:hover, QDialogButtonBox QPushButton:hover {
 """
 
 
-# --- LOADERS ---
-
-def load_callsign_map(path):
-    global CALLSIGN_MAP
-    with open(path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            icao = row["ICAO"].strip().upper()
-            CALLSIGN_MAP[icao] = {
-                "company": row["Companyname"].strip(),
-                "callsign": row["Callsign"].strip().upper(),
-                "iata": row["IATA"].strip().upper(),
-            }
-
-def load_airports_csv(path):
-    global AIRPORTS_CSV
-    with open(path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            icao = row["icao"].strip().upper()
-            AIRPORTS_CSV[icao] = row
-
-def load_airport_gates_csv(path):
-    global AIRPORT_GATES
-    with open(path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            icao = row["icao"].strip().upper()
-            airline_icao = row["airline_icao"].strip().upper()
-            gates = [g.strip() for g in row["gates"].split("|") if g.strip()]
-            AIRPORT_GATES[(icao, airline_icao)] = gates
-
-# --- À APPELER UNE FOIS AU LANCEMENT ---
-load_callsign_map(callsign_csv_path)
-load_airports_csv(airports_csv_path)
-load_airport_gates_csv(gates_csv_path)
-
-
 def parse_iso_datetime(iso_string):
     try:
         if iso_string.endswith("Z"):
@@ -371,14 +348,14 @@ def get_company_name(flight_data):
     if company_name:
         return company_name
     airline_icao = flight_data.get("airline_icao", "")
-    if airline_icao and airline_icao in CALLSIGN_MAP:
-        return CALLSIGN_MAP[airline_icao]["company"]
+    airline = DATA.airlines.by_icao(airline_icao) if airline_icao else None
+    if airline:
+        return airline["company"]
     flight_number = flight_data.get("flight_number", "")
     if flight_number and len(flight_number) > 2:
-        prefix_guess = flight_number[:2].upper()
-        for icao, data in CALLSIGN_MAP.items():
-            if data["iata"] == prefix_guess:
-                return data["company"]
+        airline = DATA.airlines.by_iata(flight_number[:2])
+        if airline:
+            return airline["company"]
     return "Unknown"
 
 def get_flight_callsign(flight_data):
@@ -387,7 +364,7 @@ def get_flight_callsign(flight_data):
         airline_icao = flight_data.get("airline_icao", "")
         if not airline_icao and len(callsign) > 3:
             airline_icao = callsign[:3].upper()
-        company_name = CALLSIGN_MAP.get(airline_icao, {}).get("company", "")
+        company_name = (DATA.airlines.by_icao(airline_icao) or {}).get("company", "")
         if company_name:
             return f"{callsign} / {company_name}"
         else:
@@ -396,17 +373,15 @@ def get_flight_callsign(flight_data):
     airline_icao = flight_data.get("airline_icao", "")
     if not airline_icao:
         if flight_number and len(flight_number) > 2:
-            prefix_guess = flight_number[:2].upper()
-            for icao, data in CALLSIGN_MAP.items():
-                if data["iata"] == prefix_guess:
-                    airline_icao = icao
-                    break
+            airline = DATA.airlines.by_iata(flight_number[:2])
+            if airline:
+                airline_icao = airline["icao"]
     if airline_icao and flight_number:
         number_part = flight_number
         if number_part.upper().startswith(airline_icao):
             number_part = number_part[len(airline_icao) :]
         callsign_code = f"{airline_icao}{number_part}"
-        company_name = CALLSIGN_MAP.get(airline_icao, {}).get("company", "")
+        company_name = (DATA.airlines.by_icao(airline_icao) or {}).get("company", "")
         if company_name:
             return f"{callsign_code} / {company_name}"
         else:
@@ -420,34 +395,73 @@ def company_logo_filename(company_name):
     return company_name.lower().replace(" ", "-") + ".png"
 
 def pick_gate(icao, airline_icao):
-    gates = AIRPORT_GATES.get((icao.upper(), airline_icao.upper()), [])
+    gates = DATA.gates.get((icao.upper(), airline_icao.upper()), [])
     if gates:
         return random.choice(gates)
     return "Unknown"
 
-def run_airport_scan(progress_callback=None):
-    # -- Lancement SYNCHRONE du scanner (bloque jusqu’à la fin)
-    script_path = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "../cli/airport_scanner.py")
+def run_airport_scan(progress_callback=None, cancel=None):
+    """
+    Scan unifié aéroports + avions, dans le processus courant (bloquant : à lancer
+    depuis ScanWorker). progress_callback(done, total, item, results) est appelé
+    pour chaque package terminé. Retourne {"airports": [...], "aircraft": [...]},
+    ou None si cancel (threading.Event) a été levé.
+    """
+    # Import différé : la fenêtre principale s'ouvre sans charger les scanners
+    from scripts.cli.content_scanner import run_configured_scan
+    from scripts.utils.log_helper import configure_logging
+    from scripts.utils.config_helper import load_config
+
+    config = load_config()
+    configure_logging(config.get("log_level"))
+    logger.info("Lancement du scanner automatique...")
+    # La GUI possède les miniatures carte de vol : générées à chaque scan
+    return run_configured_scan(
+        config, progress=progress_callback, cancel=cancel, thumbnails_dir=THUMBNAILS_DIR
     )
-    import sys
-    import subprocess
 
-    print("[BOOT] Lancement du scanner automatique...")
-    try:
-        result = subprocess.run(
-            [sys.executable, script_path],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        print("[BOOT] Scanner output:\n", result.stdout)
-        if result.stderr.strip():
-            print("[BOOT] Scanner errors:\n", result.stderr)
-    except subprocess.CalledProcessError as e:
-        print("[ERROR][BOOT] Scanner failed:", e)
-        print("[ERROR][BOOT] Output:", e.stdout)
-        print("[ERROR][BOOT] Stderr:", e.stderr)
+class ScanWorker(QThread):
+    """
+    Scan en arrière-plan : la fenêtre principale reste utilisable pendant le scan.
+    progress(done, total, package) et package_scanned(package, résultats) sont émis
+    depuis les threads du scan ; Qt les remet dans le thread GUI.
+    """
+
+    progress = pyqtSignal(int, int, str)
+    package_scanned = pyqtSignal(str, object)
+    scan_finished = pyqtSignal(object)
+    scan_failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """
+        Interrompt le scan : les packages en file ne sont pas analysés, seuls ceux
+        en cours se terminent (résultats précédents conservés).
+        """
+        self._cancelled.set()
+
+    def _on_package(self, done, total, item, results):
+        self.progress.emit(done, total, item)
+        self.package_scanned.emit(item, results)
+
+    def run(self):
+        try:
+            outputs = run_airport_scan(
+                progress_callback=self._on_package, cancel=self._cancelled
+            )
+        except Exception as e:
+            import traceback
+
+            logger.exception("Échec du scanner : %s", e)
+            self.scan_failed.emit(f"{e}\n\n{traceback.format_exc()}")
+            return
+        if outputs is None:
+            logger.info("Scan interrompu")
+            return
+        self.scan_finished.emit(outputs)
 
 class AirportDataBridge(QObject):
     def __init__(self, get_airports_func, get_selected_icaos_func):
@@ -512,83 +526,8 @@ def safe_float(val):
         return None
 
 def load_airports_from_json_or_csv():
-    airports = []
-    results_path = os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__), "../../results/airport_scanresults.json"
-        )
-    )
-    csv_path = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "../../data/airports.csv")
-    )
-
-    # Index CSV pour enrichissement rapide par ICAO
-    icao_to_csv = {}
-    try:
-        with open(csv_path, encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("icao", ""):
-                    icao_to_csv[row["icao"].upper()] = row
-    except Exception as e:
-        print("Erreur création index CSV :", e)
-
-    if os.path.exists(results_path):
-        try:
-            with open(results_path, encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list) and data:
-                    for entry in data:
-                        icao = entry.get("icao", "").upper()
-                        csv_row = icao_to_csv.get(icao, {})
-                        if (
-                            "icao" in entry
-                            and "name" in entry
-                            and "latitude" in csv_row
-                            and "longitude" in csv_row
-                        ):
-                            airports.append(
-                                {
-                                    "icao": entry["icao"],
-                                    "name": entry["name"],
-                                    "city": csv_row.get("city", ""),
-                                    "country": csv_row.get("country", ""),
-                                    "latitude": safe_float(csv_row.get("latitude", "")),
-                                    "longitude": safe_float(
-                                        csv_row.get("longitude", "")
-                                    ),
-                                    "type": csv_row.get("type", ""),
-                                }
-                            )
-            print(
-                f"[INFO] {len(airports)} aéroports enrichis depuis {results_path} + {csv_path}"
-            )
-            return airports
-        except Exception as e:
-            print("[WARN] Erreur lecture du JSON scan results :", e)
-
-    # Fallback : charge tout le CSV (si JSON absent ou invalide)
-    try:
-        with open(csv_path, encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("icao", "") and row.get("name", ""):
-                    airports.append(
-                        {
-                            "icao": row["icao"],
-                            "name": row["name"],
-                            "city": row.get("city", ""),
-                            "country": row.get("country", ""),
-                            "latitude": safe_float(row.get("latitude", "")),
-                            "longitude": safe_float(row.get("longitude", "")),
-                            "type": row.get("type", ""),
-                        }
-                    )
-
-        print(f"[INFO] {len(airports)} aéroports chargés depuis {csv_path}")
-    except Exception as e:
-        print("Erreur chargement CSV aéroports (fallback) :", e)
-    return airports
+    """Aéroports du dernier scan (enrichis par airports.csv), ou toute la base sans scan."""
+    return DATA.airports.scanned()
 
 def load_aircraft_from_json_or_csv():
     """
@@ -618,6 +557,41 @@ def load_aircraft_from_json_or_csv():
             print("[DEBUG] Erreur ouverture aircraft_scanresults.json :", e)
     return []  # Fallback : vide
 
+# Avions du scan : relus au premier accès, puis invalidés à la fin de chaque scan.
+# Les panels travaillent sur des copies (les listes Available sont modifiées sur place).
+DATA.register("aircraft", load_aircraft_from_json_or_csv)
+
+FR24_FLIGHTS_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../results/mock_fr24_flights.json")
+)
+
+
+def load_fr24_flights(path=FR24_FLIGHTS_PATH):
+    """
+    Vols mock FR24 et leur index registration normalisée -> vols, construit une fois
+    par chargement. fingerprint permet de recharger si le fichier a changé.
+    """
+    fingerprint = file_fingerprint(path)
+    with open(path, encoding="utf-8") as f:
+        flights = json.load(f)
+    return {
+        "fingerprint": fingerprint,
+        "flights": flights,
+        "by_registration": registration_normalizer().index(flights),
+    }
+
+
+def fr24_flights():
+    """Vols FR24 du registre partagé, rechargés si le fichier a changé sur disque."""
+    data = DATA.get("flights")
+    if data["fingerprint"] != file_fingerprint(FR24_FLIGHTS_PATH):
+        DATA.invalidate("flights")
+        data = DATA.get("flights")
+    return data
+
+# Vols FR24 (mock) : lus et indexés au premier accès
+DATA.register("flights", load_fr24_flights)
+
 class SplashScanDialog(QDialog):
     def __init__(self, text="Scanning your add-on folders...", parent=None):
         super().__init__(parent)
@@ -641,8 +615,13 @@ class SplashScanDialog(QDialog):
         """
         )
 
-    def set_progress(self, value):
-        pass  # Plus tard tu pourras mettre à jour une vraie barre de progression ici
+    def set_progress(self, done, total=100, item=""):
+        """Barre déterminée dès que le nombre de packages est connu."""
+        if total > 0:
+            self.progress.setRange(0, total)
+            self.progress.setValue(done)
+        if item:
+            self.label.setText(f"Scanning {done}/{total}: {item}")
 
 # ================= SETTINGS PANEL =====================
 class SettingsPanel(QWidget):
@@ -801,6 +780,20 @@ class FleetManagerPanel(QWidget):
         self.webview = webview
         self.restore_selection()  # Persistance
 
+        # Modèles des quatre listes : cases cochées et filtre gérés dans le modèle
+        self.aircraft_available_model = FleetListModel(
+            self._aircraft_label, self._aircraft_search_text, aircraft_key, self
+        )
+        self.aircraft_selected_model = FleetListModel(
+            self._aircraft_label, self._aircraft_search_text, aircraft_key, self
+        )
+        self.airport_available_model = FleetListModel(
+            self._airport_label, self._airport_search_text, airport_key, self
+        )
+        self.airport_selected_model = FleetListModel(
+            self._airport_label, self._airport_search_text, airport_key, self
+        )
+
         # =========== Layout principal ===========
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(38, 26, 38, 26)
@@ -821,11 +814,10 @@ class FleetManagerPanel(QWidget):
         self.aircraft_search = QLineEdit()
         self.aircraft_search.setPlaceholderText("Search Aircraft...")
     
-        self.aircraft_search.textChanged.connect(self.filter_aircraft)
+        debounce_search(self.aircraft_search, self.filter_aircraft)
         main_layout.addWidget(self.aircraft_search)
 
-        self.list_aircraft_available = QListWidget()
-        self.list_aircraft_available.setSelectionMode(QListWidget.NoSelection)
+        self.list_aircraft_available = self._make_list_view(self.aircraft_available_model)
         main_layout.addWidget(self.list_aircraft_available)
 
         # --- Aircraft buttons (↓ Add, ↑ Remove, + Manual Add à droite) ---
@@ -851,8 +843,7 @@ class FleetManagerPanel(QWidget):
         lbl_aircraft_sel = QLabel("Selected Aircraft")
         main_layout.addWidget(lbl_aircraft_sel)
 
-        self.list_aircraft_selected = QListWidget()
-        self.list_aircraft_selected.setSelectionMode(QListWidget.NoSelection)
+        self.list_aircraft_selected = self._make_list_view(self.aircraft_selected_model)
         main_layout.addWidget(self.list_aircraft_selected)
 
         # ---------- Available Airports ----------
@@ -860,10 +851,9 @@ class FleetManagerPanel(QWidget):
         main_layout.addWidget(lbl_airport)
         self.airport_search = QLineEdit()
         self.airport_search.setPlaceholderText("Search ICAO or name...")
-        self.airport_search.textChanged.connect(self.filter_airports)
+        debounce_search(self.airport_search, self.filter_airports)
         main_layout.addWidget(self.airport_search)
-        self.list_airport_available = QListWidget()
-        self.list_airport_available.setSelectionMode(QListWidget.NoSelection)
+        self.list_airport_available = self._make_list_view(self.airport_available_model)
         main_layout.addWidget(self.list_airport_available)
 
         # --- Airport buttons (↓ Add, ↑ Remove, + Manual Add à droite) ---
@@ -894,8 +884,7 @@ class FleetManagerPanel(QWidget):
 
         lbl_airport_sel = QLabel("Selected Airports")
         main_layout.addWidget(lbl_airport_sel)
-        self.list_airport_selected = QListWidget()
-        self.list_airport_selected.setSelectionMode(QListWidget.NoSelection)
+        self.list_airport_selected = self._make_list_view(self.airport_selected_model)
         main_layout.addWidget(self.list_airport_selected)
 
         # ---------- Reset All ----------
@@ -932,208 +921,110 @@ class FleetManagerPanel(QWidget):
             label += f" – {engine}"
         return label
 
+    def _aircraft_label(self, ac):
+        return self.clean_aircraft_label(
+            ac.get("registration", ""),
+            ac.get("model", ""),
+            ac.get("company", ""),
+            ac.get("engine", ""),
+        )
+
+    def _aircraft_search_text(self, ac):
+        return f"{ac.get('registration', '')}\n{ac.get('model', '')}"
+
+    def _airport_label(self, ap):
+        return self.clean_airport_label(ap["icao"], ap["name"])
+
+    def _airport_search_text(self, ap):
+        return f"{ap['icao']}\n{ap['name']}"
+
+    def _make_list_view(self, model):
+        view = QListView()
+        view.setModel(model)
+        view.setSelectionMode(QListView.NoSelection)
+        view.setUniformItemSizes(True)  # pas de mesure ligne par ligne (17k aéroports)
+        return view
+
     def _refresh_aircraft_list(self):
-        self.list_aircraft_available.clear()
-        for ac in self.available_aircraft:
-            label = self.clean_aircraft_label(
-                ac.get("registration", ""),
-                ac.get("model", ""),
-                ac.get("company", ""),
-                ac.get("engine", ""),
-            )
-            item = QListWidgetItem(label)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.list_aircraft_available.addItem(item)
+        self.aircraft_available_model.set_records(self.available_aircraft)
 
     def _refresh_selected_aircraft_list(self):
-        self.list_aircraft_selected.clear()
-        for ac in self.selected_aircraft:
-            label = self.clean_aircraft_label(
-                ac.get("registration", ""),
-                ac.get("model", ""),
-                ac.get("company", ""),
-                ac.get("engine", ""),
-            )
-            item = QListWidgetItem(label)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.list_aircraft_selected.addItem(item)
+        self.aircraft_selected_model.set_records(self.selected_aircraft)
 
     def _refresh_airport_list(self):
-        self.list_airport_available.clear()
-        for ap in self.available_airports:
-            label = self.clean_airport_label(ap["icao"], ap["name"])
-            item = QListWidgetItem(label)
-            # Active la case à cocher (checked = non coché par défaut)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.list_airport_available.addItem(item)
+        self.airport_available_model.set_records(self.available_airports)
+        # ICAO déjà présents (Available + Selected) : test en O(1) pendant le scan
+        self._known_icaos = {airport_key(a) for a in self.available_airports}
+        self._known_icaos.update(airport_key(a) for a in self.selected_airports)
 
     def _refresh_selected_airport_list(self):
-        self.list_airport_selected.clear()
-        for ap in self.selected_airports:
-            label = self.clean_airport_label(ap["icao"], ap["name"])
-            item = QListWidgetItem(label)
-            # Ajoute la case à cocher pour chaque aéroport sélectionné
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            self.list_airport_selected.addItem(item)
+        self.airport_selected_model.set_records(self.selected_airports)
 
-    def add_aircraft(self):
-        """Déplace les avions cochés d'Available vers Selected (sans supprimer du JSON)."""
-        to_add = []
-        for i in range(self.list_aircraft_available.count()):
-            item = self.list_aircraft_available.item(i)
-            if item.checkState() == Qt.Checked:
-                label = item.text()
-                for ac in self.available_aircraft:
-                    ref_label = self.clean_aircraft_label(
-                        ac.get("registration", ""),
-                        ac.get("model", ""),
-                        ac.get("company", ""),
-                        ac.get("engine", ""),
-                    )
-                    if ref_label == label:
-                        to_add.append(ac)
-                        break
-        for ac in to_add:
-            if ac not in self.selected_aircraft:
-                self.selected_aircraft.append(ac)
-            if ac in self.available_aircraft:
-                self.available_aircraft.remove(ac)
+    def _refresh_map(self):
+        """Un seul rafraîchissement de la carte (QWebChannel, sans rechargement)."""
+        if self.webview:
+            self.webview.page().runJavaScript("window.refreshMap && window.refreshMap();")
+
+    def _move_aircraft(self, keys, to_selected):
+        """Déplacement groupé par clé : une mise à jour des deux listes et une sauvegarde."""
+        if not keys:
+            return
+        if to_selected:
+            self.available_aircraft, self.selected_aircraft = move_records(
+                self.available_aircraft, self.selected_aircraft, keys, aircraft_key
+            )
+        else:
+            self.selected_aircraft, self.available_aircraft = move_records(
+                self.selected_aircraft, self.available_aircraft, keys, aircraft_key
+            )
         self._refresh_aircraft_list()
         self._refresh_selected_aircraft_list()
         self.save_selection()
 
+    def _move_airports(self, keys, to_selected):
+        """Déplacement groupé par ICAO : listes, sauvegarde et carte rafraîchies une fois."""
+        if not keys:
+            return
+        if to_selected:
+            self.available_airports, self.selected_airports = move_records(
+                self.available_airports, self.selected_airports, keys, airport_key
+            )
+        else:
+            self.selected_airports, self.available_airports = move_records(
+                self.selected_airports, self.available_airports, keys, airport_key
+            )
+        self._refresh_airport_list()
+        self._refresh_selected_airport_list()
+        self.save_selection()
+        self._refresh_map()
+
+    def add_aircraft(self):
+        """Déplace les avions cochés d'Available vers Selected (sans supprimer du JSON)."""
+        self._move_aircraft(self.aircraft_available_model.checked_keys(), to_selected=True)
+
     def remove_aircraft(self):
         """Déplace les avions cochés de Selected vers Available (sans supprimer du JSON)."""
-        to_remove = []
-        for i in range(self.list_aircraft_selected.count()):
-            item = self.list_aircraft_selected.item(i)
-            if item.checkState() == Qt.Checked:
-                label = item.text()
-                for ac in self.selected_aircraft:
-                    ref_label = self.clean_aircraft_label(
-                        ac.get("registration", ""),
-                        ac.get("model", ""),
-                        ac.get("company", ""),
-                        ac.get("engine", ""),
-                    )
-                    if ref_label == label:
-                        to_remove.append(ac)
-                        break
-        for ac in to_remove:
-            if ac not in self.available_aircraft:
-                self.available_aircraft.append(ac)
-            if ac in self.selected_aircraft:
-                self.selected_aircraft.remove(ac)
-        self._refresh_aircraft_list()
-        self._refresh_selected_aircraft_list()
-        self.save_selection()
+        self._move_aircraft(self.aircraft_selected_model.checked_keys(), to_selected=False)
 
     def add_airport(self):
         try:
-            to_add = []
-            for i in range(self.list_airport_available.count()):
-                item = self.list_airport_available.item(i)
-                if item.checkState() == Qt.Checked:
-                    label = item.text()
-                    for ap in self.available_airports:
-                        if self.clean_airport_label(ap["icao"], ap["name"]) == label:
-                            to_add.append(ap)
-                            break
-            for ap in to_add:
-                if ap not in self.selected_airports:
-                    self.selected_airports.append(ap)
-                if ap in self.available_airports:
-                    self.available_airports.remove(ap)
-            self.save_selection()
-            self._refresh_airport_list()
-            self._refresh_selected_airport_list()
-
-            # --- Refresh dynamique de la carte ---
-            if hasattr(self, 'webview') and self.webview:
-                self.webview.page().runJavaScript("window.refreshMap && window.refreshMap();")
-
-            # PATCH FINAL : MAJ carte via QWebChannel sans reload
-            try:
-                print("[DEBUG] MAJ JS via QWebChannel (refreshMap())")
-                if (
-                    self.webview
-                    and hasattr(self.webview, "page")
-                    and callable(self.webview.page().runJavaScript)
-                ):
-                    self.webview.page().runJavaScript("if(window.refreshMap) refreshMap();")
-                else:
-                    print("[WARN] webview.page() ou runJavaScript indisponible")
-            except Exception as e:
-                import traceback
-
-                print("[ERROR] Exception lors de l'appel refreshMap JS:", e)
-                print(traceback.format_exc())
+            self._move_airports(self.airport_available_model.checked_keys(), to_selected=True)
         except Exception as e:
             import traceback
 
             print("[CRITICAL] Crash dans add_airport():", e)
             print(traceback.format_exc())
-            from PyQt5.QtWidgets import QMessageBox
-
             QMessageBox.critical(self, "Erreur critique", f"Crash dans add_airport():\n{e}")
 
     def remove_airport(self):
         try:
-            to_remove = []
-            for i in range(self.list_airport_selected.count()):
-                item = self.list_airport_selected.item(i)
-                if item.checkState() == Qt.Checked:
-                    label = item.text()
-                    for ap in self.selected_airports:
-                        if self.clean_airport_label(ap["icao"], ap["name"]) == label:
-                            to_remove.append(ap)
-                            break
-            for ap in to_remove:
-                if ap in self.selected_airports:
-                    self.selected_airports.remove(ap)
-                if ap not in self.available_airports:
-                    self.available_airports.append(ap)
-            self._refresh_airport_list()
-            self._refresh_selected_airport_list()
-
-            self.save_selection()  # <<< AJOUT OBLIGATOIRE ICI ! <<<
-
-            # --- Refresh dynamique de la carte ---
-            if hasattr(self, "webview") and self.webview:
-                self.webview.page().runJavaScript(
-                    "window.refreshMap && window.refreshMap();"
-                )
-
-            # PATCH FINAL : MAJ carte via QWebChannel sans reload
-            try:
-                print("[DEBUG] MAJ JS via QWebChannel (refreshMap())")
-                if (
-                    self.webview
-                    and hasattr(self.webview, "page")
-                    and callable(self.webview.page().runJavaScript)
-                ):
-                    self.webview.page().runJavaScript("if(window.refreshMap) refreshMap();")
-                else:
-                    print("[WARN] webview.page() ou runJavaScript indisponible")
-            except Exception as e:
-                import traceback
-
-                print("[ERROR] Exception lors de l'appel refreshMap JS:", e)
-                print(traceback.format_exc())
+            self._move_airports(self.airport_selected_model.checked_keys(), to_selected=False)
         except Exception as e:
             import traceback
 
             print("[CRITICAL] Crash dans remove_airport():", e)
             print(traceback.format_exc())
-            from PyQt5.QtWidgets import QMessageBox
-
-            QMessageBox.critical(
-                self, "Erreur critique", f"Crash dans remove_airport():\n{e}"
-            )
+            QMessageBox.critical(self, "Erreur critique", f"Crash dans remove_airport():\n{e}")
 
     def add_manual_airport_dialog(self):
         from PyQt5.QtWidgets import (
@@ -1265,26 +1156,10 @@ class FleetManagerPanel(QWidget):
             self.available_airports = sorted(
                 self.available_airports, key=lambda a: a["icao"]
             )
-            # Update JSON
-            results_path = os.path.abspath(
-                os.path.join(
-                    os.path.dirname(__file__), "../../results/airport_scanresults.json"
-                )
-            )
+            # Résultats du scan : JSON réécrit, dépôt partagé et listeners mis à jour
             try:
-                if os.path.exists(results_path):
-                    with open(results_path, encoding="utf-8") as f:
-                        json_data = json.load(f)
-                        if not isinstance(json_data, list):
-                            json_data = []
-                else:
-                    json_data = []
-                json_data = [a for a in json_data if a.get("icao", "").upper() != icao]
-                json_data.append(airport_entry)
-                json_data = sorted(json_data, key=lambda a: a["icao"])
-                with open(results_path, "w", encoding="utf-8") as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-            except Exception as e:
+                DATA.airports.add_scanned(airport_entry)
+            except OSError as e:
                 print(f"[ERROR][MANUAL ADD] Failed to update airport_scanresults.json: {e}")
 
             self._refresh_airport_list()
@@ -1301,97 +1176,47 @@ class FleetManagerPanel(QWidget):
         dlg.exec_()
 
     def lookup_airport_csv(self, icao):
-        """Cherche un ICAO dans airports.csv, retourne un dict (name, lat, lon) ou None si non trouvé."""
+        """Cherche un ICAO dans le dépôt aéroports (scan + airports.csv), retourne un dict (name, lat, lon) ou None."""
         icao = icao.strip().upper()
-        csv_path = self.airports_csv_path  # Adapte ici si variable différente !
-        if not os.path.isfile(csv_path):
+        row = DATA.airports.get(icao)
+        if row is None:
             return None
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("icao", "").strip().upper() == icao:
-                    # Les clés exactes dépendent de ton CSV, adapte si besoin.
-                    name = row.get("name", "")
-                    try:
-                        lat = float(row.get("latitude", ""))
-                        lon = float(row.get("longitude", ""))
-                    except ValueError:
-                        lat = lon = None
-                    return {
-                        "name": name,
-                        "latitude": lat,
-                        "longitude": lon,
-                    }
-        return None
+        lat, lon = row["latitude"], row["longitude"]
+        if lat is None or lon is None:
+            lat = lon = None
+        return {
+            "name": row["name"],
+            "latitude": lat,
+            "longitude": lon,
+        }
 
     def reset_all(self):
-        # Recharge la VRAIE liste à partir du JSON/CSV (propre !)
-        self.available_airports = load_airports_from_json_or_csv()
+        # Recharge la VRAIE liste à partir du JSON/CSV (propre !), relu s'il a changé
+        DATA.airports.reload_scanned(notify=False)
+        self.available_airports = DATA.airports.scanned()
         self.selected_airports.clear()
-        self.available_aircraft = load_aircraft_from_json_or_csv()
+        self.available_aircraft = list(DATA.get("aircraft"))
         self.selected_aircraft.clear()
         self.save_selection()
         self._refresh_aircraft_list()
         self._refresh_selected_aircraft_list()
         self._refresh_airport_list()
         self._refresh_selected_airport_list()
-        # --- Refresh dynamique de la carte ---
-        if hasattr(self, "webview") and self.webview:
-            self.webview.page().runJavaScript("window.refreshMap && window.refreshMap();")
+        self._refresh_map()
 
     def filter_aircraft(self, text):
         """
-        Filtre la liste des avions disponibles en conservant les cases à cocher,
-        conserve les ticks sur les items déjà cochés même après filtrage.
+        Filtre la liste des avions disponibles (registration ou modèle) ;
+        les cases cochées sont gardées par le modèle. Appelé après la saisie (debounce).
         """
-        checked_regs = set()
-        for i in range(self.list_aircraft_available.count()):
-            item = self.list_aircraft_available.item(i)
-            if item.checkState() == Qt.Checked:
-                reg = item.text().split(" - ")[0]
-                checked_regs.add(reg)
-
-        self.list_aircraft_available.clear()
-        for ac in self.available_aircraft:
-            if (
-                text.lower() in ac["registration"].lower()
-                or text.lower() in ac["model"].lower()
-            ):
-                label = self.clean_aircraft_label(ac["registration"], ac["model"])
-                item = QListWidgetItem(label)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                if ac["registration"] in checked_regs:
-                    item.setCheckState(Qt.Checked)
-                else:
-                    item.setCheckState(Qt.Unchecked)
-                self.list_aircraft_available.addItem(item)
+        self.aircraft_available_model.set_search(text)
 
     def filter_airports(self, text):
         """
-        Filtre la liste des aéroports disponibles en conservant les cases à cocher,
-        conserve les ticks sur les items déjà cochés même après filtrage.
+        Filtre la liste des aéroports disponibles (ICAO ou nom) ;
+        les cases cochées sont gardées par le modèle. Appelé après la saisie (debounce).
         """
-        # Mémorise les items cochés (via ICAO)
-        checked_icaos = set()
-        for i in range(self.list_airport_available.count()):
-            item = self.list_airport_available.item(i)
-            if item.checkState() == Qt.Checked:
-                # On retrouve l'ICAO du label propre
-                icao = item.text().split(" - ")[0]
-                checked_icaos.add(icao)
-
-        self.list_airport_available.clear()
-        for ap in self.available_airports:
-            if text.lower() in ap["icao"].lower() or text.lower() in ap["name"].lower():
-                label = self.clean_airport_label(ap["icao"], ap["name"])
-                item = QListWidgetItem(label)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                # Restaure le check si déjà coché avant filtrage
-                if ap["icao"] in checked_icaos:
-                    item.setCheckState(Qt.Checked)
-                else:
-                    item.setCheckState(Qt.Unchecked)
-                self.list_airport_available.addItem(item)
+        self.airport_available_model.set_search(text)
 
     def save_selection(self):
         os.makedirs(os.path.dirname(self.AIRPORTS_SELECTION_PATH), exist_ok=True)
@@ -1415,30 +1240,65 @@ class FleetManagerPanel(QWidget):
         try:
             with open(self.AIRCRAFT_SELECTION_PATH, encoding="utf-8") as f:
                 saved = json.load(f)
-                valid_regs = {a["registration"] for a in self.available_aircraft}
-                self.selected_aircraft = [
-                    a for a in saved if a["registration"] in valid_regs
-                ]
+                # Jointure par clé (registration + dossier + FLTSIM) ; sélection d'un
+                # ancien format (sans FLTSIM ni chemin) : par registration normalisée
+                # (FGKXS = F-GKXS), restreinte au dossier s'il est connu
+                available_by_key = {aircraft_key(a): a for a in self.available_aircraft}
+                available_by_reg = {}
+                for a in self.available_aircraft:
+                    available_by_reg.setdefault(
+                        normalize_registration(a["registration"]), []
+                    ).append(a)
+                selected_keys = set()
+                self.selected_aircraft = []
+                for a in saved:
+                    if a.get("path") and "fltsim" in a:
+                        candidates = [available_by_key.get(aircraft_key(a))]
+                    else:
+                        candidates = [
+                            match
+                            for match in available_by_reg.get(
+                                normalize_registration(a["registration"]), []
+                            )
+                            if not a.get("path") or match.get("path") == a["path"]
+                        ]
+                    for match in candidates:
+                        if match is not None and aircraft_key(match) not in selected_keys:
+                            self.selected_aircraft.append(match)
+                            selected_keys.add(aircraft_key(match))
+                            break
                 self.available_aircraft = [
                     a
                     for a in self.available_aircraft
-                    if a["registration"]
-                    not in {b["registration"] for b in self.selected_aircraft}
+                    if aircraft_key(a) not in selected_keys
                 ]
         except Exception:
             self.selected_aircraft = []
 
+    def add_scanned_airport(self, airport):
+        """Ajout progressif pendant le scan : aéroport nouveau et non sélectionné uniquement."""
+        icao = airport_key(airport)
+        if icao in self._known_icaos:
+            return False
+        self._known_icaos.add(icao)
+        self.available_airports.append(airport)
+        # Ajout en fin de liste sans reconstruire : les cases déjà cochées sont conservées
+        self.airport_available_model.append_record(airport)
+        return True
+
+    def reload_available(self, available_aircraft, available_airports):
+        """Remplace les listes Available par les résultats d'un nouveau scan (sélection conservée)."""
+        self.available_aircraft = list(available_aircraft)
+        self.available_airports = list(available_airports)
+        self.restore_selection()
+        self._refresh_aircraft_list()
+        self._refresh_selected_aircraft_list()
+        self._refresh_airport_list()
+        self._refresh_selected_airport_list()
+        self._refresh_map()
+
     def validate_airport_selection(self):
-        selected = []
-        for i in range(self.list_airport_available.count()):
-            item = self.list_airport_available.item(i)
-            if item.checkState() == Qt.Checked:
-                label = item.text()
-                for ap in self.available_airports:
-                    if self.clean_airport_label(ap["icao"], ap["name"]) == label:
-                        selected.append(ap)
-                        break
-        self.selected_airports = selected
+        self.selected_airports = self.airport_available_model.checked_records()
         self._refresh_selected_airport_list()
 
     def load_real_airports(self):
@@ -1447,7 +1307,7 @@ class FleetManagerPanel(QWidget):
         (ICAO, name, city, country, latitude, longitude, type), en enrichissant le JSON
         avec le CSV s'il manque des champs.
         """
-        return load_airports_from_json_or_csv()
+        return DATA.airports.scanned()
 
     def open_manual_add_aircraft_dialog(self):
         from PyQt5.QtWidgets import (
@@ -1487,7 +1347,10 @@ class FleetManagerPanel(QWidget):
         model_layout = QHBoxLayout()
         lbl_model = QLabel("Model*")
         model_combo = QComboBox()
-        model_combo.addItems(["A319", "A320", "A321"])
+        # Types de la table data/aircraft_type_aliases.csv (A319/A320/A321 si absente)
+        models = list(aircraft_type_classifier().models.values())
+        model_combo.addItems(models or ["A319", "A320", "A321"])
+        model_combo.setCurrentText("A320")
         model_combo.setMinimumWidth(120)
         model_layout.addWidget(lbl_model)
         model_layout.addWidget(model_combo)
@@ -1535,12 +1398,12 @@ class FleetManagerPanel(QWidget):
         btn_cancel.clicked.connect(dlg.reject)
 
         def try_add_aircraft():
-            registration = reg_edit.text().strip().upper()
+            registration = normalize_registration(reg_edit.text().strip().upper())
             if not registration or len(registration) < 3:
                 QMessageBox.warning(dlg, "Error", "Registration is required (min 3 chars).")
                 return
             if any(
-                a["registration"].upper() == registration
+                normalize_registration(a["registration"]) == registration
                 for a in self.available_aircraft + self.selected_aircraft
             ):
                 QMessageBox.warning(
@@ -1553,6 +1416,7 @@ class FleetManagerPanel(QWidget):
             new_ac = {
                 "registration": registration,
                 "model": model,
+                "icao_type": aircraft_type_classifier().resolve(model) or "",
                 "company": company,
                 "engine": engine,
             }
@@ -1698,27 +1562,10 @@ class FleetManagerPanel(QWidget):
             self.available_airports = sorted(
                 self.available_airports, key=lambda a: a["icao"]
             )
-            # Mise à jour du JSON
-            results_path = os.path.abspath(
-                os.path.join(
-                    os.path.dirname(__file__), "../../results/airport_scanresults.json"
-                )
-            )
+            # Résultats du scan : JSON réécrit, dépôt partagé et listeners mis à jour
             try:
-                if os.path.exists(results_path):
-                    with open(results_path, encoding="utf-8") as f:
-                        json_data = json.load(f)
-                        if not isinstance(json_data, list):
-                            json_data = []
-                else:
-                    json_data = []
-                # Remove any previous ICAO entry
-                json_data = [a for a in json_data if a.get("icao", "").upper() != icao]
-                json_data.append(airport_entry)
-                json_data = sorted(json_data, key=lambda a: a["icao"])
-                with open(results_path, "w", encoding="utf-8") as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-            except Exception as e:
+                DATA.airports.add_scanned(airport_entry)
+            except OSError as e:
                 print(f"[ERROR][MANUAL ADD] Failed to update airport_scanresults.json: {e}")
 
             self._refresh_airport_list()
@@ -1993,18 +1840,24 @@ class FlightPlanningPanel(QWidget):
             else arr_label.strip().upper()
         )
 
-        # 3. Charge la liste des vols mock FR24
-        fr24_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "../../results/mock_fr24_flights.json")
-        )
+        # 3. Charge la liste des vols mock FR24 (index registration construit au chargement)
         try:
-            with open(fr24_path, encoding="utf-8") as f:
-                all_flights = json.load(f)
+            flights = fr24_flights()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not load mock FR24 flights.\n{e}")
             return
+        all_flights = flights["flights"]
 
         # 4. Filtre selon les critères choisis (optionnel, à adapter)
+        # Registration : jointure par clé normalisée (accès dict dans l'index précalculé)
+        if registration and registration not in (
+            "",
+            "(NO AIRCRAFT SELECTED)",
+            "(NO AIRCRAFT FOUND)",
+        ):
+            all_flights = flights["by_registration"].get(
+                registration_normalizer().normalize(registration), []
+            )
         filtered = []
         for flight in all_flights:
             match = True
@@ -2020,12 +1873,6 @@ class FlightPlanningPanel(QWidget):
                 "(NO AIRPORTS FOUND)",
             ):
                 match = match and (flight.get("arr_icao", "").upper() == arr_icao)
-            if registration and registration not in (
-                "",
-                "(NO AIRCRAFT SELECTED)",
-                "(NO AIRCRAFT FOUND)",
-            ):
-                match = match and (flight.get("registration", "") == registration)
             if company_label and company_label not in (
                 "All airlines",
                 "(No airline)",
@@ -2107,8 +1954,8 @@ class FlightCardDialog(QDialog, Ui_FlightCardDialog):
         self.labelDepIcaoValue.setText(flight_data.get("dep_icao", "N/A"))
         self.labelDepAirportNameValue.setText(
             get_city_airport_display(
-                AIRPORTS_CSV.get(flight_data.get("dep_icao", ""), {}).get("city", ""),
-                AIRPORTS_CSV.get(flight_data.get("dep_icao", ""), {}).get("name", ""),
+                DATA.airports.get(flight_data.get("dep_icao", ""), {}).get("city", ""),
+                DATA.airports.get(flight_data.get("dep_icao", ""), {}).get("name", ""),
             )
         )
         dep_sched_dt = parse_iso_datetime(flight_data.get("scheduled_departure", ""))
@@ -2131,8 +1978,8 @@ class FlightCardDialog(QDialog, Ui_FlightCardDialog):
         self.labelArrIcaoValue.setText(flight_data.get("arr_icao", "N/A"))
         self.labelArrAirportNameValue.setText(
             get_city_airport_display(
-                AIRPORTS_CSV.get(flight_data.get("arr_icao", ""), {}).get("city", ""),
-                AIRPORTS_CSV.get(flight_data.get("arr_icao", ""), {}).get("name", ""),
+                DATA.airports.get(flight_data.get("arr_icao", ""), {}).get("city", ""),
+                DATA.airports.get(flight_data.get("arr_icao", ""), {}).get("name", ""),
             )
         )
         arr_sched_dt = parse_iso_datetime(flight_data.get("scheduled_arrival", ""))
@@ -2176,8 +2023,11 @@ class FlightCardDialog(QDialog, Ui_FlightCardDialog):
             self.labelCompanyImage.clear()
 
         # ==== Bloc image avion (si présent) ====
+        # Miniature pré-dimensionnée du scan (results/thumbnails), sinon image manuelle
         reg = flight_data.get("registration", "")
-        aircraft_img_path = f"{aircraft_img_dir}/{reg}.png" if reg else ""
+        aircraft_img_path = THUMBNAILS.path_for(reg) if reg else None
+        if reg and not aircraft_img_path:
+            aircraft_img_path = f"{aircraft_img_dir}/{reg}.png"
         if reg and os.path.exists(aircraft_img_path):
             self.labelAircraftImage.setPixmap(QPixmap(aircraft_img_path))
         else:
@@ -2326,8 +2176,8 @@ class MainWindow(QMainWindow):
         dashboard_layout.addStretch(1)
 
         # FLEET MANAGER PANEL
-        aircraft_init = load_aircraft_from_json_or_csv()
-        airports_init = load_airports_from_json_or_csv()
+        aircraft_init = list(DATA.get("aircraft"))
+        airports_init = DATA.airports.scanned()
         fleet_panel = FleetManagerPanel(
             available_aircraft=aircraft_init,
             selected_aircraft=[],
@@ -2335,6 +2185,8 @@ class MainWindow(QMainWindow):
             selected_airports=[],
             webview=self.web_view,
         )
+        self.fleet_panel = fleet_panel
+        DATA.airports.subscribe(self.on_airports_changed)
 
         # SETTINGS PANEL
         settings_panel = SettingsPanel(self)
@@ -2374,6 +2226,87 @@ class MainWindow(QMainWindow):
 
         self.set_panel(0)
 
+        # --- SCAN EN ARRIÈRE-PLAN (progression dans la barre d'état) ---
+        self.scan_worker = None
+        self.scan_splash = None
+        self.scan_progress = QProgressBar()
+        self.scan_progress.setFixedWidth(220)
+        self.scan_progress.setTextVisible(False)
+        self.scan_progress.hide()
+        self.statusBar().addPermanentWidget(self.scan_progress)
+        self.statusBar().setStyleSheet("background: #181818; color: #ffffff;")
+
+    def start_background_scan(self, splash=None):
+        """
+        Lance le scan dans un QThread : la fenêtre affiche déjà les derniers résultats,
+        les aéroports trouvés s'ajoutent au fil du scan, listes et carte sont
+        remplacées à la fin. splash (optionnel) suit la même progression.
+        """
+        if self.scan_worker is not None and self.scan_worker.isRunning():
+            return
+        self.scan_splash = splash
+        self.scan_progress.setRange(0, 0)
+        self.scan_progress.show()
+        self.statusBar().showMessage("Scanning your add-on folders...")
+        self.scan_worker = ScanWorker(self)
+        self.scan_worker.progress.connect(self.on_scan_progress)
+        self.scan_worker.package_scanned.connect(self.on_package_scanned)
+        self.scan_worker.scan_finished.connect(self.on_scan_finished)
+        self.scan_worker.scan_failed.connect(self.on_scan_failed)
+        self.scan_worker.start()
+
+    def on_scan_progress(self, done, total, item):
+        self.scan_progress.setRange(0, total)
+        self.scan_progress.setValue(done)
+        self.statusBar().showMessage(f"Scanning {done}/{total}: {item}")
+        if self.scan_splash is not None:
+            self.scan_splash.set_progress(done, total, item)
+
+    def on_package_scanned(self, item, results):
+        entry = (results.get("airports") or {}).get("entry")
+        if not entry:
+            return
+        airport = DATA.airports.enrich(entry)
+        if airport:
+            self.fleet_panel.add_scanned_airport(airport)
+
+    def _end_scan(self, message):
+        self.scan_progress.hide()
+        self.statusBar().showMessage(message, 10000)
+        if self.scan_splash is not None:
+            self.scan_splash.close()
+            self.scan_splash = None
+
+    def on_airports_changed(self, airports):
+        """Listener du dépôt aéroports (appelé dans le thread GUI) : listes et carte remplacées."""
+        self.fleet_panel.reload_available(DATA.get("aircraft"), airports.scanned())
+
+    def on_scan_finished(self, outputs):
+        # Relecture des JSON écrits par le scan : même enrichissement qu'au démarrage
+        DATA.invalidate("aircraft")
+        if not DATA.airports.reload_scanned():
+            # Aéroports inchangés : seuls les avions sont à remplacer
+            self.on_airports_changed(DATA.airports)
+        self._end_scan(
+            f"Scan complete: {len(outputs.get('airports', []))} airports, "
+            f"{len(outputs.get('aircraft', []))} aircraft"
+        )
+
+    def on_scan_failed(self, message):
+        self._end_scan("Scan failed - showing the last results")
+        QMessageBox.warning(
+            self,
+            "Scan",
+            f"Erreur lors du scan des dossiers (derniers résultats conservés) :\n{message}",
+        )
+
+    def closeEvent(self, event):
+        DATA.airports.unsubscribe(self.on_airports_changed)
+        if self.scan_worker is not None and self.scan_worker.isRunning():
+            self.scan_worker.cancel()
+            self.scan_worker.wait()
+        super().closeEvent(event)
+
     def set_panel(self, index):
         for btn, idx in zip(
             [
@@ -2534,30 +2467,17 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyleSheet(STYLE_FLIGHTCARD)
 
-    # --- SPLASH SCREEN DE SCAN ---
-    splash = SplashScanDialog()
-    splash.show()
-    app.processEvents()  # S'assure que la fenêtre s'affiche AVANT le scan
-
-    # LANCE LE SCAN AUTOMATIQUE
-    try:
-        airports = run_airport_scan(progress_callback=splash.set_progress)
-        splash.set_progress(100)
-        splash.close()
-    except Exception as e:
-        import traceback
-
-        splash.close()
-        from PyQt5.QtWidgets import QMessageBox
-
-        QMessageBox.critical(
-            None,
-            "Erreur critique",
-            f"Erreur lors du scan des aéroports :\n{e}\n\n{traceback.format_exc()}",
-        )
-        sys.exit(1)
-
-    # --- LANCE L'INTERFACE GRAPHIQUE PRINCIPALE ---
+    # --- LANCE L'INTERFACE GRAPHIQUE PRINCIPALE (derniers résultats en cache) ---
     main_window = MainWindow()
     main_window.show()
+
+    # --- SCAN AUTOMATIQUE EN ARRIÈRE-PLAN ---
+    # Splash seulement au premier lancement (aucun résultat à afficher), non bloquant
+    splash = None
+    if not os.path.exists(
+        os.path.join(os.path.dirname(__file__), "../../results/airport_scanresults.json")
+    ):
+        splash = SplashScanDialog(parent=main_window)
+        splash.show()
+    main_window.start_background_scan(splash=splash)
     sys.exit(app.exec_())
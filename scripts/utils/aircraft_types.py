@@ -0,0 +1,154 @@
+import os
+import re
+import csv
+import logging
+import threading
+
+try:
+    from .scan_cache import file_fingerprint
+    from .substring_automaton import SubstringAutomaton
+except ImportError:
+    from scan_cache import file_fingerprint
+    from substring_automaton import SubstringAutomaton
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+# Table des types : icao_type, model (nom affiché), aliases séparés par "|"
+AIRCRAFT_TYPE_ALIASES_PATH = os.path.join(BASE_DIR, "data", "aircraft_type_aliases.csv")
+
+logger = logging.getLogger("simroster.aircraft_types")
+
+
+def normalize_type_text(value):
+    """Texte comparable : majuscules, lettres et chiffres seulement ("A320 neo" -> "A320NEO")."""
+    return re.sub(r"[^0-9A-Z]", "", str(value or "").upper())
+
+
+class AircraftTypeClassifier:
+    """
+    Résolution d'un type avion vers son code OACI (A20N, B738...) via une table
+    d'alias compilée : un dict pour les valeurs exactes (icao_type_designator,
+    icao_model) et un automate de sous-chaînes pour les textes libres (ui_type,
+    ui_variation, title), où l'alias le plus long gagne ("A320neo" avant "A320").
+    """
+
+    def __init__(self, rows=()):
+        self.models = {}  # code OACI -> nom affiché
+        self._exact = {}  # alias normalisé -> code OACI
+        self._aliases = []  # (alias normalisé, code OACI), ordre du fichier
+        for row in rows:
+            self.add(
+                row.get("icao_type", ""),
+                row.get("model", ""),
+                (row.get("aliases") or "").split("|"),
+            )
+        self._automaton = SubstringAutomaton(alias for alias, _ in self._aliases)
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            return cls(csv.DictReader(f))
+
+    def add(self, icao_type, model, aliases=()):
+        """Ajoute un type ; l'automate des alias est compilé par le constructeur."""
+        code = normalize_type_text(icao_type)
+        if not code:
+            return None
+        self.models.setdefault(code, (model or "").strip() or code)
+        self._exact.setdefault(code, code)
+        for alias in aliases:
+            key = normalize_type_text(alias)
+            if key:
+                self._exact.setdefault(key, code)
+                self._aliases.append((key, code))
+        return code
+
+    def __len__(self):
+        return len(self.models)
+
+    def model_name(self, icao_type):
+        return self.models.get(normalize_type_text(icao_type), "")
+
+    def resolve(self, value):
+        """Code OACI d'une valeur exacte (code ou alias), ou None."""
+        return self._exact.get(normalize_type_text(value))
+
+    def search(self, text):
+        """
+        Code OACI de l'alias le plus long contenu dans text, ou None. L'alias doit
+        finir un mot : le caractère suivant dans text n'est ni une lettre ni un
+        chiffre ("A320N" ne correspond pas dans "A320 Northwest").
+        """
+        text = str(text or "").upper()
+        # Position dans text de chaque caractère du texte normalisé
+        positions = [
+            i for i, char in enumerate(text) if "0" <= char <= "9" or "A" <= char <= "Z"
+        ]
+        normalized = "".join(text[i] for i in positions)
+        best = None
+        for end, index in self._automaton.iter_match_ends(normalized):
+            following = positions[end] + 1
+            if following < len(text) and text[following].isalnum():
+                continue
+            if best is None or (len(self._aliases[index][0]), -index) > (
+                len(self._aliases[best][0]),
+                -best,
+            ):
+                best = index
+        return None if best is None else self._aliases[best][1]
+
+    def classify(
+        self,
+        icao_type_designator="",
+        icao_model="",
+        ui_type="",
+        ui_variation="",
+        title="",
+    ):
+        """
+        Code OACI canonique d'une livrée, ou None. Champs essayés du plus fiable
+        au moins fiable ; chacun en valeur exacte, puis en recherche d'alias.
+        """
+        for value in (icao_type_designator, icao_model, ui_type, ui_variation, title):
+            if not value:
+                continue
+            code = self.resolve(value) or self.search(value)
+            if code:
+                return code
+        return None
+
+    def index(self, rows, field="icao_type"):
+        """Index code OACI -> lignes ; field peut être un code ou un libellé ("A320-214")."""
+        indexed = {}
+        for row in rows:
+            value = row.get(field)
+            code = (self.resolve(value) or self.search(value)) if value else None
+            if code:
+                indexed.setdefault(code, []).append(row)
+        return indexed
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def aircraft_type_classifier(path=AIRCRAFT_TYPE_ALIASES_PATH, refresh=False):
+    """
+    Classifieur partagé (un par fichier). refresh=True relit la table si elle a changé
+    (à appeler une fois en début de scan). Fichier absent : aucun type connu.
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        cached = _loaded.get(path)
+        if cached is not None and not refresh:
+            return cached[1]
+        fingerprint = file_fingerprint(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        try:
+            classifier = AircraftTypeClassifier.from_csv(path)
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            logger.warning("Table des types avion indisponible : %s (%s)", path, e)
+            classifier = AircraftTypeClassifier()
+        _loaded[path] = (fingerprint, classifier)
+        return classifier
@@ -0,0 +1,120 @@
+import os
+import re
+import csv
+import logging
+import threading
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+AIRLINE_CALLSIGN_CSV_PATH = os.path.join(BASE_DIR, "data", "airline_callsign_full.csv")
+
+logger = logging.getLogger("simroster.airline_registry")
+
+
+def normalize_company_name(name):
+    """Nom de compagnie comparable : minuscules, espaces normalisés."""
+    return re.sub(r"\s+", " ", str(name or "").strip().lower())
+
+
+class AirlineRegistry:
+    """
+    Compagnies aériennes (ICAO, Callsign, Companyname, IATA) indexées par ICAO,
+    IATA, callsign et nom normalisé : chaque recherche est un accès dict.
+    En cas de doublon, la dernière ligne du fichier gagne.
+    Une compagnie = {"icao", "callsign", "company", "iata"}.
+    """
+
+    def __init__(self, rows=()):
+        self.airlines = []
+        self._by_icao = {}
+        self._by_iata = {}
+        self._by_callsign = {}
+        self._by_company = {}
+        for row in rows:
+            self.add(
+                row.get("ICAO", ""),
+                row.get("Callsign", ""),
+                row.get("Companyname", ""),
+                row.get("IATA", ""),
+            )
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            return cls(csv.DictReader(f))
+
+    def add(self, icao, callsign, company, iata):
+        airline = {
+            "icao": (icao or "").strip().upper(),
+            "callsign": (callsign or "").strip(),
+            "company": (company or "").strip(),
+            "iata": (iata or "").strip().upper(),
+        }
+        self.airlines.append(airline)
+        if airline["icao"]:
+            self._by_icao[airline["icao"]] = airline
+        if airline["iata"]:
+            self._by_iata[airline["iata"]] = airline
+        if airline["callsign"]:
+            self._by_callsign[airline["callsign"].upper()] = airline
+        company_key = normalize_company_name(airline["company"])
+        if company_key:
+            self._by_company[company_key] = airline
+        return airline
+
+    def __len__(self):
+        return len(self.airlines)
+
+    def by_icao(self, icao):
+        return self._by_icao.get((icao or "").strip().upper())
+
+    def by_iata(self, iata):
+        return self._by_iata.get((iata or "").strip().upper())
+
+    def by_callsign(self, callsign):
+        return self._by_callsign.get((callsign or "").strip().upper())
+
+    def by_company(self, company):
+        return self._by_company.get(normalize_company_name(company))
+
+    def find(self, icao=None, iata=None, callsign=None, company=None):
+        """Première compagnie trouvée, dans l'ordre ICAO, IATA, callsign, nom."""
+        for lookup, value in (
+            (self.by_icao, icao),
+            (self.by_iata, iata),
+            (self.by_callsign, callsign),
+            (self.by_company, company),
+        ):
+            if value:
+                airline = lookup(value)
+                if airline is not None:
+                    return airline
+        return None
+
+
+_registries = {}
+_lock = threading.Lock()
+
+
+def load_airline_registry(csv_path=AIRLINE_CALLSIGN_CSV_PATH):
+    """
+    Registre partagé (un par fichier), chargé une seule fois et rechargé si le CSV change.
+    Fichier absent ou illisible : registre vide.
+    """
+    csv_path = os.path.abspath(csv_path)
+    try:
+        st = os.stat(csv_path)
+        fingerprint = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        fingerprint = None
+    with _lock:
+        cached = _registries.get(csv_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        try:
+            registry = AirlineRegistry.from_csv(csv_path)
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            logger.warning("Registre compagnies indisponible : %s (%s)", csv_path, e)
+            registry = AirlineRegistry()
+        _registries[csv_path] = (fingerprint, registry)
+        return registry
@@ -0,0 +1,309 @@
+import os
+import csv
+import mmap
+import math
+import struct
+import bisect
+import logging
+import threading
+from array import array
+from collections.abc import Mapping
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+AIRPORTS_CSV_PATH = os.path.join(BASE_DIR, "data", "airports.csv")
+# Base compilée (générée) : airports.csv reste la source éditable
+AIRPORTS_DB_PATH = os.path.join(BASE_DIR, "results", "airports.bin")
+
+# Format (little-endian, lu tel quel via memoryview.cast) :
+#   en-tête : magic, version, nombre d'aéroports, largeur des clés, empreinte du CSV source
+#   table des sections : offset de chaque section (alignées sur 8 octets) + taille totale
+#   keys : ICAO triés, largeur fixe (complétés par des \0)
+#   latitude / longitude : float64 (NaN = absent)
+#   name / city / country / type : index uint32 dans la table de chaînes partagée
+#   string_offsets (uint32, n+1) + string_data (UTF-8) : chaînes internées
+DB_MAGIC = b"SRAPTDB\0"
+DB_VERSION = 1
+KEY_WIDTH = 8
+HEADER = struct.Struct("<8sIIIqq")
+STRING_COLUMNS = ("name", "city", "country", "type")
+SECTIONS = (
+    ("keys",)
+    + ("latitude", "longitude")
+    + STRING_COLUMNS
+    + ("string_offsets", "string_data")
+)
+SECTION_TABLE = struct.Struct("<%dQ" % (len(SECTIONS) + 1))
+
+logger = logging.getLogger("simroster.airport_db")
+
+
+def _csv_fingerprint(csv_path):
+    st = os.stat(csv_path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _to_float(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return math.nan
+    return value
+
+
+def _pad8(blob):
+    blob += b"\0" * (-len(blob) % 8)
+    return blob
+
+
+def build_airport_db_bytes(csv_path=AIRPORTS_CSV_PATH):
+    """Compile airports.csv en base binaire (bytes). Un ICAO en double garde la dernière ligne, comme un dict."""
+    rows = {}
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            icao = (row.get("icao") or "").strip().upper()
+            if icao and icao.isascii() and len(icao) <= KEY_WIDTH:
+                rows[icao] = row
+    keys = sorted(rows)
+
+    strings = [""]
+    string_index = {"": 0}
+
+    def intern(value):
+        value = (value or "").strip()
+        index = string_index.get(value)
+        if index is None:
+            index = string_index[value] = len(strings)
+            strings.append(value)
+        return index
+
+    latitudes = array("d")
+    longitudes = array("d")
+    columns = {name: array("I") for name in STRING_COLUMNS}
+    for icao in keys:
+        row = rows[icao]
+        latitudes.append(_to_float(row.get("latitude")))
+        longitudes.append(_to_float(row.get("longitude")))
+        for name in STRING_COLUMNS:
+            columns[name].append(intern(row.get(name)))
+
+    string_offsets = array("I", [0])
+    encoded = []
+    for value in strings:
+        data = value.encode("utf-8")
+        encoded.append(data)
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    blobs = {
+        "keys": b"".join(k.encode("ascii").ljust(KEY_WIDTH, b"\0") for k in keys),
+        "latitude": latitudes.tobytes(),
+        "longitude": longitudes.tobytes(),
+        "string_offsets": string_offsets.tobytes(),
+        "string_data": b"".join(encoded),
+    }
+    for name in STRING_COLUMNS:
+        blobs[name] = columns[name].tobytes()
+
+    mtime_ns, size = _csv_fingerprint(csv_path)
+    header = HEADER.pack(DB_MAGIC, DB_VERSION, len(keys), KEY_WIDTH, mtime_ns, size)
+    offset = len(header) + SECTION_TABLE.size
+    offset += -offset % 8
+    offsets = []
+    body = b""
+    for name in SECTIONS:
+        offsets.append(offset + len(body))
+        body += _pad8(blobs[name])
+    offsets.append(offset + len(body))
+    prefix = header + SECTION_TABLE.pack(*offsets)
+    return _pad8(prefix) + body
+
+
+def build_airport_db(csv_path=AIRPORTS_CSV_PATH, db_path=AIRPORTS_DB_PATH):
+    """Étape de build : écrit la base compilée (atomique via fichier temporaire)."""
+    data = build_airport_db_bytes(csv_path)
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    tmp_path = db_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, db_path)
+    return data
+
+
+class _Keys:
+    """Séquence des clés ICAO (bytes) pour bisect, lue directement dans le buffer."""
+
+    def __init__(self, buf, offset, count):
+        self.buf = buf
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        start = self.offset + index * KEY_WIDTH
+        return bytes(self.buf[start : start + KEY_WIDTH])
+
+
+class AirportDB(Mapping):
+    """
+    Lecteur de la base compilée, utilisable comme un dict ICAO -> ligne
+    ({icao, name, city, country, latitude, longitude, type}).
+    Recherche par dichotomie sur les clés triées ; rien n'est décodé au chargement.
+    """
+
+    def __init__(self, buf, source=None):
+        self.source = source
+        self._buf = buf
+        magic, version, count, key_width, mtime_ns, size = HEADER.unpack_from(buf, 0)
+        if magic != DB_MAGIC or version != DB_VERSION or key_width != KEY_WIDTH:
+            raise ValueError("Base aéroports compilée invalide ou d'une autre version")
+        self.count = count
+        self.source_fingerprint = (mtime_ns, size)
+        offsets = SECTION_TABLE.unpack_from(buf, HEADER.size)
+        if offsets[-1] > len(buf):
+            raise ValueError("Base aéroports compilée tronquée")
+        view = memoryview(buf)
+        self._views = [view]  # libérées par close() avant de fermer le mmap
+        self._sections = {}
+        for i, name in enumerate(SECTIONS):
+            self._sections[name] = view[offsets[i] : offsets[i + 1]]
+            self._views.append(self._sections[name])
+        self._keys = _Keys(buf, offsets[0], count)
+        self._lat = self._typed("latitude", "d", count)
+        self._lon = self._typed("longitude", "d", count)
+        self._columns = {name: self._typed(name, "I", count) for name in STRING_COLUMNS}
+        self._string_offsets = self._typed("string_offsets", "I", None)
+        self._string_data = self._sections["string_data"]
+
+    def _typed(self, name, fmt, count):
+        raw = self._sections[name]
+        size = struct.calcsize(fmt)
+        length = len(raw) // size if count is None else count
+        typed = raw[: length * size].cast(fmt)
+        self._views.append(typed)
+        return typed
+
+    @classmethod
+    def open(cls, db_path):
+        with open(db_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buf, source=db_path)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+    def _string(self, index):
+        start = self._string_offsets[index]
+        end = self._string_offsets[index + 1]
+        return bytes(self._string_data[start:end]).decode("utf-8")
+
+    def _coord(self, values, i):
+        value = values[i]
+        return None if value != value else value
+
+    def index_of(self, icao):
+        """Position de l'ICAO dans la base, ou -1."""
+        key = str(icao).strip().upper().encode("ascii", "ignore")
+        if not key or len(key) > KEY_WIDTH:
+            return -1
+        key = key.ljust(KEY_WIDTH, b"\0")
+        i = bisect.bisect_left(self._keys, key)
+        if i < self.count and self._keys[i] == key:
+            return i
+        return -1
+
+    def icao_at(self, i):
+        return self._keys[i].rstrip(b"\0").decode("ascii")
+
+    def row_at(self, i):
+        columns = self._columns
+        return {
+            "icao": self.icao_at(i),
+            "name": self._string(columns["name"][i]),
+            "city": self._string(columns["city"][i]),
+            "country": self._string(columns["country"][i]),
+            "latitude": self._coord(self._lat, i),
+            "longitude": self._coord(self._lon, i),
+            "type": self._string(columns["type"][i]),
+        }
+
+    def coordinates(self, icao):
+        """(latitude, longitude) ou (None, None), sans décoder les chaînes."""
+        i = self.index_of(icao)
+        if i < 0:
+            return None, None
+        return self._coord(self._lat, i), self._coord(self._lon, i)
+
+    def __getitem__(self, icao):
+        i = self.index_of(icao)
+        if i < 0:
+            raise KeyError(icao)
+        return self.row_at(i)
+
+    def __contains__(self, icao):
+        return self.index_of(icao) >= 0
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.icao_at(i)
+
+    def __len__(self):
+        return self.count
+
+    def values(self):
+        """Toutes les lignes, dans l'ordre des ICAO."""
+        return [self.row_at(i) for i in range(self.count)]
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def load_airport_db(csv_path=AIRPORTS_CSV_PATH, db_path=None):
+    """
+    Base aéroports partagée (une instance par CSV) : ouvre la base compilée,
+    la recompile si le CSV a changé depuis.
+    Seul data/airports.csv a une base sur disque (results/airports.bin) par défaut ;
+    un autre CSV, ou une base impossible à écrire, est compilé en mémoire.
+    L'ancienne instance n'est pas fermée (elle peut encore être référencée).
+    """
+    csv_path = os.path.abspath(csv_path)
+    if db_path is None and csv_path == os.path.abspath(AIRPORTS_CSV_PATH):
+        db_path = AIRPORTS_DB_PATH
+    fingerprint = _csv_fingerprint(csv_path)
+    with _lock:
+        db = _loaded.get(csv_path)
+        if db is not None and db.source_fingerprint == fingerprint:
+            return db
+        db = None
+        if db_path is None:
+            db = AirportDB(build_airport_db_bytes(csv_path), source=csv_path)
+        else:
+            try:
+                candidate = AirportDB.open(db_path)
+                if candidate.source_fingerprint == fingerprint:
+                    db = candidate
+                else:
+                    candidate.close()
+            except (OSError, ValueError, struct.error):
+                pass
+        if db is None:
+            logger.info("Compilation de la base aéroports : %s -> %s", csv_path, db_path)
+            try:
+                db = AirportDB(build_airport_db(csv_path, db_path), source=db_path)
+            except OSError as e:
+                logger.warning("Base aéroports non écrite (%s), gardée en mémoire", e)
+                db = AirportDB(build_airport_db_bytes(csv_path), source=csv_path)
+        _loaded[csv_path] = db
+        return db
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    data = build_airport_db()
+    logger.info("Base aéroports compilée : %s (%d octets)", AIRPORTS_DB_PATH, len(data))
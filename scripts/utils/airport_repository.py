@@ -0,0 +1,211 @@
+import os
+import json
+import logging
+import threading
+
+try:
+    from .scan_cache import file_fingerprint
+except ImportError:
+    from scan_cache import file_fingerprint
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+AIRPORT_SCANRESULTS_PATH = os.path.join(BASE_DIR, "results", "airport_scanresults.json")
+
+logger = logging.getLogger("simroster.airport_repository")
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class AirportRepository:
+    """
+    Aéroports de la GUI, chargés une seule fois : la base de référence (airports.csv
+    compilé, consulté à la demande) et les aéroports du dernier scan, enrichis par
+    cette base. Index ICAO et IATA en dict ; les lignes de référence consultées sont
+    mémorisées. Les listeners (subscribe) sont appelés quand les résultats du scan
+    changent.
+    """
+
+    def __init__(self, reference=None, scan_results_path=AIRPORT_SCANRESULTS_PATH):
+        self.reference = reference if reference is not None else {}
+        self.scan_results_path = scan_results_path
+        self.fingerprint = None
+        self._scanned = []
+        self._by_icao = {}  # ICAO -> aéroport scanné
+        self._by_iata = None  # construit au premier by_iata
+        self._reference_rows = {}  # ICAO -> ligne de référence (ou None), mémorisée
+        self._listeners = []
+        self._lock = threading.RLock()
+        self._loaded = False
+
+    # --- Lecture ---
+
+    def get(self, icao, default=None):
+        """Aéroport scanné, sinon ligne de référence, sinon default."""
+        key = str(icao or "").strip().upper()
+        self._ensure_loaded()
+        with self._lock:
+            airport = self._by_icao.get(key)
+            if airport is not None:
+                return airport
+            if key not in self._reference_rows:
+                self._reference_rows[key] = self.reference.get(key) if key else None
+            row = self._reference_rows[key]
+        return default if row is None else row
+
+    def __contains__(self, icao):
+        return self.get(icao) is not None
+
+    def coordinates(self, icao):
+        airport = self.get(icao) or {}
+        return airport.get("latitude"), airport.get("longitude")
+
+    def by_iata(self, iata):
+        """Aéroport par code IATA, si le scan ou la base de référence le fournit."""
+        key = str(iata or "").strip().upper()
+        self._ensure_loaded()
+        with self._lock:
+            if self._by_iata is None:
+                self._by_iata = {}
+                sample = next(iter(self.reference.values()), None) if self.reference else None
+                if sample is not None and "iata" in sample:
+                    for row in self.reference.values():
+                        code = (row.get("iata") or "").strip().upper()
+                        if code:
+                            self._by_iata.setdefault(code, row)
+                for airport in self._scanned:
+                    code = (airport.get("iata") or "").strip().upper()
+                    if code:
+                        self._by_iata[code] = airport
+            return self._by_iata.get(key)
+
+    def scanned(self):
+        """Copie de la liste des aéroports du scan (les panels la modifient)."""
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._scanned)
+
+    # --- Résultats du scan ---
+
+    def enrich(self, entry):
+        """
+        Entrée du scan {icao, name} + ville, pays et coordonnées de référence ; un
+        aéroport absent de la référence (ajout manuel) garde ses propres coordonnées.
+        None sans coordonnées.
+        """
+        icao = entry.get("icao", "").upper()
+        row = self.reference.get(icao) or {}
+        if "latitude" not in row or "longitude" not in row:
+            row = dict(row, latitude=entry.get("latitude"), longitude=entry.get("longitude"))
+            if row["latitude"] is None or row["longitude"] is None:
+                return None
+        if "icao" in entry and "name" in entry:
+            return {
+                "icao": entry["icao"],
+                "name": entry["name"],
+                "city": row.get("city", ""),
+                "country": row.get("country", ""),
+                "latitude": _to_float(row.get("latitude")),
+                "longitude": _to_float(row.get("longitude")),
+                "type": row.get("type", ""),
+            }
+        return None
+
+    def _read_scanned(self):
+        try:
+            with open(self.scan_results_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                airports = [a for a in map(self.enrich, data) if a]
+                logger.info(
+                    "%d aéroport(s) enrichi(s) depuis %s", len(airports), self.scan_results_path
+                )
+                return airports
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Résultats du scan illisibles : %s (%s)", self.scan_results_path, e)
+        # Pas de scan exploitable : toute la base de référence
+        airports = [
+            row for row in self.reference.values() if row.get("icao") and row.get("name")
+        ]
+        logger.info("%d aéroport(s) chargé(s) depuis la base de référence", len(airports))
+        return airports
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.reload_scanned(notify=False)
+
+    def reload_scanned(self, notify=True):
+        """
+        Relit les résultats du scan s'ils ont changé sur disque. Retourne True
+        (et prévient les listeners si notify) quand la liste a été remplacée.
+        """
+        fingerprint = file_fingerprint(self.scan_results_path)
+        with self._lock:
+            if self._loaded and fingerprint == self.fingerprint:
+                return False
+            airports = self._read_scanned()
+            self.fingerprint = fingerprint
+        self.set_scanned(airports, notify=notify)
+        return True
+
+    def add_scanned(self, entry, notify=True):
+        """
+        Ajoute (ou remplace, même ICAO) un aéroport dans les résultats du scan :
+        fichier JSON réécrit, liste en mémoire remplacée et listeners prévenus.
+        Lève OSError si le fichier ne peut pas être écrit.
+        """
+        icao = str(entry.get("icao", "")).strip().upper()
+        with self._lock:
+            try:
+                with open(self.scan_results_path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = []
+            except ValueError as e:
+                logger.warning("Résultats du scan illisibles : %s (%s)", self.scan_results_path, e)
+                data = []
+            if not isinstance(data, list):
+                data = []
+            data = [a for a in data if str(a.get("icao", "")).upper() != icao]
+            data.append(entry)
+            data.sort(key=lambda a: a.get("icao", ""))
+            os.makedirs(os.path.dirname(self.scan_results_path), exist_ok=True)
+            with open(self.scan_results_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.fingerprint = file_fingerprint(self.scan_results_path)
+            airports = [a for a in map(self.enrich, data) if a]
+        self.set_scanned(airports, notify=notify)
+
+    def set_scanned(self, airports, notify=True):
+        with self._lock:
+            self._scanned = list(airports)
+            self._by_icao = {a["icao"].upper(): a for a in reversed(self._scanned)}
+            self._by_iata = None
+            self._loaded = True
+            listeners = list(self._listeners)
+        if notify:
+            for listener in listeners:
+                try:
+                    listener(self)
+                except Exception:
+                    logger.exception("Listener aéroports en erreur")
+
+    # --- Notifications ---
+
+    def subscribe(self, listener):
+        """listener(repository) après chaque remplacement des aéroports du scan."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
@@ -0,0 +1,110 @@
+import os
+import mmap
+import struct
+
+# Format BGL (FSX / P3D / MSFS) :
+#   en-tête 0x38 octets, puis table des sections (20 octets par section),
+#   chaque section pointe vers des sous-sections (16 octets) qui pointent vers les records.
+BGL_MAGIC = 0x19920201
+BGL_HEADER_SIZE = 0x38
+SECTION_ENTRY_SIZE = 20
+SUBSECTION_ENTRY_SIZE = 16
+SECTION_TYPE_AIRPORT = 0x0003
+# Identifiants de record "Airport" : 0x003C (FSX/P3D), 0x0056 et 0x0058 (MSFS).
+# 0x0003 est le type de la section Airport, pas un identifiant de record.
+AIRPORT_RECORD_IDS = {0x003C, 0x0056, 0x0058}
+AIRPORT_IDENT_OFFSET = 0x28
+
+
+def decode_icao_ident(value, shift=5):
+    """
+    Décode un identifiant ICAO "packed" BGL (base 38, décalé de 5 bits).
+    0 = espace, 2-11 = '0'-'9', 12-37 = 'A'-'Z'.
+    """
+    value >>= shift
+    chars = []
+    while value:
+        value, digit = divmod(value, 38)
+        if digit == 0:
+            chars.append(" ")
+        elif 2 <= digit <= 11:
+            chars.append(chr(ord("0") + digit - 2))
+        elif digit >= 12:
+            chars.append(chr(ord("A") + digit - 12))
+        else:
+            return ""
+    return "".join(reversed(chars)).strip()
+
+
+def encode_icao_ident(code, shift=5):
+    """Inverse de decode_icao_ident (utile pour générer des BGL de test)."""
+    value = 0
+    for char in code.upper():
+        if char == " ":
+            digit = 0
+        elif char.isdigit():
+            digit = ord(char) - ord("0") + 2
+        else:
+            digit = ord(char) - ord("A") + 12
+        value = value * 38 + digit
+    return value << shift
+
+
+def _iter_airport_idents(buf):
+    size = len(buf)
+    if size < BGL_HEADER_SIZE:
+        return
+    magic, header_size = struct.unpack_from("<II", buf, 0)
+    if magic != BGL_MAGIC:
+        return
+    (section_count,) = struct.unpack_from("<I", buf, 0x14)
+    table_offset = header_size or BGL_HEADER_SIZE
+    for s in range(section_count):
+        entry_offset = table_offset + s * SECTION_ENTRY_SIZE
+        if entry_offset + SECTION_ENTRY_SIZE > size:
+            return
+        section_type, _, sub_count, sub_offset, _ = struct.unpack_from(
+            "<IIIII", buf, entry_offset
+        )
+        if section_type != SECTION_TYPE_AIRPORT:
+            continue
+        for sub in range(sub_count):
+            sub_entry = sub_offset + sub * SUBSECTION_ENTRY_SIZE
+            if sub_entry + SUBSECTION_ENTRY_SIZE > size:
+                break
+            _, record_count, record_offset, data_size = struct.unpack_from(
+                "<IIII", buf, sub_entry
+            )
+            end = min(record_offset + data_size, size)
+            offset = record_offset
+            for _ in range(record_count):
+                if offset + AIRPORT_IDENT_OFFSET + 4 > end:
+                    break
+                record_id, record_size = struct.unpack_from("<HI", buf, offset)
+                if record_id in AIRPORT_RECORD_IDS:
+                    (ident,) = struct.unpack_from(
+                        "<I", buf, offset + AIRPORT_IDENT_OFFSET
+                    )
+                    code = decode_icao_ident(ident)
+                    if code:
+                        yield code
+                if record_size <= 0:
+                    break
+                offset += record_size
+
+
+def read_bgl_airport_idents(bgl_path):
+    """
+    Retourne la liste des ICAO des records Airport d'un fichier BGL.
+    Le fichier est mappé en mémoire : seuls l'en-tête, la table des sections
+    et les en-têtes de records Airport sont effectivement lus.
+    Retourne [] si le fichier n'est pas un BGL lisible.
+    """
+    try:
+        if os.path.getsize(bgl_path) < BGL_HEADER_SIZE:
+            return []
+        with open(bgl_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return list(_iter_airport_idents(buf))
+    except (OSError, ValueError, struct.error):
+        return []
@@ -0,0 +1,105 @@
+import json
+import logging
+import threading
+
+try:
+    from .scan_cache import file_fingerprint
+    from .substring_automaton import SubstringAutomaton
+except ImportError:
+    from scan_cache import file_fingerprint
+    from substring_automaton import SubstringAutomaton
+
+logger = logging.getLogger("simroster.custom_mapping")
+
+
+def _normalize(value):
+    return str(value if value is not None else "").strip().lower()
+
+
+class CustomAirportMapping:
+    """
+    Mapping custom (creator, title) -> ICAO compilé une seule fois.
+    Règle inchangée : une entrée matche si son creator est contenu dans le creator
+    du manifest ET son title dans le title ; la première entrée du fichier gagne.
+    Les creators distincts forment un automate de sous-chaînes, et chaque groupe
+    de creator a son propre automate sur les titles.
+    """
+
+    def __init__(self, entries=()):
+        self.entries = []  # (creator, title, icao) normalisés, ordre du fichier
+        groups = {}  # creator -> index des entrées (croissants)
+        for entry in entries or []:
+            if not isinstance(entry, dict):
+                continue
+            creator = _normalize(entry.get("creator", ""))
+            title = _normalize(entry.get("title", ""))
+            icao = str(entry.get("icao", "") or "").strip().upper()
+            groups.setdefault(creator, []).append(len(self.entries))
+            self.entries.append((creator, title, icao))
+        self.creators = list(groups)
+        self._creator_automaton = SubstringAutomaton(self.creators)
+        self._title_groups = [
+            (orders, SubstringAutomaton(self.entries[o][1] for o in orders))
+            for orders in groups.values()
+        ]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def match(self, creator, title):
+        """ICAO de la première entrée qui matche (creator, title), ou None."""
+        creator = _normalize(creator)
+        title = _normalize(title)
+        best = None
+        for creator_index in self._creator_automaton.matched(creator):
+            orders, titles = self._title_groups[creator_index]
+            for title_index in titles.matched(title):
+                order = orders[title_index]
+                if best is None or order < best:
+                    best = order
+        if best is None:
+            return None
+        return self.entries[best][2]
+
+
+def as_custom_mapping(mapping):
+    """Accepte un CustomAirportMapping ou la liste brute du fichier JSON."""
+    if isinstance(mapping, CustomAirportMapping):
+        return mapping
+    return CustomAirportMapping(mapping or [])
+
+
+class CustomMappingFile:
+    """
+    custom_airport_mapping.json compilé, rechargé seulement quand le fichier change
+    (empreinte mtime/taille). Thread-safe.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.fingerprint = None
+        self.mapping = CustomAirportMapping()
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.reload_if_changed()
+
+    def reload_if_changed(self):
+        fingerprint = file_fingerprint(self.path)
+        with self._lock:
+            if self._loaded and fingerprint == self.fingerprint:
+                return self.mapping
+            entries = []
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+            except Exception:
+                logger.warning("Fichier de mapping custom non trouvé : %s", self.path)
+            self.mapping = CustomAirportMapping(entries)
+            self.fingerprint = fingerprint
+            self._loaded = True
+            logger.debug(
+                "Mapping custom compilé : %d entrée(s), %d creator(s)",
+                len(self.mapping),
+                len(self.mapping.creators),
+            )
+            return self.mapping
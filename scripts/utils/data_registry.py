@@ -0,0 +1,152 @@
+import os
+import csv
+import time
+import logging
+import threading
+
+try:
+    from .airport_db import AIRPORTS_CSV_PATH, load_airport_db
+    from .airline_registry import AIRLINE_CALLSIGN_CSV_PATH, load_airline_registry
+    from .airport_repository import AirportRepository
+except ImportError:
+    from airport_db import AIRPORTS_CSV_PATH, load_airport_db
+    from airline_registry import AIRLINE_CALLSIGN_CSV_PATH, load_airline_registry
+    from airport_repository import AirportRepository
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+# Images de la carte de vol : images/aircraft/<REG>.png, images/company/<compagnie>.png
+IMAGES_DIR = os.path.join(BASE_DIR, "images")
+# Parkings par aéroport et compagnie : icao, airline_icao, gates séparés par "|"
+AIRPORT_GATES_CSV_PATH = os.path.join(BASE_DIR, "data", "airport_gates_db.csv")
+
+logger = logging.getLogger("simroster.data_registry")
+
+
+def load_airport_gates(csv_path=AIRPORT_GATES_CSV_PATH):
+    """(ICAO aéroport, ICAO compagnie) -> liste de gates. Fichier absent : dict vide."""
+    gates = {}
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                icao = row["icao"].strip().upper()
+                airline_icao = row["airline_icao"].strip().upper()
+                gates[(icao, airline_icao)] = [
+                    g.strip() for g in row["gates"].split("|") if g.strip()
+                ]
+    except (OSError, KeyError, csv.Error, UnicodeDecodeError) as e:
+        logger.warning("Base des gates indisponible : %s (%s)", csv_path, e)
+    return gates
+
+
+def load_airports(csv_path=AIRPORTS_CSV_PATH):
+    """Dépôt aéroports sur la base compilée (ICAO -> ligne). CSV absent : base vide."""
+    try:
+        reference = load_airport_db(csv_path)
+    except (OSError, ValueError) as e:
+        logger.warning("Base aéroports indisponible : %s (%s)", csv_path, e)
+        reference = {}
+    return AirportRepository(reference)
+
+
+class DataRegistry:
+    """
+    Jeux de données partagés par les panels et dialogues, chargés au premier accès :
+    un loader par nom, appelé une seule fois même si plusieurs threads le demandent
+    en même temps (un verrou par jeu de données). invalidate() force le rechargement
+    au prochain accès ; timings() donne la durée du dernier chargement de chacun.
+    """
+
+    def __init__(self, loaders=None):
+        self._loaders = {}
+        self._values = {}
+        self._timings = {}
+        self._generations = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        for name, loader in (loaders or {}).items():
+            self.register(name, loader)
+
+    def register(self, name, loader):
+        """Déclare (ou remplace) le loader d'un jeu de données ; rien n'est chargé ici."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._values.pop(name, None)
+            self._generations[name] = self._generations.get(name, 0) + 1
+
+    def get(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._loaders:
+                raise KeyError(f"Jeu de données inconnu : {name}")
+            lock = self._locks[name]
+        with lock:
+            with self._lock:
+                if name in self._values:
+                    return self._values[name]
+                loader = self._loaders[name]
+                generation = self._generations[name]
+            start = time.perf_counter()
+            value = loader()
+            seconds = time.perf_counter() - start
+            with self._lock:
+                # Invalidé pendant le chargement : valeur rendue mais pas mémorisée
+                if self._generations[name] == generation:
+                    self._values[name] = value
+                    self._timings[name] = seconds
+            logger.info("Données %s chargées en %.3fs", name, seconds)
+            return value
+
+    def loaded(self, name):
+        return name in self._values
+
+    def invalidate(self, *names):
+        """Oublie les jeux de données nommés (tous si aucun nom)."""
+        with self._lock:
+            for name in names or list(self._loaders):
+                self._values.pop(name, None)
+                if name in self._generations:
+                    self._generations[name] += 1
+
+    def timings(self):
+        """{nom: secondes} du dernier chargement de chaque jeu de données."""
+        with self._lock:
+            return dict(self._timings)
+
+    @property
+    def airports(self):
+        return self.get("airports")
+
+    @property
+    def airlines(self):
+        return self.get("airlines")
+
+    @property
+    def gates(self):
+        return self.get("gates")
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def data_registry():
+    """
+    Registre partagé du processus, avec les jeux de données de base (airports,
+    airlines, gates). L'inventaire issu du scan est déclaré par la GUI (register).
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = DataRegistry(
+                {
+                    "airports": load_airports,
+                    "airlines": lambda: load_airline_registry(AIRLINE_CALLSIGN_CSV_PATH),
+                    "gates": load_airport_gates,
+                }
+            )
+        return _shared
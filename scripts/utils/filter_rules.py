@@ -0,0 +1,127 @@
+import os
+import re
+import json
+import logging
+import threading
+
+try:
+    from .scan_cache import file_fingerprint
+except ImportError:
+    from scan_cache import file_fingerprint
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+# Règles d'exclusion du scan, éditables sans toucher au code
+SCAN_FILTERS_PATH = os.path.join(BASE_DIR, "data", "scan_filters.json")
+MATCH_MODES = ("contains", "exact")
+
+logger = logging.getLogger("simroster.filter_rules")
+
+
+def normalize_field(value):
+    """Valeur comparable : minuscules, séparateurs de chemin en "/"."""
+    return str(value if value is not None else "").replace("\\", "/").strip().lower()
+
+
+def _alternation(values):
+    return "|".join(re.escape(normalize_field(v)) for v in values if normalize_field(v))
+
+
+def _rule_pattern(rule):
+    """
+    Motif d'une règle, ancré en début de texte : dans l'alternance compilée,
+    toutes les règles sont essayées à la même position et la première du fichier gagne.
+    """
+    values = _alternation(rule.get("values") or [])
+    if not values:
+        return None
+    if rule.get("match", "contains") == "exact":
+        pattern = r"(?:%s)\Z" % values
+    else:
+        pattern = r".*?(?:%s)" % values
+    unless = _alternation(rule.get("unless") or [])
+    if unless:
+        pattern = r"(?!.*?(?:%s))%s" % (unless, pattern)
+    return pattern
+
+
+class FilterRules:
+    """
+    Règles d'exclusion compilées : une seule regex par (scope, champ), chaque règle
+    étant un groupe nommé qui porte son code raison.
+    Une règle = {"scope", "field", "match": contains|exact, "values", "unless", "reason"}.
+    """
+
+    def __init__(self, rules=()):
+        self.rules = []
+        grouped = {}  # scope -> {champ -> [(nom du groupe, motif)]}, ordre du fichier
+        self._reasons = {}
+        for rule in rules or []:
+            if not isinstance(rule, dict):
+                continue
+            if rule.get("match", "contains") not in MATCH_MODES:
+                logger.warning("Règle ignorée (match inconnu) : %s", rule)
+                continue
+            pattern = _rule_pattern(rule)
+            if pattern is None:
+                continue
+            group = "r%d" % len(self.rules)
+            self.rules.append(rule)
+            self._reasons[group] = rule.get("reason") or "filtered"
+            scope = grouped.setdefault(rule.get("scope", ""), {})
+            scope.setdefault(rule.get("field", ""), []).append((group, pattern))
+        self._compiled = {
+            scope: [
+                (
+                    field,
+                    re.compile(
+                        "|".join("(?P<%s>%s)" % item for item in patterns),
+                        re.IGNORECASE | re.DOTALL,
+                    ),
+                )
+                for field, patterns in fields.items()
+            ]
+            for scope, fields in grouped.items()
+        }
+
+    def __len__(self):
+        return len(self.rules)
+
+    def match(self, scope, **fields):
+        """Code raison de la première règle qui exclut ces champs, ou None."""
+        for field, regex in self._compiled.get(scope, ()):
+            if field not in fields:
+                continue
+            m = regex.match(normalize_field(fields[field]))
+            if m:
+                return self._reasons[m.lastgroup]
+        return None
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def scan_filters(path=SCAN_FILTERS_PATH, refresh=False):
+    """
+    Règles partagées (une instance par fichier). refresh=True relit le fichier
+    s'il a changé (à appeler une fois en début de scan). Fichier absent : aucune règle.
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        cached = _loaded.get(path)
+        if cached is not None and not refresh:
+            return cached[1]
+        fingerprint = file_fingerprint(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        rules = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                rules = json.load(f).get("rules", [])
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Règles de filtrage indisponibles : %s (%s)", path, e)
+        filters = FilterRules(rules)
+        _loaded[path] = (fingerprint, filters)
+        logger.debug("Règles de filtrage compilées : %d règle(s)", len(filters))
+        return filters
@@ -2,6 +2,11 @@ import os
 import csv
 import json
 
+try:
+    from .airport_db import load_airport_db
+except ImportError:
+    from airport_db import load_airport_db
+
 # BASE_DIR = racine du projet
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 AIRPORTS_CSV_PATH = os.path.join(BASE_DIR, "data", "airports.csv")
@@ -31,6 +36,17 @@ def generate_airports_map_data():
     with open(AIRPORTS_SCAN_JSON, encoding="utf-8") as f:
         airports = json.load(f)
 
+    # Complète ville/pays (popups) depuis la base aéroports compilée
+    try:
+        airports_db = load_airport_db(AIRPORTS_CSV_PATH)
+    except OSError:
+        airports_db = {}
+    for ap in airports:
+        row = airports_db.get(str(ap.get("icao", "")).upper())
+        if row:
+            ap.setdefault("city", row["city"])
+            ap.setdefault("country", row["country"])
+
     with open(MAP_JSON_PATH, "w", encoding="utf-8") as f:
         json.dump(airports, f, ensure_ascii=False, indent=2)
 
@@ -0,0 +1,61 @@
+class IcaoMatcher:
+    """
+    Index multi-motifs des codes ICAO officiels (hash de n-grammes par longueur).
+    Trouve toutes les occurrences de codes connus dans une chaîne en un seul passage
+    linéaire, au lieu de tester les ~17k codes un par un.
+    Se comporte aussi comme un ensemble (in, len, itération) pour rester compatible
+    avec le code qui attend un set d'ICAO.
+    """
+
+    def __init__(self, codes):
+        self.codes = frozenset(str(c).strip().upper() for c in codes if c)
+        # Longueurs distinctes (4 pour les ICAO), les plus longues d'abord
+        self.lengths = sorted({len(c) for c in self.codes}, reverse=True)
+
+    def __contains__(self, code):
+        return code in self.codes
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def iter_matches(self, text):
+        """Génère (position, code) pour chaque code connu présent dans text (majuscules)."""
+        codes = self.codes
+        lengths = self.lengths
+        for i in range(len(text)):
+            for length in lengths:
+                candidate = text[i : i + length]
+                if len(candidate) == length and candidate in codes:
+                    yield i, candidate
+
+    def find_first(self, text):
+        """Premier code connu (par position) dans text, ou None."""
+        for _, code in self.iter_matches(str(text).upper()):
+            return code
+        return None
+
+    def find_all(self, text):
+        """Tous les codes connus de text, sans doublon, dans l'ordre d'apparition."""
+        found = []
+        for _, code in self.iter_matches(str(text).upper()):
+            if code not in found:
+                found.append(code)
+        return found
+
+    def longest_prefix(self, text):
+        """Plus long code connu par lequel commence text, ou None."""
+        text = str(text).upper()
+        for length in self.lengths:
+            if text[:length] in self.codes:
+                return text[:length]
+        return None
+
+
+def as_icao_matcher(icao_official):
+    """Accepte un IcaoMatcher ou n'importe quel itérable de codes."""
+    if isinstance(icao_official, IcaoMatcher):
+        return icao_official
+    return IcaoMatcher(icao_official or [])
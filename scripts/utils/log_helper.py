@@ -0,0 +1,40 @@
+import os
+import sys
+import logging
+
+# Niveau par défaut : variable d'environnement, sinon "log_level" de config/paths.json
+LOG_LEVEL_ENV = "SIMROSTER_LOG_LEVEL"
+DEFAULT_LOG_LEVEL = "INFO"
+LOGGER_ROOT = "simroster"
+
+
+def get_logger(name):
+    """Logger "simroster.<name>", réglé par configure_logging."""
+    return logging.getLogger(f"{LOGGER_ROOT}.{name}")
+
+
+def resolve_level(level=None):
+    """Priorité : variable d'environnement, puis niveau passé (config), puis INFO."""
+    value = os.environ.get(LOG_LEVEL_ENV) or level or DEFAULT_LOG_LEVEL
+    if isinstance(value, int):
+        return value
+    value = str(value).strip().upper()
+    if value.isdigit():
+        return int(value)
+    level_no = logging.getLevelName(value)
+    return level_no if isinstance(level_no, int) else logging.INFO
+
+
+def configure_logging(level=None, stream=None):
+    """
+    Configure la sortie des scripts CLI (une seule fois) : "[NIVEAU] message" sur stdout.
+    Les messages sous le niveau configuré ne sont ni formatés ni écrits.
+    """
+    root = logging.getLogger(LOGGER_ROOT)
+    root.setLevel(resolve_level(level))
+    if not root.handlers:
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        root.addHandler(handler)
+        root.propagate = False
+    return root
@@ -0,0 +1,212 @@
+import os
+import re
+import json
+import logging
+
+# Fichiers ContentInfo lus en priorité (sous <package>/ContentInfo, noms insensibles à la casse)
+CONTENT_INFO_NAMES = {"contenthistory.json", "content-info.json"}
+# Fichiers ContentHistory recherchés partout dans le package (noms exacts, par ordre de priorité)
+CONTENT_HISTORY_NAMES = ["ContentHistory.json", "content_info.json", "contenthistory.json"]
+# Entrée "path" d'un layout.json (chaîne JSON complète, échappements compris)
+LAYOUT_PATH_RE = re.compile(r'"path"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+logger = logging.getLogger("simroster.package_walker")
+
+
+class PackageInventory:
+    """
+    Inventaire d'un dossier package MSFS, produit par un seul parcours os.scandir
+    et partagé par toutes les stratégies de détection.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.manifests = []  # manifest.json racine puis sous-dossiers directs
+        self.content_info_files = []  # ContentInfo/** (contenthistory.json, content-info.json)
+        self.content_history_files = []  # ContentHistory.json & co, profondeur <= max_depth
+        self.bgl_files = []  # *.bgl, profondeur <= max_depth
+        self.aircraft_cfgs = []  # SimObjects/Airplanes/*/aircraft.cfg
+        self.from_layout = False  # True si construit depuis layout.json (aucun parcours)
+
+
+def _is_aircraft_cfg(rel_parts):
+    return (
+        len(rel_parts) == 4
+        and rel_parts[0].lower() == "simobjects"
+        and rel_parts[1].lower() == "airplanes"
+        and rel_parts[3].lower() == "aircraft.cfg"
+    )
+
+
+def scan_package(package_path, max_depth=3):
+    """
+    Parcourt un package une seule fois (os.scandir, profondeur limitée) et collecte
+    manifests, ContentInfo/ContentHistory, BGL et aircraft.cfg dans l'ordre d'un
+    os.walk descendant.
+    Le sous-arbre ContentInfo est parcouru sans limite de profondeur.
+    """
+    inventory = PackageInventory(package_path)
+    root_manifest = []
+
+    def walk(folder, depth, in_content_info, rel):
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        subdirs = []
+        names = set()
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir() and not entry.is_symlink()
+            except OSError:
+                continue
+            if is_dir:
+                subdirs.append(entry)
+                continue
+            name = entry.name
+            names.add(name)
+            lower = name.lower()
+            if lower.endswith(".bgl") and depth <= max_depth:
+                inventory.bgl_files.append(entry.path)
+            elif name == "manifest.json" and depth <= 1:
+                if depth == 0:
+                    root_manifest.append(entry.path)
+                else:
+                    inventory.manifests.append(entry.path)
+            if in_content_info and lower in CONTENT_INFO_NAMES:
+                inventory.content_info_files.append(entry.path)
+            if depth == 3 and _is_aircraft_cfg(rel + (name,)):
+                inventory.aircraft_cfgs.append(entry.path)
+        if depth <= max_depth:
+            for candidate in CONTENT_HISTORY_NAMES:
+                if candidate in names:
+                    inventory.content_history_files.append(
+                        os.path.join(folder, candidate)
+                    )
+        for entry in subdirs:
+            child_in_content_info = in_content_info or (
+                depth == 0 and entry.name == "ContentInfo"
+            )
+            if depth < max_depth or child_in_content_info:
+                walk(
+                    entry.path, depth + 1, child_in_content_info, rel + (entry.name,)
+                )
+
+    walk(package_path, 0, False, ())
+    inventory.manifests = root_manifest + inventory.manifests
+    return inventory
+
+
+def iter_layout_paths(layout_path, chunk_size=1 << 16):
+    """
+    Lit la liste "content" d'un layout.json en streaming (par blocs) et génère
+    les chemins relatifs, sans construire le document JSON complet en mémoire.
+    """
+    buf = ""
+    with open(layout_path, "r", encoding="utf-8", errors="ignore") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buf += chunk
+            last_end = 0
+            for match in LAYOUT_PATH_RE.finditer(buf):
+                raw = match.group(1)
+                try:
+                    yield json.loads(f'"{raw}"')
+                except ValueError:
+                    yield raw
+                last_end = match.end()
+            # Garde la fin du bloc : une entrée peut être coupée entre deux lectures
+            buf = buf[last_end:][-4096:]
+
+
+def scan_package_from_layout(package_path, max_depth=3):
+    """
+    Construit l'inventaire d'un package à partir de son layout.json (un seul fichier lu).
+    Retourne None si layout.json est absent, illisible ou vide.
+    """
+    layout_path = os.path.join(package_path, "layout.json")
+    if not os.path.isfile(layout_path):
+        return None
+    inventory = PackageInventory(package_path)
+    inventory.from_layout = True
+    # layout.json ne se liste pas lui-même, ni le manifest.json voisin
+    manifest_path = os.path.join(package_path, "manifest.json")
+    if os.path.isfile(manifest_path):
+        inventory.manifests.append(manifest_path)
+    history_by_dir = {}
+    count = 0
+    try:
+        for rel_path in iter_layout_paths(layout_path):
+            count += 1
+            parts = tuple(p for p in rel_path.replace("\\", "/").split("/") if p)
+            if not parts:
+                continue
+            name = parts[-1]
+            lower = name.lower()
+            depth = len(parts) - 1
+            full_path = os.path.join(package_path, *parts)
+            if lower.endswith(".bgl") and depth <= max_depth:
+                inventory.bgl_files.append(full_path)
+            elif name == "manifest.json" and depth == 1:
+                inventory.manifests.append(full_path)
+            if parts[0] == "ContentInfo" and depth >= 1 and lower in CONTENT_INFO_NAMES:
+                inventory.content_info_files.append(full_path)
+            if name in CONTENT_HISTORY_NAMES and depth <= max_depth:
+                history_by_dir.setdefault(parts[:-1], []).append(name)
+            if _is_aircraft_cfg(parts):
+                # layout.json périmé ou partiel : seuls les cfg présents sur disque
+                if os.path.isfile(full_path):
+                    inventory.aircraft_cfgs.append(full_path)
+                else:
+                    logger.debug("aircraft.cfg listé mais absent : %s", full_path)
+    except OSError as e:
+        logger.debug("layout.json illisible %s: %s", layout_path, e)
+        return None
+    if not count:
+        return None
+    # Même priorité que le parcours disque : par dossier, dans l'ordre de CONTENT_HISTORY_NAMES
+    for rel_dir, names in history_by_dir.items():
+        for candidate in CONTENT_HISTORY_NAMES:
+            if candidate in names:
+                inventory.content_history_files.append(
+                    os.path.join(package_path, *rel_dir, candidate)
+                )
+    return inventory
+
+
+def build_package_inventory(package_path, max_depth=3, use_layout=True):
+    """
+    Inventaire d'un package : layout.json si disponible (mode rapide),
+    sinon parcours disque unique via scan_package.
+    """
+    if use_layout:
+        inventory = scan_package_from_layout(package_path, max_depth=max_depth)
+        if inventory is not None:
+            return inventory
+    return scan_package(package_path, max_depth=max_depth)
+
+
+def list_aircraft_cfgs(addon_path, use_layout=True):
+    """
+    Liste les SimObjects/Airplanes/*/aircraft.cfg d'un package.
+    layout.json en priorité, sinon listage du dossier SimObjects/Airplanes.
+    """
+    if use_layout:
+        inventory = scan_package_from_layout(addon_path)
+        if inventory is not None:
+            return inventory.aircraft_cfgs
+    simobj_base = os.path.join(addon_path, "SimObjects", "Airplanes")
+    if not os.path.isdir(simobj_base):
+        return []
+    cfgs = []
+    for livery_folder in os.listdir(simobj_base):
+        livery_path = os.path.join(simobj_base, livery_folder)
+        if not os.path.isdir(livery_path):
+            continue
+        aircraft_cfg = os.path.join(livery_path, "aircraft.cfg")
+        if os.path.isfile(aircraft_cfg):
+            cfgs.append(aircraft_cfg)
+    return cfgs
@@ -0,0 +1,127 @@
+import os
+import csv
+import logging
+import threading
+
+try:
+    from .scan_cache import file_fingerprint
+except ImportError:
+    from scan_cache import file_fingerprint
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+# Marques de nationalité OACI : prefix, country, hyphen (0 = pas de tiret, ex. N12345, JA8089)
+REGISTRATION_PREFIXES_PATH = os.path.join(BASE_DIR, "data", "registration_prefixes.csv")
+
+logger = logging.getLogger("simroster.registration")
+
+
+def compact_registration(registration):
+    """Registration sans tiret ni espace, en majuscules (ex. "f-gkxs" -> "FGKXS")."""
+    return str(registration or "").strip().upper().replace("-", "").replace(" ", "")
+
+
+class RegistrationNormalizer:
+    """
+    Normalisation des immatriculations par marque de nationalité : les préfixes
+    forment un trie, parcouru une seule fois par registration (plus long préfixe
+    laissant au moins un caractère derrière).
+    FGKXS -> F-GKXS, DAIPX -> D-AIPX, SXDNH -> SX-DNH, N-12345 -> N12345.
+    """
+
+    def __init__(self, rows=()):
+        self.prefixes = {}  # préfixe -> {"prefix", "country", "hyphen"}
+        self._trie = {}
+        for row in rows:
+            self.add(row.get("prefix", ""), row.get("country", ""), row.get("hyphen", "1"))
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            return cls(csv.DictReader(f))
+
+    def add(self, prefix, country, hyphen=True):
+        prefix = compact_registration(prefix)
+        if not prefix:
+            return None
+        mark = {
+            "prefix": prefix,
+            "country": (country or "").strip(),
+            "hyphen": str(hyphen).strip().lower() not in ("0", "false", "no", ""),
+        }
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[None] = mark  # clé None = fin d'un préfixe
+        self.prefixes[prefix] = mark
+        return mark
+
+    def __len__(self):
+        return len(self.prefixes)
+
+    def nationality(self, registration):
+        """Marque de nationalité de la registration, ou None."""
+        reg = compact_registration(registration)
+        node = self._trie
+        mark = None
+        for char in reg[:-1]:
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                mark = node[None]
+        return mark
+
+    def normalize(self, registration):
+        """Registration au format OACI ; inchangée (majuscules) si le préfixe est inconnu."""
+        if not registration:
+            return registration
+        reg = compact_registration(registration)
+        # Correction spéciale Aegean "SXDDNH" => "SX-DNH"
+        if reg.startswith("SXD") and len(reg) == 6:
+            return "SX-" + reg[3:]
+        mark = self.nationality(reg) if reg.isalnum() else None
+        if mark is None:
+            return str(registration).strip().upper()
+        suffix = reg[len(mark["prefix"]) :]
+        return mark["prefix"] + ("-" if mark["hyphen"] else "") + suffix
+
+    def index(self, rows, field="registration"):
+        """Index registration normalisée -> lignes (jointure par clé exacte)."""
+        indexed = {}
+        for row in rows:
+            key = self.normalize(row.get(field))
+            if key:
+                indexed.setdefault(key, []).append(row)
+        return indexed
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def registration_normalizer(path=REGISTRATION_PREFIXES_PATH, refresh=False):
+    """
+    Normaliseur partagé (un par fichier). refresh=True relit le CSV s'il a changé
+    (à appeler une fois en début de scan). Fichier absent : aucun préfixe connu.
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        cached = _loaded.get(path)
+        if cached is not None and not refresh:
+            return cached[1]
+        fingerprint = file_fingerprint(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        try:
+            normalizer = RegistrationNormalizer.from_csv(path)
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            logger.warning("Préfixes d'immatriculation indisponibles : %s (%s)", path, e)
+            normalizer = RegistrationNormalizer()
+        _loaded[path] = (fingerprint, normalizer)
+        return normalizer
+
+
+def normalize_registration(registration):
+    """Raccourci : normalisation avec la table data/registration_prefixes.csv."""
+    return registration_normalizer().normalize(registration)
@@ -0,0 +1,137 @@
+import os
+import json
+import logging
+import threading
+
+logger = logging.getLogger("simroster.scan_cache")
+
+
+def file_fingerprint(path):
+    """
+    Empreinte "légère" d'un fichier ou dossier : [mtime_ns, taille] ou None s'il est absent.
+    Un seul appel os.stat, aucun contenu lu.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    size = 0 if os.path.isdir(path) else st.st_size
+    return [st.st_mtime_ns, size]
+
+
+def tree_fingerprint(path):
+    """
+    Empreinte d'une arborescence : [chemin relatif, mtime_ns, taille] de chaque dossier
+    et fichier, triés ; None si le dossier est absent. Un fichier réécrit sur place
+    (mtime du dossier inchangé) change donc l'empreinte.
+    """
+    if not os.path.isdir(path):
+        return None
+    entries = []
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        try:
+            with os.scandir(os.path.join(path, relative)) as it:
+                for entry in it:
+                    name = os.path.join(relative, entry.name)
+                    try:
+                        is_dir = entry.is_dir()
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append([name, st.st_mtime_ns, 0 if is_dir else st.st_size])
+                    if is_dir:
+                        pending.append(name)
+        except OSError:
+            continue
+    entries.sort()
+    return entries
+
+
+def package_fingerprint(package_path):
+    """
+    Empreinte d'un dossier package MSFS : manifest.json, layout.json et le contenu de
+    ContentInfo (sous-dossiers par package et leurs ContentHistory.json).
+    Si aucun de ces fichiers ne bouge, le package est considéré comme inchangé.
+    """
+    return [
+        file_fingerprint(os.path.join(package_path, "manifest.json")),
+        file_fingerprint(os.path.join(package_path, "layout.json")),
+        tree_fingerprint(os.path.join(package_path, "ContentInfo")),
+    ]
+
+
+class ScanCache:
+    """
+    Cache persistant (JSON) des résultats de scan, clé -> {fingerprint, value}.
+    Le "context" invalide tout le cache quand une donnée de référence change
+    (airports.csv, mapping custom, version du scanner...).
+    get/put/prune sont thread-safe (détecteurs appelés depuis un pool de threads).
+    """
+
+    def __init__(self, path, context=None):
+        self.path = path
+        self.context = context
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        self.entries = {}
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning("Cache illisible, ignoré : %s (%s)", self.path, e)
+            return
+        if not isinstance(data, dict) or data.get("context") != self.context:
+            logger.info("Contexte modifié, cache réinitialisé : %s", self.path)
+            self._dirty = True
+            return
+        self.entries = data.get("entries", {})
+
+    def get(self, key, fingerprint):
+        """Retourne (True, value) si la clé est en cache avec la même empreinte."""
+        with self._lock:
+            cached = self.entries.get(key)
+            if cached is not None and cached.get("fingerprint") == fingerprint:
+                self.hits += 1
+                return True, cached.get("value")
+            self.misses += 1
+            return False, None
+
+    def put(self, key, fingerprint, value):
+        with self._lock:
+            self.entries[key] = {"fingerprint": fingerprint, "value": value}
+            self._dirty = True
+
+    def prune(self, seen_keys):
+        """Supprime les entrées dont la clé n'a pas été revue pendant le scan."""
+        seen_keys = set(seen_keys)
+        with self._lock:
+            removed = [k for k in self.entries if k not in seen_keys]
+            for k in removed:
+                del self.entries[k]
+            if removed:
+                self._dirty = True
+        return len(removed)
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"context": self.context, "entries": self.entries},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
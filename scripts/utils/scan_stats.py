@@ -0,0 +1,101 @@
+import os
+import json
+import time
+import threading
+
+
+class _Probe:
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.hit = False
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stats.record(self.name, time.perf_counter() - self._start, self.hit)
+        return False
+
+
+class ScanStats:
+    """
+    Compteurs par stratégie de détection : appels, succès (hits) et temps cumulé.
+    Thread-safe (scan parallèle) ; for_root() donne une vue qui alimente aussi
+    les compteurs du dossier racine scanné (Community, OneStore, Streamed...).
+    """
+
+    def __init__(self, root=None, parent=None):
+        self.root = root
+        self.parent = parent
+        self._lock = threading.Lock() if parent is None else parent._lock
+        self.strategies = {}
+        self.roots = {}
+        self.started = time.perf_counter()
+
+    def for_root(self, root):
+        if self.parent is not None:
+            return self.parent.for_root(root)
+        with self._lock:
+            if root not in self.roots:
+                self.roots[root] = ScanStats(root=root, parent=self)
+            return self.roots[root]
+
+    def measure(self, name):
+        """Usage : with stats.measure("bgl") as probe: ... ; probe.hit = True"""
+        return _Probe(self, name)
+
+    def record(self, name, seconds, hit):
+        with self._lock:
+            self._record(name, seconds, hit)
+            if self.parent is not None:
+                self.parent._record(name, seconds, hit)
+
+    def _record(self, name, seconds, hit):
+        counters = self.strategies.setdefault(
+            name, {"calls": 0, "hits": 0, "seconds": 0.0}
+        )
+        counters["calls"] += 1
+        if hit:
+            counters["hits"] += 1
+        counters["seconds"] += seconds
+
+    def to_dict(self):
+        def rounded(strategies):
+            return {
+                name: {
+                    "calls": c["calls"],
+                    "hits": c["hits"],
+                    "seconds": round(c["seconds"], 6),
+                }
+                for name, c in strategies.items()
+            }
+
+        with self._lock:
+            return {
+                "duration_seconds": round(time.perf_counter() - self.started, 6),
+                "strategies": rounded(self.strategies),
+                "roots": {
+                    root: rounded(view.strategies) for root, view in self.roots.items()
+                },
+            }
+
+    def summary_lines(self):
+        """Une ligne lisible par stratégie, triée par temps décroissant."""
+        data = self.to_dict()["strategies"]
+        lines = []
+        for name, c in sorted(data.items(), key=lambda kv: -kv[1]["seconds"]):
+            lines.append(
+                f"{name}: {c['calls']} appels, {c['hits']} hits, {c['seconds']:.3f}s"
+            )
+        return lines
+
+    def save(self, path, extra=None):
+        report = self.to_dict()
+        if extra:
+            report.update(extra)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
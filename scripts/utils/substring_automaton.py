@@ -0,0 +1,81 @@
+from collections import deque
+
+
+class SubstringAutomaton:
+    """
+    Automate d'Aho-Corasick : indique en un seul passage sur le texte lesquels
+    des motifs y apparaissent comme sous-chaîne (équivalent de "motif in texte"
+    testé pour chaque motif). Un motif vide est toujours présent.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [str(p) for p in patterns]
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._always = []
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                self._always.append(index)
+                continue
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][char] = child
+                node = child
+            self._out[node].append(index)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def iter_matches(self, text):
+        """Génère l'index de chaque motif trouvé dans text (doublons possibles)."""
+        yield from self._always
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                yield from out[node]
+
+    def iter_match_ends(self, text):
+        """
+        Génère (position du dernier caractère, index) pour chaque motif trouvé
+        dans text ; un motif vide est rapporté en position -1.
+        """
+        for index in self._always:
+            yield -1, index
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in out[node]:
+                yield position, index
+
+    def matched(self, text):
+        """Ensemble des index des motifs présents dans text."""
+        return set(self.iter_matches(text))
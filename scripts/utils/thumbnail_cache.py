@@ -0,0 +1,212 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image  # pip install Pillow (optionnel : sinon copie sans redimensionnement)
+except ImportError:
+    Image = None
+
+try:
+    from .scan_cache import file_fingerprint
+    from .registration import normalize_registration
+except ImportError:
+    from scan_cache import file_fingerprint
+    from registration import normalize_registration
+
+# BASE_DIR = racine du projet
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+# Miniatures générées : <sha1 du thumbnail source>_<taille>.jpg + index.json (registration -> fichier)
+THUMBNAILS_DIR = os.path.join(BASE_DIR, "results", "thumbnails")
+THUMBNAIL_INDEX_NAME = "index.json"
+# Taille de l'image avion de la carte de vol (labelAircraftImage, flight_card.py)
+CARD_SIZE = (711, 451)
+# Fichiers cherchés dans le dossier texture.<texture> de chaque livrée, par ordre de préférence
+THUMBNAIL_NAMES = ("thumbnail.jpg", "thumbnail_small.jpg")
+DEFAULT_THUMBNAIL_WORKERS = min(4, os.cpu_count() or 1)
+
+logger = logging.getLogger("simroster.thumbnail_cache")
+
+
+def find_livery_thumbnail(livery_path, texture=""):
+    """thumbnail.jpg (ou thumbnail_small.jpg) de la livrée, ou None."""
+    texture_dir = os.path.join(
+        livery_path, f"texture.{texture}" if texture else "texture"
+    )
+    for name in THUMBNAIL_NAMES:
+        candidate = os.path.join(texture_dir, name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _content_key(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def render_thumbnail(job):
+    """
+    (source, cible, taille) -> cible ou None. Exécutée dans un thread du pool :
+    Pillow libère le GIL pendant le décodage et le redimensionnement.
+    """
+    source, target, size = job
+    tmp_path = target + ".tmp"
+    try:
+        if Image is None:
+            shutil.copyfile(source, tmp_path)
+        else:
+            with Image.open(source) as img:
+                img = img.convert("RGB")
+                img.thumbnail(tuple(size))
+                img.save(tmp_path, "JPEG", quality=85, optimize=True)
+        os.replace(tmp_path, target)
+        return target
+    except Exception as e:
+        logger.warning("Miniature non générée : %s (%s)", source, e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+
+
+class ThumbnailCache:
+    """
+    Cache des images avion au format carte de vol, adressé par contenu :
+    chaque miniature est nommée d'après le sha1 du thumbnail source (deux livrées
+    identiques partagent le fichier) ; index.json associe la registration normalisée
+    au fichier et à l'empreinte (mtime, taille) de la source.
+    """
+
+    def __init__(self, directory=THUMBNAILS_DIR, size=CARD_SIZE):
+        self.directory = directory
+        self.size = tuple(size)
+        self.index_path = os.path.join(directory, THUMBNAIL_INDEX_NAME)
+        self.entries = {}
+        self.fingerprint = None
+        self._lock = threading.Lock()
+        self.reload_if_changed()
+
+    def reload_if_changed(self):
+        fingerprint = file_fingerprint(self.index_path)
+        with self._lock:
+            if fingerprint == self.fingerprint:
+                return
+            entries = {}
+            if fingerprint is not None:
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if data.get("size") == list(self.size):
+                        entries = data.get("entries", {})
+                except Exception as e:
+                    logger.warning("Index des miniatures illisible, ignoré : %s", e)
+            self.entries = entries
+            self.fingerprint = fingerprint
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"size": list(self.size), "entries": self.entries},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.index_path)
+        self.fingerprint = file_fingerprint(self.index_path)
+
+    def file_name(self, content_key):
+        """Nom de la miniature : sha1 de la source + taille (copie brute sans Pillow)."""
+        if Image is None:
+            return f"{content_key}.jpg"
+        return f"{content_key}_{self.size[0]}x{self.size[1]}.jpg"
+
+    def path_for(self, registration):
+        """Chemin de la miniature de cette registration, ou None (index relu s'il a changé)."""
+        self.reload_if_changed()
+        entry = self.entries.get(normalize_registration(registration) or "")
+        if not entry:
+            return None
+        path = os.path.join(self.directory, entry["file"])
+        return path if os.path.exists(path) else None
+
+    def update(self, aircraft, workers=DEFAULT_THUMBNAIL_WORKERS):
+        """
+        Met le cache à jour pour les livrées scannées ({registration, path, texture}) :
+        les sources inchangées sont ignorées, les autres redimensionnées dans un pool
+        de threads (pas de processus : sous Windows, chaque processus réimporterait
+        le __main__ de la GUI et PyQt5). Les registrations disparues et les fichiers orphelins sont retirés.
+        Retourne le nombre de miniatures générées.
+        """
+        self.reload_if_changed()
+        os.makedirs(self.directory, exist_ok=True)
+        entries = {}
+        jobs = {}  # fichier cible -> job (une seule génération par contenu)
+        for ac in aircraft:
+            key = normalize_registration(ac.get("registration")) or ""
+            if not key or key in entries:
+                continue
+            source = find_livery_thumbnail(ac.get("path") or "", ac.get("texture") or "")
+            if source is None:
+                continue
+            fingerprint = file_fingerprint(source)
+            previous = self.entries.get(key)
+            if (
+                previous
+                and previous.get("source") == source
+                and previous.get("fingerprint") == fingerprint
+                and previous.get("file") == self.file_name(previous.get("sha1", ""))
+                and os.path.exists(os.path.join(self.directory, previous["file"]))
+            ):
+                entries[key] = previous
+                continue
+            try:
+                sha1 = _content_key(source)
+            except OSError:
+                continue
+            name = self.file_name(sha1)
+            entries[key] = {
+                "source": source,
+                "fingerprint": fingerprint,
+                "sha1": sha1,
+                "file": name,
+            }
+            target = os.path.join(self.directory, name)
+            if not os.path.exists(target):
+                jobs[target] = (source, target, self.size)
+
+        if Image is None and jobs:
+            logger.info("Pillow absent : miniatures copiées sans redimensionnement")
+        if workers and workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                done = list(pool.map(render_thumbnail, jobs.values()))
+        else:
+            done = [render_thumbnail(job) for job in jobs.values()]
+        failed = {job[1] for job, target in zip(jobs.values(), done) if target is None}
+        entries = {
+            key: entry
+            for key, entry in entries.items()
+            if os.path.join(self.directory, entry["file"]) not in failed
+        }
+
+        # Fichiers qui ne sont plus référencés
+        used = {entry["file"] for entry in entries.values()}
+        for name in os.listdir(self.directory):
+            if name.endswith(".jpg") and name not in used:
+                os.remove(os.path.join(self.directory, name))
+        with self._lock:
+            self.entries = entries
+            self.save()
+        generated = len(jobs) - len(failed)
+        logger.info(
+            "Miniatures : %d livrée(s) avec image, %d générée(s)", len(entries), generated
+        )
+        return generated